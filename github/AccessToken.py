@@ -40,10 +40,13 @@
 from __future__ import annotations
 
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from github.GithubObject import Attribute, NonCompletableGithubObject, NotSet
 
+if TYPE_CHECKING:
+    from github.Requester import Requester
+
 
 class AccessToken(NonCompletableGithubObject):
     """
@@ -52,6 +55,17 @@ class AccessToken(NonCompletableGithubObject):
 
     _created: datetime
 
+    def __init__(
+        self,
+        requester: Requester,
+        headers: dict[str, str | int],
+        attributes: Any,
+        completed: bool,
+    ) -> None:
+        # expiry is relative to the time the token has been received
+        self._created = datetime.now(timezone.utc)
+        super().__init__(requester, headers, attributes, completed)
+
     def _initAttributes(self) -> None:
         self._token: Attribute[str] = NotSet
         self._type: Attribute[str] = NotSet
@@ -142,7 +156,6 @@ class AccessToken(NonCompletableGithubObject):
         return None
 
     def _useAttributes(self, attributes: dict[str, Any]) -> None:
-        self._created = datetime.now(timezone.utc)
         if "access_token" in attributes:  # pragma no branch
             self._token = self._makeStringAttribute(attributes["access_token"])
         if "token_type" in attributes:  # pragma no branch
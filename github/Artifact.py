@@ -43,9 +43,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator
 
 import github.WorkflowRun
+from github import Consts
 from github.GithubObject import Attribute, NonCompletableGithubObject, NotSet
 
 if TYPE_CHECKING:
@@ -129,6 +130,28 @@ class Artifact(NonCompletableGithubObject):
         status, headers, data = self._requester.requestBlob("DELETE", self.url)
         return status == 204
 
+    def download_to(
+        self, path_or_fileobj: str | BinaryIO, chunk_size: int = Consts.DEFAULT_CHUNK_SIZE, resume: bool = False
+    ) -> str:
+        """
+        :calls: `GET /repos/{owner}/{repo}/actions/artifacts/{artifact_id}/{archive_format} <https://docs.github.com/en/rest/actions/artifacts#download-an-artifact>`_
+        :param path_or_fileobj: path of the file to write, or binary file object
+        :param chunk_size: size of the chunks in bytes the archive is downloaded in
+        :param resume: complete a file at the given path partially downloaded with resume before, unless the
+            content has changed since
+        :rtype: string, the SHA-256 hex digest of the archive
+        """
+        return self._requester.getFile(self.archive_download_url, path_or_fileobj, None, chunk_size, resume)
+
+    def download_stream(self, chunk_size: int = Consts.DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        :calls: `GET /repos/{owner}/{repo}/actions/artifacts/{artifact_id}/{archive_format} <https://docs.github.com/en/rest/actions/artifacts#download-an-artifact>`_
+        :param chunk_size: size of the chunks in bytes the archive is downloaded in
+        :rtype: iterator of bytes
+        """
+        status, headers, chunks = self._requester.getStream(self.archive_download_url, None, chunk_size)
+        return chunks
+
     def _useAttributes(self, attributes: dict[str, Any]) -> None:
         if "archive_download_url" in attributes:  # pragma no branch
             self._archive_download_url = self._makeStringAttribute(attributes["archive_download_url"])
@@ -0,0 +1,298 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from __future__ import annotations
+
+import urllib.parse
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import urllib3
+from urllib3.util import Retry
+
+import github.Auth
+import github.Cache
+import github.NamedUser
+import github.Organization
+import github.Repository
+import github.RequestScheduler
+from github import Consts
+from github.AsyncPaginatedList import AsyncPaginatedList
+from github.AsyncRequester import AsyncRequester
+from github.GithubObject import GithubObject, NotSet, Opt
+from github.RateLimit import RateLimit
+from github.Requester import Requester
+
+if TYPE_CHECKING:
+    import aiohttp
+
+    from github.NamedUser import NamedUser
+    from github.Organization import Organization
+    from github.Repository import Repository
+
+TGithubObject = TypeVar("TGithubObject", bound=GithubObject)
+
+
+class AsyncGithub:
+    """
+    This is the asyncio counterpart of :class:`github.MainClass.Github`.
+
+    All ``get_`` methods are coroutines or return a :class:`github.AsyncPaginatedList.AsyncPaginatedList`, so many
+    requests can be in flight on a single event loop::
+
+        async with github.AsyncGithub(auth=github.Auth.Token("access_token")) as gh:
+            repos = await asyncio.gather(*[gh.get_repo(name) for name in names])
+
+    Returned objects are the same :class:`github.GithubObject.GithubObject` classes as those returned by
+    :class:`github.MainClass.Github`. Their methods and lazy completion are synchronous and block the calling thread.
+    Other endpoints can be called through :attr:`requester` and :meth:`paginate`.
+
+    This requires the optional ``aiohttp`` dependency: ``pip install PyGithub[async]``.
+
+    """
+
+    __requester: AsyncRequester
+
+    # keep arguments in-sync with github.MainClass.Github
+    def __init__(
+        self,
+        auth: github.Auth.Auth | None = None,
+        base_url: str = Consts.DEFAULT_BASE_URL,
+        timeout: int = Consts.DEFAULT_TIMEOUT,
+        user_agent: str = Consts.DEFAULT_USER_AGENT,
+        per_page: int = Consts.DEFAULT_PER_PAGE,
+        verify: bool | str = True,
+        retry: int | Retry | None = None,
+        pool_size: int | None = None,
+        seconds_between_requests: float | None = Consts.DEFAULT_SECONDS_BETWEEN_REQUESTS,
+        seconds_between_writes: float | None = Consts.DEFAULT_SECONDS_BETWEEN_WRITES,
+        cache: github.Cache.Cache | None = None,
+        priority: str = github.RequestScheduler.INTERACTIVE,
+        lazy_attributes: bool = False,
+        identity_map: bool = False,
+        coalesce_requests: bool = False,
+        session: aiohttp.ClientSession | None = None,
+    ) -> None:
+        """
+        :param auth: authentication method
+        :param base_url: string
+        :param timeout: integer
+        :param user_agent: string
+        :param per_page: int
+        :param verify: boolean or string
+        :param retry: int or urllib3.util.retry.Retry object, only used by requests of returned objects
+        :param pool_size: int, maximum number of concurrent connections, defaults to 100
+        :param seconds_between_requests: float
+        :param seconds_between_writes: float
+        :param cache: github.Cache.Cache to revalidate GET responses with conditional requests
+        :param priority: string, github.RequestScheduler.INTERACTIVE or github.RequestScheduler.BATCH, batch requests
+                         are spread over the rate limit window and leave some rate limit to interactive requests
+                         and wait for the reset of an exhausted rate limit, interactive requests raise
+                         RateLimitExceededException instead
+        :param lazy_attributes: bool, decode attributes of returned objects on first access rather than on creation
+        :param identity_map: bool, share nested objects with the same url, e.g. the users of a list of issues, so
+                             that they are created and completed only once
+        :param coalesce_requests: bool, let concurrent identical GET requests of multiple threads share one response
+        :param session: aiohttp.ClientSession to use instead of creating one, it is not closed by :meth:`close`
+        """
+        assert auth is None or isinstance(auth, github.Auth.Auth), auth
+        assert isinstance(base_url, str), base_url
+        assert isinstance(timeout, int), timeout
+        assert user_agent is None or isinstance(user_agent, str), user_agent
+        assert isinstance(per_page, int), per_page
+        assert isinstance(verify, (bool, str)), verify
+        assert retry is None or isinstance(retry, int) or isinstance(retry, urllib3.util.Retry), retry
+        assert pool_size is None or isinstance(pool_size, int), pool_size
+        assert seconds_between_requests is None or seconds_between_requests >= 0
+        assert seconds_between_writes is None or seconds_between_writes >= 0
+        assert cache is None or isinstance(cache, github.Cache.Cache), cache
+        assert priority in github.RequestScheduler.PRIORITIES, priority
+        assert isinstance(lazy_attributes, bool), lazy_attributes
+        assert isinstance(identity_map, bool), identity_map
+        assert isinstance(coalesce_requests, bool), coalesce_requests
+
+        requester = Requester(
+            auth,
+            base_url,
+            timeout,
+            user_agent,
+            per_page,
+            verify,
+            retry,
+            pool_size,
+            seconds_between_requests,
+            seconds_between_writes,
+            cache,
+            priority,
+            lazy_attributes,
+            identity_map,
+            coalesce_requests,
+        )
+        self.__requester = AsyncRequester(requester, session)
+
+    async def close(self) -> None:
+        """
+        Close connections to the server. Alternatively, use the AsyncGithub object as an async context manager:
+
+        .. code-block:: python
+
+          async with github.AsyncGithub(...) as gh:
+            # do something
+        """
+        await self.__requester.close()
+        self.__requester.requester.close()
+
+    async def __aenter__(self) -> AsyncGithub:
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.close()
+
+    @property
+    def requester(self) -> AsyncRequester:
+        """
+        The requester to await arbitrary requests, e.g. ``await gh.requester.requestJsonAndCheck("GET", url)``.
+        """
+        return self.__requester
+
+    @property
+    def rate_limiting(self) -> tuple[int, int]:
+        """
+        First value is requests remaining, second value is request limit, as of the last response.
+        """
+        return self.__requester.requester.rate_limiting
+
+    @property
+    def rate_limiting_resettime(self) -> int:
+        """
+        Unix timestamp indicating when rate limiting will reset, as of the last response.
+        """
+        return self.__requester.requester.rate_limiting_resettime
+
+    async def get_rate_limit(self) -> RateLimit:
+        """
+        :calls: `GET /rate_limit <https://docs.github.com/en/rest/reference/rate-limit>`_
+        """
+        headers, data = await self.__requester.requestJsonAndCheck("GET", "/rate_limit")
+        return RateLimit(self.__requester.requester, headers, data["resources"], True)
+
+    async def get_user(self, login: str) -> NamedUser:
+        """
+        :calls: `GET /users/{user} <https://docs.github.com/en/rest/reference/users>`_
+        """
+        assert isinstance(login, str), login
+        login = urllib.parse.quote(login)
+        headers, data = await self.__requester.requestJsonAndCheck("GET", f"/users/{login}")
+        return github.NamedUser.NamedUser(self.__requester.requester, headers, data, completed=True)
+
+    def get_users(self, since: Opt[int] = NotSet) -> AsyncPaginatedList[NamedUser]:
+        """
+        :calls: `GET /users <https://docs.github.com/en/rest/reference/users>`_
+        """
+        assert since is NotSet or isinstance(since, int), since
+        url_parameters = dict()
+        if since is not NotSet:
+            url_parameters["since"] = since
+        return self.paginate(github.NamedUser.NamedUser, "/users", url_parameters)
+
+    async def get_organization(self, login: str) -> Organization:
+        """
+        :calls: `GET /orgs/{org} <https://docs.github.com/en/rest/reference/orgs>`_
+        """
+        assert isinstance(login, str), login
+        login = urllib.parse.quote(login)
+        headers, data = await self.__requester.requestJsonAndCheck("GET", f"/orgs/{login}")
+        return github.Organization.Organization(self.__requester.requester, headers, data, completed=True)
+
+    async def get_repo(self, full_name_or_id: int | str) -> Repository:
+        """
+        :calls: `GET /repos/{owner}/{repo} <https://docs.github.com/en/rest/reference/repos>`_ or `GET /repositories/{id} <https://docs.github.com/en/rest/reference/repos>`_
+        """
+        assert isinstance(full_name_or_id, (str, int)), full_name_or_id
+        url_base = "/repositories/" if isinstance(full_name_or_id, int) else "/repos/"
+        url = f"{url_base}{full_name_or_id}"
+        headers, data = await self.__requester.requestJsonAndCheck("GET", url)
+        return github.Repository.Repository(self.__requester.requester, headers, data, completed=True)
+
+    def get_repos(self, since: Opt[int] = NotSet) -> AsyncPaginatedList[Repository]:
+        """
+        :calls: `GET /repositories <https://docs.github.com/en/rest/reference/repos#list-public-repositories>`_
+        """
+        assert since is NotSet or isinstance(since, int), since
+        url_parameters = dict()
+        if since is not NotSet:
+            url_parameters["since"] = since
+        return self.paginate(github.Repository.Repository, "/repositories", url_parameters)
+
+    def get_organization_repos(self, login: str, type: Opt[str] = NotSet) -> AsyncPaginatedList[Repository]:
+        """
+        :calls: `GET /orgs/{org}/repos <https://docs.github.com/en/rest/reference/repos>`_
+        """
+        assert isinstance(login, str), login
+        assert type is NotSet or isinstance(type, str), type
+        url_parameters = dict()
+        if type is not NotSet:
+            url_parameters["type"] = type
+        login = urllib.parse.quote(login)
+        return self.paginate(github.Repository.Repository, f"/orgs/{login}/repos", url_parameters)
+
+    def search_repositories(self, query: str, **qualifiers: Any) -> AsyncPaginatedList[Repository]:
+        """
+        :calls: `GET /search/repositories <https://docs.github.com/en/rest/reference/search>`_
+        :param query: string
+        :param qualifiers: keyword dict query qualifiers
+        """
+        assert isinstance(query, str), query
+        query_chunks = [query] if query else []
+        for qualifier, value in qualifiers.items():
+            query_chunks.append(f"{qualifier}:{value}")
+        q = " ".join(query_chunks)
+        assert q, "need at least one qualifier"
+        return self.paginate(github.Repository.Repository, "/search/repositories", {"q": q})
+
+    def paginate(
+        self,
+        klass: type[TGithubObject],
+        url: str,
+        parameters: dict[str, Any] | None = None,
+        list_item: str = "items",
+    ) -> AsyncPaginatedList[TGithubObject]:
+        """
+        Iterates any paginated endpoint asynchronously, e.g.
+        ``gh.paginate(github.Issue.Issue, "/repos/PyGithub/PyGithub/issues", {"state": "all"})``.
+
+        :param klass: the class of the listed objects
+        :param url: the url of the first page
+        :param parameters: dict of url parameters
+        :param list_item: the key holding the elements when pages are dicts rather than lists
+        """
+        return AsyncPaginatedList(klass, self.__requester, url, parameters, list_item=list_item)
+
+    def create_from_raw_data(
+        self, klass: type[TGithubObject], raw_data: dict[str, Any], headers: dict[str, str | int] | None = None
+    ) -> TGithubObject:
+        """
+        Creates an object from raw_data previously obtained by :attr:`GithubObject.raw_data`, and optionally headers
+        previously obtained by :attr:`GithubObject.raw_headers`.
+        """
+        if headers is None:
+            headers = {}
+
+        return klass(self.__requester.requester, headers, raw_data, completed=True)
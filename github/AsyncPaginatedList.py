@@ -0,0 +1,122 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from typing import Any, AsyncIterator, Callable, Dict, Generic, List, Optional, Type, TypeVar
+
+from github.AsyncRequester import AsyncRequester
+from github.GithubObject import GithubObject
+from github.PaginatedList import PaginatedList
+
+T = TypeVar("T", bound=GithubObject)
+
+
+class AsyncPaginatedList(Generic[T]):
+    """
+    This class is the asyncio counterpart of :class:`github.PaginatedList.PaginatedList`.
+
+    Pages are fetched without blocking the event loop, enumerate instances of this class with ``async for``::
+
+        async for repo in gh.get_repos():
+            print(repo.name)
+
+    Elements of a page are yielded before the next page is requested. Pages can also be accessed explicitly::
+
+        repos = await gh.get_repos().get_page(3)
+    """
+
+    def __init__(
+        self,
+        contentClass: Type[T],
+        requester: AsyncRequester,
+        firstUrl: str,
+        firstParams: Any,
+        headers: Optional[Dict[str, str]] = None,
+        list_item: str = "items",
+        total_count_item: str = "total_count",
+        attributesTransformer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ):
+        self.__requester = requester
+        self.__contentClass = contentClass
+        self.__firstUrl = firstUrl
+        self.__firstParams = firstParams or {}
+        self.__headers = headers
+        self.__list_item = list_item
+        self.__total_count_item = total_count_item
+        self.__attributesTransformer = attributesTransformer
+        self.__totalCount: Optional[int] = None
+
+    @property
+    def totalCount(self) -> Optional[int]:
+        """
+        The total count reported by search endpoints once the first page has been fetched, None otherwise.
+        """
+        return self.__totalCount
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        return self.__iterate()
+
+    async def __iterate(self) -> AsyncIterator[T]:
+        nextUrl: Optional[str] = self.__firstUrl
+        firstParams = dict(self.__firstParams)
+        if self.__requester.per_page != 30:
+            firstParams["per_page"] = self.__requester.per_page
+        nextParams: Optional[Dict[str, Any]] = firstParams
+
+        while nextUrl is not None:
+            headers, data = await self.__requester.requestJsonAndCheck(
+                "GET", nextUrl, parameters=nextParams, headers=self.__headers
+            )
+            data = data if data else []
+
+            nextUrl = None
+            if len(data) > 0:
+                nextUrl = PaginatedList._parseLinkHeader(headers).get("next")
+            # the next url carries all parameters
+            nextParams = None
+
+            for element in self.__getPage(data, headers):
+                yield element
+
+    async def get_page(self, page: int) -> List[T]:
+        params = dict(self.__firstParams)
+        if page != 0:
+            params["page"] = page + 1
+        if self.__requester.per_page != 30:
+            params["per_page"] = self.__requester.per_page
+        headers, data = await self.__requester.requestJsonAndCheck(
+            "GET", self.__firstUrl, parameters=params, headers=self.__headers
+        )
+        return self.__getPage(data, headers)
+
+    def __getPage(self, data: Any, headers: Dict[str, Any]) -> List[T]:
+        if self.__list_item in data:
+            self.__totalCount = data.get(self.__total_count_item)
+            data = data[self.__list_item]
+        return [
+            self.__contentClass(self.__requester.requester, headers, self.__transform(element), completed=False)
+            for element in data
+            if element is not None
+        ]
+
+    def __transform(self, element: Dict[str, Any]) -> Dict[str, Any]:
+        if self.__attributesTransformer is None:
+            return element
+        return self.__attributesTransformer(element)
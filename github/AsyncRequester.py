@@ -0,0 +1,262 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import asyncio
+import json
+import logging
+import ssl
+import urllib.parse
+from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, Union
+
+import github.Consts as Consts
+from github.Auth import AppAuth, AppAuthToken, Login, NetrcAuth, Token, TokenPool
+from github.Requester import Requester
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+class AsyncRequester:
+    """
+    Asyncio counterpart of :class:`github.Requester.Requester`.
+
+    Requests are sent through an `aiohttp <https://docs.aiohttp.org/>`_ client session, so a single event loop can
+    keep many requests in flight without a thread per request. Configuration (authentication, base url, timeout,
+    user agent, throttling) is taken from the wrapped synchronous :class:`github.Requester.Requester`, which is also
+    handed to all :class:`github.GithubObject.GithubObject` instances created from responses. Lazy completion and
+    methods of those objects therefore keep blocking the calling thread.
+
+    Authentication, which may fetch an access token, and the response cache, which may read and write files, are
+    synchronous. Unless the requester has no cache and only authentications that never request tokens (tokens,
+    logins and app JWTs), they are called in the default executor of the event loop so that they do not block it.
+
+    The ``retry`` setting of the wrapped requester is not applied to requests sent through this class.
+
+    This requires the optional ``aiohttp`` dependency: ``pip install PyGithub[async]``.
+
+    """
+
+    def __init__(self, requester: Requester, session: Optional["aiohttp.ClientSession"] = None):
+        assert isinstance(requester, Requester), requester
+        self.__requester = requester
+        self.__session = session
+        self.__owns_session = session is None
+
+        kwargs = requester.kwargs
+        self.__timeout = kwargs["timeout"]
+        self.__verify = kwargs["verify"]
+        self.__pool_size = kwargs["pool_size"]
+
+        o = urllib.parse.urlparse(requester.base_url)
+        port = f":{o.port}" if o.port else ""
+        self.__origin = f"{o.scheme}://{o.hostname}{port}"
+
+    @property
+    def requester(self) -> Requester:
+        """
+        The synchronous requester providing configuration and handed to created objects.
+        """
+        return self.__requester
+
+    @property
+    def per_page(self) -> int:
+        return self.__requester.per_page
+
+    async def close(self) -> None:
+        """
+        Close the underlying client session, unless it has been provided by the caller.
+        """
+        if self.__session is not None and self.__owns_session:
+            await self.__session.close()
+            self.__session = None
+
+    def __getSession(self) -> "aiohttp.ClientSession":
+        if self.__session is None:
+            try:
+                import aiohttp
+            except ImportError as e:  # pragma no cover (aiohttp is installed for tests)
+                raise ImportError(
+                    "The asyncio client requires the optional dependency aiohttp: pip install PyGithub[async]"
+                ) from e
+
+            ssl_context: Any = None
+            if self.__verify is False:
+                ssl_context = False
+            elif isinstance(self.__verify, str):
+                ssl_context = ssl.create_default_context(cafile=self.__verify)
+
+            self.__session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=self.__pool_size or 100, ssl=ssl_context),
+                timeout=aiohttp.ClientTimeout(total=self.__timeout),
+            )
+        return self.__session
+
+    async def requestJsonAndCheck(
+        self,
+        verb: str,
+        url: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        input: Optional[Any] = None,
+    ) -> Tuple[Dict[str, Any], Any]:
+        return self.__requester._check(*await self.__requestJson(verb, url, parameters, headers, input))
+
+    async def requestJson(
+        self,
+        verb: str,
+        url: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        input: Optional[Any] = None,
+    ) -> Tuple[int, Dict[str, Any], str]:
+        status, responseHeaders, output = await self.__requestJson(verb, url, parameters, headers, input)
+        return status, responseHeaders, output.decode("utf-8") if isinstance(output, bytes) else output
+
+    async def __requestJson(
+        self,
+        verb: str,
+        url: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        input: Optional[Any] = None,
+    ) -> Tuple[int, Dict[str, Any], Union[str, bytes]]:
+        def encode(input: Any) -> Tuple[str, str]:
+            return "application/json", json.dumps(input)
+
+        origin = self.__origin
+        if not url.startswith("/"):
+            o = urllib.parse.urlparse(url)
+            origin = f"{o.scheme}://{o.netloc}"
+
+        def prepare(headers: Optional[Dict[str, Any]]) -> Tuple[str, Dict[str, str], Any, Optional[str], Any, bool]:
+            path, requestHeaders, encoded_input = self.__requester._prepareRequest(
+                verb, url, parameters, headers, input, encode
+            )
+            cacheKey = self.__requester._cacheKey(verb, path, requestHeaders) if origin == self.__origin else None
+            cached = self.__requester._addCacheValidators(cacheKey, requestHeaders)
+            cache = self.__requester.cache
+            fresh = cached is not None and cache is not None and cache.is_fresh(cached)
+            return path, requestHeaders, encoded_input, cacheKey, cached, fresh
+
+        def process(
+            requestHeaders: Dict[str, str],
+            cacheKey: Optional[str],
+            cached: Any,
+            status: int,
+            responseHeaders: Dict[str, Any],
+            output: Union[str, bytes],
+        ) -> Tuple[int, Dict[str, Any], Union[str, bytes], bool]:
+            status, responseHeaders, output = self.__requester._useCache(
+                cacheKey, cached, status, responseHeaders, output
+            )
+            self.__requester._processResponseHeaders(responseHeaders)
+            failover = self.__requester._failover(requestHeaders, status, responseHeaders, output)
+            return status, responseHeaders, output, failover
+
+        # the request is prepared again when it is retried with another authorization
+        originalHeaders = dict(headers) if headers is not None else None
+        loop = asyncio.get_running_loop()
+        blocking = self.__blocking()
+        while True:
+            if blocking:
+                path, requestHeaders, encoded_input, cacheKey, cached, fresh = await loop.run_in_executor(
+                    None, prepare, headers
+                )
+            else:
+                path, requestHeaders, encoded_input, cacheKey, cached, fresh = prepare(headers)
+            if fresh:
+                return 200, dict(cached.headers), cached.output
+            output: Union[str, bytes]
+            status, responseHeaders, output = await self.__requestRaw(verb, origin, path, requestHeaders, encoded_input)
+            if blocking:
+                status, responseHeaders, output, failover = await loop.run_in_executor(
+                    None, process, requestHeaders, cacheKey, cached, status, responseHeaders, output
+                )
+            else:
+                status, responseHeaders, output, failover = process(
+                    requestHeaders, cacheKey, cached, status, responseHeaders, output
+                )
+            if not failover:
+                return status, responseHeaders, output
+            headers = dict(originalHeaders) if originalHeaders is not None else None
+
+    def __blocking(self) -> bool:
+        # whether preparing a request or processing its response may do blocking I/O: caches may read and write
+        # files, other authentications (and subclasses) may request access tokens
+        if self.__requester.cache is not None:
+            return True
+        auth = self.__requester.auth
+        auths = auth.auths if isinstance(auth, TokenPool) else [auth]
+        return any(
+            auth is not None and type(auth) not in (Token, Login, NetrcAuth, AppAuth, AppAuthToken) for auth in auths
+        )
+
+    async def graphql_query(self, query: str, variables: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        :calls: `POST /graphql <https://docs.github.com/en/graphql>`_
+        """
+        input_ = {"query": query, "variables": {"input": variables}}
+
+        response_headers, data = await self.requestJsonAndCheck("POST", self.__requester.graphql_url, input=input_)
+        if "errors" in data:
+            raise self.__requester.createException(400, response_headers, data)
+        return response_headers, data
+
+    async def __requestRaw(
+        self,
+        verb: str,
+        origin: str,
+        path: str,
+        requestHeaders: Dict[str, str],
+        input: Optional[str],
+    ) -> Tuple[int, Dict[str, Any], bytes]:
+        # throttling is shared with synchronous requests of the same token
+        scheduler = self.__requester._scheduler(requestHeaders)
+        defer = self.__requester._reserveRequest(scheduler, verb, path)
+        if defer > 0:
+            await asyncio.sleep(defer)
+
+        try:
+            session = self.__getSession()
+            async with session.request(
+                verb, f"{origin}{path}", headers=requestHeaders, data=input, allow_redirects=False
+            ) as response:
+                status = response.status
+                responseHeaders = {k.lower(): v for k, v in response.headers.items()}
+                # the raw bytes are decoded by the JSON decoder
+                output = await response.read()
+
+            logger = self.__requester._logger
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s %s%s ==> %i %s", verb, origin, path, status, responseHeaders)
+            scheduler.update(responseHeaders)
+
+            if status == 202 and (verb == "GET" or verb == "HEAD"):
+                await asyncio.sleep(Consts.PROCESSING_202_WAIT_TIME)
+                return await self.__requestRaw(verb, origin, path, requestHeaders, input)
+
+            if status == 301 and "location" in responseHeaders:
+                path = self.__requester._redirectPath(path, responseHeaders["location"])
+                return await self.__requestRaw(verb, origin, path, requestHeaders, input)
+
+            return status, responseHeaders, output
+        finally:
+            scheduler.release(verb)
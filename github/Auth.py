@@ -25,10 +25,11 @@
 
 import abc
 import base64
+import threading
 import time
 from abc import ABC
 from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Dict, Optional, Union
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Sequence, Tuple, Union
 
 import jwt
 from requests import utils
@@ -36,6 +37,8 @@ from requests import utils
 from github import Consts
 from github.InstallationAuthorization import InstallationAuthorization
 from github.Requester import Requester, WithRequester
+from github.RequestScheduler import RequestScheduler
+from github.TokenStore import DEFAULT_REFRESHER, StoredToken, TokenStore
 
 if TYPE_CHECKING:
     from github.GithubIntegration import GithubIntegration
@@ -44,6 +47,17 @@ if TYPE_CHECKING:
 ACCESS_TOKEN_REFRESH_THRESHOLD_SECONDS = 20
 TOKEN_REFRESH_THRESHOLD_TIMEDELTA = timedelta(seconds=ACCESS_TOKEN_REFRESH_THRESHOLD_SECONDS)
 
+# Tokens refreshed in the background are renewed this many seconds before they expire, well before requests would
+# renew them within TOKEN_REFRESH_THRESHOLD_TIMEDELTA
+ACCESS_TOKEN_BACKGROUND_REFRESH_SECONDS = 300
+
+# Cached JWTs of app authentication are signed anew this many seconds before they expire,
+# at most a third of their lifetime
+JWT_REFRESH_THRESHOLD_SECONDS = 30
+
+# For token pools, time a token is not used after exceeding its rate limit if the response does not tell its reset
+RATE_LIMIT_EXCEEDED_BACKOFF_SECONDS = 60
+
 
 # add new implementations of github.Auth.Auth to docs/utilities.rst
 class Auth(abc.ABC):
@@ -71,6 +85,26 @@ class Auth(abc.ABC):
 
         """
 
+    def authentication(self, headers: Dict[str, str]) -> None:
+        """
+        Add authorization to the headers of a request.
+
+        :param headers: headers of the request
+
+        """
+        headers["Authorization"] = f"{self.token_type} {self.token}"
+
+    def rate_limit_exceeded(self, headers: Dict[str, str], responseHeaders: Dict[str, Any]) -> bool:
+        """
+        Called when the primary rate limit of the authorization in the given request headers has been exceeded.
+
+        :param headers: headers of the request
+        :param responseHeaders: (lower-cased) headers of the response
+        :return: True if the request should be retried with another authorization
+
+        """
+        return False
+
 
 class HTTPBasicAuth(Auth, abc.ABC):
     @property
@@ -184,6 +218,22 @@ class AppAuth(JWT):
         self._jwt_expiry = jwt_expiry
         self._jwt_issued_at = jwt_issued_at
         self._jwt_algorithm = jwt_algorithm
+        self.__lock = threading.Lock()
+        # parsing the private key is expensive, the parsed key is used for all JWTs
+        self.__key: Optional[Any] = None
+        self.__jwt: Optional[str] = None
+        self.__jwt_refresh_at = 0
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # __lock and the parsed __key are not picklable
+        del state["_AppAuth__lock"]
+        state["_AppAuth__key"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
 
     @property
     def app_id(self) -> Union[int, str]:
@@ -195,13 +245,23 @@ class AppAuth(JWT):
 
     @property
     def token(self) -> str:
-        return self.create_jwt()
+        # signing is expensive, the JWT is reused until it is about to expire,
+        # concurrent callers wait for a single JWT to be signed
+        with self.__lock:
+            now = int(time.time())
+            if self.__jwt is None or now >= self.__jwt_refresh_at:
+                self.__jwt = self.create_jwt()
+                threshold = min(JWT_REFRESH_THRESHOLD_SECONDS, self._jwt_expiry // 3)
+                self.__jwt_refresh_at = now + self._jwt_expiry - threshold
+            return self.__jwt
 
     def get_installation_auth(
         self,
         installation_id: int,
         token_permissions: Optional[Dict[str, str]] = None,
         requester: Optional[Requester] = None,
+        token_store: Optional[TokenStore] = None,
+        background_refresh: bool = False,
     ) -> "AppInstallationAuth":
         """
         Creates a github.Auth.AppInstallationAuth instance for an installation.
@@ -209,10 +269,12 @@ class AppAuth(JWT):
         :param installation_id: installation id
         :param token_permissions: optional permissions
         :param requester: optional requester with app authentication
+        :param token_store: optional store sharing access tokens with other authentications and processes
+        :param background_refresh: renew the access token in a background thread before it expires
         :return:
 
         """
-        return AppInstallationAuth(self, installation_id, token_permissions, requester)
+        return AppInstallationAuth(self, installation_id, token_permissions, requester, token_store, background_refresh)
 
     def create_jwt(self, expiration: Optional[int] = None) -> str:
         """
@@ -231,12 +293,20 @@ class AppAuth(JWT):
             "exp": now + (expiration if expiration is not None else self._jwt_expiry),
             "iss": self._app_id,
         }
-        encrypted = jwt.encode(payload, key=self.private_key, algorithm=self._jwt_algorithm)
+        encrypted = jwt.encode(payload, key=self._signing_key, algorithm=self._jwt_algorithm)
 
         if isinstance(encrypted, bytes):
             return encrypted.decode("utf-8")
         return encrypted
 
+    @property
+    def _signing_key(self) -> Any:
+        if self.__key is None:
+            algorithm = jwt.algorithms.get_default_algorithms().get(self._jwt_algorithm)
+            # unknown algorithms are reported by jwt.encode
+            self.__key = self.private_key if algorithm is None else algorithm.prepare_key(self.private_key)
+        return self.__key
+
 
 class AppAuthToken(JWT):
     """
@@ -262,6 +332,11 @@ class AppInstallationAuth(Auth, WithRequester["AppInstallationAuth"]):
 
     https://docs.github.com/en/apps/creating-github-apps/authenticating-with-a-github-app/authenticating-as-a-github-app-installation
 
+    Access tokens can be shared through a :class:`github.TokenStore.TokenStore` by all authentications of the same
+    installation and permissions, e.g. by many worker processes through a
+    :class:`github.TokenStore.SqliteTokenStore`. With ``background_refresh``, the token is renewed in a daemon thread
+    before it expires, so that requests do not wait for a renewal.
+
     """
 
     # used to fetch live access token when calling self.token
@@ -274,6 +349,8 @@ class AppInstallationAuth(Auth, WithRequester["AppInstallationAuth"]):
         installation_id: int,
         token_permissions: Optional[Dict[str, str]] = None,
         requester: Optional[Requester] = None,
+        token_store: Optional[TokenStore] = None,
+        background_refresh: bool = False,
     ):
         super().__init__()
 
@@ -281,14 +358,25 @@ class AppInstallationAuth(Auth, WithRequester["AppInstallationAuth"]):
         assert isinstance(installation_id, int), installation_id
         assert token_permissions is None or isinstance(token_permissions, dict), token_permissions
         assert requester is None or isinstance(requester, Requester), requester
+        assert token_store is None or isinstance(token_store, TokenStore), token_store
+        assert isinstance(background_refresh, bool), background_refresh
 
         self._app_auth = app_auth
         self._installation_id = installation_id
         self._token_permissions = token_permissions
+        self._token_store = token_store
+        self._background_refresh = background_refresh
+        self.__refresh_scheduled = False
 
         if requester is not None:
             self.withRequester(requester)
 
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # the refresh of this instance is scheduled in this process only
+        state["_AppInstallationAuth__refresh_scheduled"] = False
+        return state
+
     def withRequester(self, requester: Requester) -> "AppInstallationAuth":
         assert isinstance(requester, Requester), requester
         super().withRequester(requester.withAuth(self._app_auth))
@@ -320,23 +408,64 @@ class AppInstallationAuth(Auth, WithRequester["AppInstallationAuth"]):
     def token_type(self) -> str:
         return "token"
 
+    @property
+    def token_store(self) -> Optional[TokenStore]:
+        return self._token_store
+
     @property
     def token(self) -> str:
         if self.__installation_authorization is None or self._is_expired:
             self.__installation_authorization = self._get_installation_authorization()
+            if self._background_refresh and not self.__refresh_scheduled:
+                self.__refresh_scheduled = True
+                DEFAULT_REFRESHER.schedule(self._refresh_in_background, self.__background_refresh_at)
         return self.__installation_authorization.token
 
+    @property
+    def __background_refresh_at(self) -> float:
+        assert self.__installation_authorization is not None
+        return self.__installation_authorization.expires_at.timestamp() - ACCESS_TOKEN_BACKGROUND_REFRESH_SECONDS
+
+    def _refresh_in_background(self) -> float:
+        # Renews the token ahead of the requests, returns the time of the next renewal
+        self.__installation_authorization = self._get_installation_authorization(
+            ACCESS_TOKEN_BACKGROUND_REFRESH_SECONDS
+        )
+        return self.__background_refresh_at
+
     @property
     def _is_expired(self) -> bool:
         assert self.__installation_authorization is not None
         token_expires_at = self.__installation_authorization.expires_at - TOKEN_REFRESH_THRESHOLD_TIMEDELTA
         return token_expires_at < datetime.now(timezone.utc)
 
-    def _get_installation_authorization(self) -> InstallationAuthorization:
-        assert self.__integration is not None, "Method withRequester(Requester) must be called first"
-        return self.__integration.get_access_token(
-            self._installation_id,
-            permissions=self._token_permissions,
+    def _get_installation_authorization(
+        self, min_ttl: float = ACCESS_TOKEN_REFRESH_THRESHOLD_SECONDS
+    ) -> InstallationAuthorization:
+        integration = self.__integration
+        assert integration is not None, "Method withRequester(Requester) must be called first"
+        if self._token_store is None:
+            return integration.get_access_token(
+                self._installation_id,
+                permissions=self._token_permissions,
+            )
+
+        def refresh() -> StoredToken:
+            authorization = integration.get_access_token(
+                self._installation_id,
+                permissions=self._token_permissions,
+            )
+            return StoredToken(authorization.token, authorization.expires_at.timestamp())
+
+        permissions = ",".join(f"{name}={value}" for name, value in sorted((self._token_permissions or {}).items()))
+        key = f"{self.app_id}:{self._installation_id}:{permissions}"
+        token = self._token_store.get_or_refresh(key, refresh, min_ttl)
+        expires_at = datetime.fromtimestamp(token.expires_at, timezone.utc)
+        return InstallationAuthorization(
+            requester=self.requester,
+            headers={},
+            attributes={"token": token.token, "expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%SZ")},
+            completed=True,
         )
 
 
@@ -495,3 +624,127 @@ class NetrcAuth(HTTPBasicAuth, WithRequester["NetrcAuth"]):
         self._login, self._password = auth
 
         return self
+
+
+class TokenPool(Auth, WithRequester["TokenPool"]):
+    """
+    This class is used to authenticate with several authentication methods, e.g. tokens of different users or
+    installations, to combine their rate limits.
+
+    Each request uses the authentication with the most remaining rate limit, as reported by the rate limit headers of
+    earlier responses. When the rate limit of one authentication is exceeded, the request is retried with another
+    authentication instead of waiting for the rate limit to reset.
+
+    """
+
+    def __init__(self, auths: Sequence[Auth]):
+        super().__init__()
+
+        assert isinstance(auths, (list, tuple)), auths
+        assert len(auths) > 0, "at least one authentication is required"
+        assert all(isinstance(auth, Auth) and not isinstance(auth, TokenPool) for auth in auths), auths
+
+        self._auths = list(auths)
+        self.__lock = threading.Lock()
+        # scheduler of each auth, keyed by its current Authorization header, referenced to keep its rate limit state
+        self.__schedulers: List[Optional[Tuple[str, RequestScheduler]]] = [None] * len(self._auths)
+        # time until which an auth is not used because its rate limit has been exceeded
+        self.__exhausted_until: List[float] = [0] * len(self._auths)
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # __lock is not picklable, __schedulers are specific to this process
+        del state["_TokenPool__lock"]
+        state["_TokenPool__schedulers"] = [None] * len(self._auths)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    @property
+    def auths(self) -> List[Auth]:
+        return list(self._auths)
+
+    def withRequester(self, requester: Requester) -> "TokenPool":
+        assert isinstance(requester, Requester), requester
+        super().withRequester(requester)
+
+        for auth in self._auths:
+            if isinstance(auth, WithRequester):
+                auth.withRequester(requester)
+
+        return self
+
+    @property
+    def token_type(self) -> str:
+        return self.current.token_type
+
+    @property
+    def token(self) -> str:
+        return self.current.token
+
+    @property
+    def current(self) -> Auth:
+        """
+        The authentication used by the next request.
+        """
+        return self._auths[self.__select()[0]]
+
+    def authentication(self, headers: Dict[str, str]) -> None:
+        _, authorization = self.__select()
+        headers["Authorization"] = authorization
+
+    def rate_limit_exceeded(self, headers: Dict[str, str], responseHeaders: Dict[str, Any]) -> bool:
+        now = self.__now()
+        reset = float(responseHeaders.get(Consts.headerRateReset, 0))
+        if reset <= now:
+            reset = now + RATE_LIMIT_EXCEEDED_BACKOFF_SECONDS
+
+        with self.__lock:
+            exhausted = [
+                index
+                for index, entry in enumerate(self.__schedulers)
+                if entry is not None and entry[0] == headers.get("Authorization")
+            ]
+            for index in exhausted:
+                self.__exhausted_until[index] = max(self.__exhausted_until[index], reset)
+            # an authorization that is not part of the pool (anymore) is not retried
+            return len(exhausted) > 0 and any(until <= now for until in self.__exhausted_until)
+
+    def __select(self) -> Tuple[int, str]:
+        # Returns the index and Authorization header of the auth with the most remaining rate limit.
+        # Auths whose rate limit is not known yet are preferred, so that all auths are used.
+        # Auths are ranked by the rate limit last seen for their index, so that only the token of the chosen auth
+        # is read, which may request or refresh an access token.
+        now = self.__now()
+        best: Optional[Tuple[Tuple[bool, float], int]] = None
+        with self.__lock:
+            for index, entry in enumerate(self.__schedulers):
+                rate_limiting = None if entry is None else entry[1].rate_limiting
+                if rate_limiting is None or rate_limiting["reset"] <= now:
+                    remaining = float("inf")
+                else:
+                    remaining = rate_limiting["remaining"]
+                rank = (self.__exhausted_until[index] <= now, remaining)
+                if best is None or rank > best[0]:
+                    best = (rank, index)
+        assert best is not None
+        index = best[1]
+        auth = self._auths[index]
+        authorization = f"{auth.token_type} {auth.token}"
+        self.__scheduler(index, authorization)
+        return index, authorization
+
+    def __scheduler(self, index: int, authorization: str) -> RequestScheduler:
+        with self.__lock:
+            entry = self.__schedulers[index]
+            if entry is None or entry[0] != authorization:
+                assert self.requester is not None, "Method withRequester(Requester) must be called first"
+                entry = (authorization, RequestScheduler.get(self.requester.hostname, authorization))
+                self.__schedulers[index] = entry
+            return entry[1]
+
+    @staticmethod
+    def __now() -> float:
+        return datetime.now(timezone.utc).timestamp()
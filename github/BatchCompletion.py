@@ -0,0 +1,344 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import github.NamedUser
+import github.Repository
+from github.GithubObject import CompletableGithubObject
+
+if TYPE_CHECKING:
+    from github.NamedUser import NamedUser
+    from github.Repository import Repository
+    from github.Requester import Requester
+
+# GraphQL selection of an attribute, and conversion of the selected value of a node into the REST value
+_Field = Tuple[str, Callable[[Dict[str, Any]], Any]]
+
+
+def _value(name: str, convert: Optional[Callable[[Any], Any]] = None) -> _Field:
+    return name, lambda node: node[name] if convert is None or node[name] is None else convert(node[name])
+
+
+def _count(name: str) -> _Field:
+    return f"{name} {{ totalCount }}", lambda node: node[name]["totalCount"]
+
+
+def _lower(value: str) -> str:
+    return value.lower()
+
+
+def _prState(value: str) -> str:
+    # merged pull requests are closed in the REST API
+    return "open" if value == "OPEN" else "closed"
+
+
+def _mergeable(value: str) -> Optional[bool]:
+    return {"MERGEABLE": True, "CONFLICTING": False}.get(value)
+
+
+# GraphQL type and fields of the attributes of classes that can be completed through GraphQL
+_GRAPHQL: Dict[str, Tuple[str, Dict[str, _Field]]] = {
+    "Issue": (
+        "Issue",
+        {
+            "number": _value("number"),
+            "title": _value("title"),
+            "body": _value("body"),
+            "state": _value("state", _lower),
+            "locked": _value("locked"),
+            "comments": _count("comments"),
+            "created_at": _value("createdAt"),
+            "updated_at": _value("updatedAt"),
+            "closed_at": _value("closedAt"),
+        },
+    ),
+    "PullRequest": (
+        "PullRequest",
+        {
+            "number": _value("number"),
+            "title": _value("title"),
+            "body": _value("body"),
+            "state": _value("state", _prState),
+            "locked": _value("locked"),
+            "draft": _value("isDraft"),
+            "merged": _value("merged"),
+            "mergeable": _value("mergeable", _mergeable),
+            "additions": _value("additions"),
+            "deletions": _value("deletions"),
+            "changed_files": _value("changedFiles"),
+            "commits": _count("commits"),
+            "comments": _count("comments"),
+            "created_at": _value("createdAt"),
+            "updated_at": _value("updatedAt"),
+            "closed_at": _value("closedAt"),
+            "merged_at": _value("mergedAt"),
+        },
+    ),
+    "Repository": (
+        "Repository",
+        {
+            "name": _value("name"),
+            "full_name": _value("nameWithOwner"),
+            "description": _value("description"),
+            "homepage": _value("homepageUrl"),
+            "private": _value("isPrivate"),
+            "fork": _value("isFork"),
+            "archived": _value("isArchived"),
+            "stargazers_count": _value("stargazerCount"),
+            "forks_count": _value("forkCount"),
+            "created_at": _value("createdAt"),
+            "updated_at": _value("updatedAt"),
+            "pushed_at": _value("pushedAt"),
+        },
+    ),
+    "NamedUser": (
+        "User",
+        {
+            "login": _value("login"),
+            "name": _value("name"),
+            "company": _value("company"),
+            "blog": _value("websiteUrl"),
+            "location": _value("location"),
+            "email": _value("email"),
+            "bio": _value("bio"),
+            "followers": _count("followers"),
+            "following": _count("following"),
+            "created_at": _value("createdAt"),
+            "updated_at": _value("updatedAt"),
+        },
+    ),
+}
+
+# maximum number of ids of a GraphQL nodes query
+GRAPHQL_BATCH_SIZE = 100
+
+# maximum number of aliased lookups of a GraphQL query, every lookup selects a single node and a few counts
+GRAPHQL_LOOKUP_BATCH_SIZE = 100
+
+# GraphQL field looking up an object by the variables of a lookup, with the REST attributes of identity
+_LOOKUPS: Dict[str, Tuple[str, Dict[str, str], Dict[str, _Field]]] = {
+    "Repository": (
+        "repository(owner: $owner{i}, name: $name{i})",
+        {"owner": "String!", "name": "String!"},
+        {
+            "node_id": _value("id"),
+            "html_url": _value("url"),
+            "owner": (
+                "owner { login }",
+                lambda node: {"login": node["owner"]["login"]},
+            ),
+        },
+    ),
+    "NamedUser": (
+        "user(login: $login{i})",
+        {"login": "String!"},
+        {"node_id": _value("id"), "html_url": _value("url")},
+    ),
+}
+
+
+def complete_all(
+    objects: Iterable[CompletableGithubObject],
+    fields: Optional[Sequence[str]] = None,
+    max_workers: int = 8,
+) -> None:
+    """
+    Completes many objects with few requests, rather than one request per object on first access of an attribute
+    that has not been returned, e.g. by a list.
+
+    With ``fields``, objects whose attributes can be queried through GraphQL (issues, pull requests, repositories
+    and users) are completed with one ``nodes`` query per 100 objects, using their ``node_id``. Only the given
+    attributes are set, other attributes still complete the object on access. All other objects are completed
+    through concurrent REST requests.
+
+    :param objects: the objects to complete, objects that have been completed or have all fields set are skipped
+    :param fields: the names of the attributes to set, e.g. ``["additions", "deletions"]``, None to complete the
+        objects through REST
+    :param max_workers: the maximum number of concurrent requests
+    """
+    assert fields is None or all(isinstance(field, str) for field in fields), fields
+    assert isinstance(max_workers, int) and max_workers > 0, max_workers
+
+    batches: Dict[Tuple["Requester", str], List[CompletableGithubObject]] = {}
+    rest: List[CompletableGithubObject] = []
+    for obj in objects:
+        assert isinstance(obj, CompletableGithubObject), obj
+        if not obj._needsCompletion(fields):
+            continue
+        graphql = _GRAPHQL.get(obj.__class__.__name__)
+        node_id = obj._rawData.get("node_id") if isinstance(obj._rawData, dict) else None
+        if fields is not None and graphql is not None and node_id and all(field in graphql[1] for field in fields):
+            batches.setdefault((obj._requester, obj.__class__.__name__), []).append(obj)
+        else:
+            rest.append(obj)
+
+    graphqlFields = fields or []
+    queries = [
+        (requester, className, batch[i : i + GRAPHQL_BATCH_SIZE], graphqlFields)
+        for (requester, className), batch in batches.items()
+        for i in range(0, len(batch), GRAPHQL_BATCH_SIZE)
+    ]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="complete_all") as executor:
+        for unresolved in executor.map(lambda query: _completeThroughGraphql(*query), queries):
+            rest.extend(unresolved)
+        # objects not returned by GraphQL are completed through REST
+        for _ in executor.map(lambda obj: obj._completeIfNeeded(), rest):
+            pass
+
+
+def _completeThroughGraphql(
+    requester: "Requester", className: str, objects: List[CompletableGithubObject], fields: Sequence[str]
+) -> List[CompletableGithubObject]:
+    # Sets the fields of the objects from one nodes query, returns the objects whose node has not been returned
+    typeName, graphqlFields = _GRAPHQL[className]
+    selections = [graphqlFields[field] for field in fields]
+    query = (
+        "query($ids: [ID!]!) { nodes(ids: $ids) { "
+        f"... on {typeName} {{ {' '.join(selection for selection, _ in selections)} }}"
+        " } }"
+    )
+    ids = [obj._rawData["node_id"] for obj in objects]
+    headers, data = requester.requestJsonAndCheck(
+        "POST", requester.graphql_url, input={"query": query, "variables": {"ids": ids}}
+    )
+    # nodes that cannot be found are null, with an error per node
+    if not isinstance(data.get("data"), dict):
+        raise requester.createException(400, headers, data)
+
+    unresolved = []
+    for obj, node in zip(objects, data["data"]["nodes"]):
+        if not node or not all(selection.split(" ")[0] in node for selection, _ in selections):
+            unresolved.append(obj)
+            continue
+        attributes = {field: convert(node) for field, (_, convert) in zip(fields, selections)}
+        obj._storeAndUseAttributes(obj._headers, {**obj._rawData, **attributes})
+    return unresolved
+
+
+def lookup_repos(
+    requester: "Requester",
+    full_names: Sequence[str],
+    batch_size: int = GRAPHQL_LOOKUP_BATCH_SIZE,
+    max_workers: int = 8,
+) -> List[Optional["Repository"]]:
+    """
+    Looks up many repositories by full name with aliased fields of few GraphQL queries, rather than one request
+    per repository.
+
+    :param full_names: the full names of the repositories, like ``PyGithub/PyGithub``
+    :param batch_size: the maximum number of repositories per query
+    :param max_workers: the maximum number of concurrent queries
+    :return: the repositories in the order of the names, None for repositories that cannot be found
+    """
+    assert all(isinstance(full_name, str) and full_name.count("/") == 1 for full_name in full_names), full_names
+    lookups = [dict(zip(("owner", "name"), full_name.split("/"))) for full_name in full_names]
+
+    def setUrls(attributes: Dict[str, Any]) -> None:
+        owner, name = attributes["full_name"].split("/")
+        attributes["url"] = _restUrl(requester, "repos", owner, name)
+        attributes["owner"]["url"] = _restUrl(requester, "users", owner)
+
+    return _lookupAll(requester, github.Repository.Repository, lookups, setUrls, batch_size, max_workers)
+
+
+def lookup_users(
+    requester: "Requester",
+    logins: Sequence[str],
+    batch_size: int = GRAPHQL_LOOKUP_BATCH_SIZE,
+    max_workers: int = 8,
+) -> List[Optional["NamedUser"]]:
+    """
+    Looks up many users by login with aliased fields of few GraphQL queries, rather than one request per user.
+
+    :param logins: the logins of the users
+    :param batch_size: the maximum number of users per query
+    :param max_workers: the maximum number of concurrent queries
+    :return: the users in the order of the logins, None for users that cannot be found
+    """
+    assert all(isinstance(login, str) for login in logins), logins
+
+    def setUrls(attributes: Dict[str, Any]) -> None:
+        attributes["url"] = _restUrl(requester, "users", attributes["login"])
+
+    return _lookupAll(
+        requester, github.NamedUser.NamedUser, [{"login": login} for login in logins], setUrls, batch_size, max_workers
+    )
+
+
+def _restUrl(requester: "Requester", *segments: str) -> str:
+    # The url of the REST resource, as in REST responses, so that looked up objects equal those of REST requests,
+    # e.g. in the identity map
+    return "/".join([requester.base_url.rstrip("/"), *(urllib.parse.quote(segment, safe="") for segment in segments)])
+
+
+def _lookupAll(
+    requester: "Requester",
+    klass: Any,
+    lookups: List[Dict[str, str]],
+    setUrls: Callable[[Dict[str, Any]], None],
+    batch_size: int,
+    max_workers: int,
+) -> List[Any]:
+    assert isinstance(batch_size, int) and 0 < batch_size <= GRAPHQL_LOOKUP_BATCH_SIZE, batch_size
+    assert isinstance(max_workers, int) and max_workers > 0, max_workers
+
+    batches = [lookups[i : i + batch_size] for i in range(0, len(lookups), batch_size)]
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="lookup") as executor:
+        results = executor.map(lambda batch: _lookup(requester, klass, batch, setUrls), batches)
+        return [obj for objects in results for obj in objects]
+
+
+def _lookup(
+    requester: "Requester",
+    klass: Any,
+    lookups: List[Dict[str, str]],
+    setUrls: Callable[[Dict[str, Any]], None],
+) -> List[Any]:
+    # Looks up the objects of one query, the objects that cannot be found are None
+    field, variableTypes, identityFields = _LOOKUPS[klass.__name__]
+    fields = {**_GRAPHQL[klass.__name__][1], **identityFields}
+    selection = " ".join(selection for selection, _ in fields.values())
+    declarations = [f"${name}{i}: {type}" for i in range(len(lookups)) for name, type in variableTypes.items()]
+    aliases = [f"r{i}: {field.format(i=i)} {{ {selection} }}" for i in range(len(lookups))]
+    query = f"query({', '.join(declarations)}) {{ {' '.join(aliases)} }}"
+    variables = {f"{name}{i}": value for i, lookup in enumerate(lookups) for name, value in lookup.items()}
+
+    headers, data = requester.requestJsonAndCheck(
+        "POST", requester.graphql_url, input={"query": query, "variables": variables}
+    )
+    # objects that cannot be found are null, with an error of type NOT_FOUND per object
+    errors = [error for error in data.get("errors", []) if error.get("type") != "NOT_FOUND"]
+    if errors or not isinstance(data.get("data"), dict):
+        raise requester.createException(400, headers, data)
+
+    objects: List[Any] = []
+    for i in range(len(lookups)):
+        node = data["data"].get(f"r{i}")
+        if node is None:
+            objects.append(None)
+            continue
+        attributes = {name: convert(node) for name, (_, convert) in fields.items()}
+        setUrls(attributes)
+        objects.append(klass(requester, headers, attributes, completed=False))
+    return objects
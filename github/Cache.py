@@ -0,0 +1,329 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import abc
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, NamedTuple, Optional
+
+
+class CachedResponse(NamedTuple):
+    """
+    The headers and body of a successful GET response, as stored by a :class:`Cache`.
+    """
+
+    headers: Dict[str, Any]
+    output: str
+    # unix timestamp of when the response was received or last revalidated
+    stored_at: float = 0.0
+
+
+# add new implementations of github.Cache.Cache to docs/utilities.rst
+class Cache(abc.ABC):
+    """
+    This class is the base class of all response caches for Requester.
+
+    The Requester stores responses to GET requests that carry an ``ETag`` or ``Last-Modified`` header, and
+    revalidates them with ``If-None-Match`` and ``If-Modified-Since`` headers on subsequent requests. When GitHub
+    responds with ``304 Not Modified``, which does not count against the rate limit, the cached response is used.
+
+    Responses that have been stored or revalidated less than :attr:`ttl` seconds ago are used without contacting
+    GitHub at all.
+
+    Keys identify the requested url, media type and authentication. Implementations must be thread-safe.
+
+    """
+
+    ttl: float = 0
+
+    def is_fresh(self, response: CachedResponse) -> bool:
+        """
+        Returns True if the response can be used without revalidation.
+        """
+        return time.time() - response.stored_at < self.ttl
+
+    @abc.abstractmethod
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """
+        Returns the response stored for the given key, or None.
+        """
+
+    @abc.abstractmethod
+    def set(self, key: str, response: CachedResponse) -> None:
+        """
+        Stores the response for the given key.
+        """
+
+    @abc.abstractmethod
+    def delete(self, key: str) -> None:
+        """
+        Removes the response stored for the given key, if any.
+        """
+
+
+class MemoryCache(Cache):
+    """
+    This class caches responses in memory, evicting the least recently used response beyond ``max_entries``.
+    """
+
+    def __init__(self, max_entries: int = 1024, ttl: float = 0):
+        assert isinstance(max_entries, int) and max_entries > 0, max_entries
+        assert ttl >= 0, ttl
+        self.__max_entries = max_entries
+        self.ttl = ttl
+        self.__entries: "OrderedDict[str, CachedResponse]" = OrderedDict()
+        self.__lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # __lock is not picklable
+        del state["_MemoryCache__lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self.__lock:
+            response = self.__entries.get(key)
+            if response is not None:
+                self.__entries.move_to_end(key)
+            return response
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        with self.__lock:
+            self.__entries[key] = response
+            self.__entries.move_to_end(key)
+            while len(self.__entries) > self.__max_entries:
+                self.__entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            self.__entries.pop(key, None)
+
+
+class FileCache(Cache):
+    """
+    This class caches responses on disk, one JSON file per response in the given directory.
+
+    Files are replaced atomically, so the directory can be shared by threads and processes.
+
+    """
+
+    def __init__(self, path: str, ttl: float = 0):
+        assert isinstance(path, str), path
+        assert ttl >= 0, ttl
+        os.makedirs(path, exist_ok=True)
+        self.__path = path
+        self.ttl = ttl
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def __file(self, key: str) -> str:
+        return os.path.join(self.__path, hashlib.sha256(key.encode("utf-8")).hexdigest() + ".json")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        try:
+            with open(self.__file(key), encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # guard against hash collisions
+        if data.get("key") != key:
+            return None
+        return CachedResponse(data["headers"], data["output"], data.get("stored_at", 0.0))
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        fd, tmp = tempfile.mkstemp(dir=self.__path, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(
+                    {
+                        "key": key,
+                        "headers": response.headers,
+                        "output": response.output,
+                        "stored_at": response.stored_at,
+                    },
+                    f,
+                )
+            os.replace(tmp, self.__file(key))
+        except BaseException:
+            os.unlink(tmp)
+            raise
+
+    def delete(self, key: str) -> None:
+        try:
+            os.unlink(self.__file(key))
+        except FileNotFoundError:
+            pass
+
+
+class SqliteCache(Cache):
+    """
+    This class caches responses in an SQLite database file, which can be shared by threads and processes.
+
+    When the responses stored exceed ``max_size`` bytes, the least recently used responses are evicted. So that
+    cache hits of many processes do not wait for each other's writes, the time a response was last used is only
+    updated once it is older than :attr:`ACCESS_UPDATE_INTERVAL` seconds.
+
+    """
+
+    # seconds after which a cache hit updates the time the response was last used
+    ACCESS_UPDATE_INTERVAL = 60
+
+    def __init__(self, path: str, ttl: float = 0, max_size: Optional[int] = 256 * 1024 * 1024, timeout: float = 30):
+        assert isinstance(path, str), path
+        assert ttl >= 0, ttl
+        assert max_size is None or isinstance(max_size, int) and max_size > 0, max_size
+        self.__path = path
+        self.ttl = ttl
+        self.__max_size = max_size
+        self.__timeout = timeout
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__lock = threading.Lock()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # __lock and __connection are not picklable
+        del state["_SqliteCache__lock"]
+        del state["_SqliteCache__connection"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__connection = None
+        self.__lock = threading.Lock()
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    def __connect(self) -> sqlite3.Connection:
+        # must be called while holding __lock
+        if self.__connection is None:
+            # autocommit mode, transactions are started explicitly
+            cnx = sqlite3.connect(self.__path, timeout=self.__timeout, check_same_thread=False, isolation_level=None)
+            # write-ahead logging lets processes read while another process writes
+            cnx.execute("PRAGMA journal_mode=WAL")
+            cnx.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                "key TEXT PRIMARY KEY, headers TEXT NOT NULL, output TEXT NOT NULL, "
+                "stored_at REAL NOT NULL, accessed_at REAL NOT NULL, size INTEGER NOT NULL)"
+            )
+            cnx.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+            # running total of the size of all responses, so that it is not summed up on every write
+            cnx.execute("CREATE TABLE IF NOT EXISTS stats (name TEXT PRIMARY KEY, value INTEGER NOT NULL)")
+            cnx.execute(
+                "INSERT OR IGNORE INTO stats (name, value) SELECT 'size', COALESCE(SUM(size), 0) FROM responses"
+            )
+            self.__connection = cnx
+        return self.__connection
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        with self.__lock:
+            cnx = self.__connect()
+            row = cnx.execute(
+                "SELECT headers, output, stored_at, accessed_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            now = time.time()
+            if now - row[3] > self.ACCESS_UPDATE_INTERVAL:
+                cnx.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        return CachedResponse(json.loads(row[0]), row[1], row[2])
+
+    def set(self, key: str, response: CachedResponse) -> None:
+        headers = json.dumps(response.headers)
+        # the UTF-8 encoded size, so that max_size is a limit in bytes
+        size = sum(len(value.encode("utf-8")) for value in (key, headers, response.output))
+        with self.__lock:
+            cnx = self.__connect()
+            cnx.execute("BEGIN IMMEDIATE")
+            try:
+                replaced = self.__size(cnx, key)
+                cnx.execute(
+                    "INSERT OR REPLACE INTO responses (key, headers, output, stored_at, accessed_at, size) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (key, headers, response.output, response.stored_at, time.time(), size),
+                )
+                cnx.execute("UPDATE stats SET value = value + ? WHERE name = 'size'", (size - replaced,))
+                if self.__max_size is not None:
+                    self.__evict(cnx, self.__max_size)
+                cnx.execute("COMMIT")
+            except BaseException:
+                cnx.execute("ROLLBACK")
+                raise
+
+    @staticmethod
+    def __size(cnx: sqlite3.Connection, key: str) -> int:
+        # the size of the response stored for key, 0 if there is none
+        row = cnx.execute("SELECT size FROM responses WHERE key = ?", (key,)).fetchone()
+        return 0 if row is None else row[0]
+
+    @staticmethod
+    def __evict(cnx: sqlite3.Connection, max_size: int) -> None:
+        # deletes least recently used responses until the stored responses fit into max_size
+        (total,) = cnx.execute("SELECT value FROM stats WHERE name = 'size'").fetchone()
+        if total <= max_size:
+            return
+        evict = []
+        evicted = 0
+        for key, size in cnx.execute("SELECT key, size FROM responses ORDER BY accessed_at"):
+            if total - evicted <= max_size:
+                break
+            evict.append((key,))
+            evicted += size
+        cnx.executemany("DELETE FROM responses WHERE key = ?", evict)
+        cnx.execute("UPDATE stats SET value = value - ? WHERE name = 'size'", (evicted,))
+
+    def delete(self, key: str) -> None:
+        with self.__lock:
+            cnx = self.__connect()
+            cnx.execute("BEGIN IMMEDIATE")
+            try:
+                size = self.__size(cnx, key)
+                cnx.execute("DELETE FROM responses WHERE key = ?", (key,))
+                cnx.execute("UPDATE stats SET value = value - ? WHERE name = 'size'", (size,))
+                cnx.execute("COMMIT")
+            except BaseException:
+                cnx.execute("ROLLBACK")
+                raise
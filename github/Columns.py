@@ -0,0 +1,142 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import array
+import re
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from github.GithubObject import _datetime_from_github_isoformat
+
+# Columns are pyarrow.Array objects
+ARROW = "arrow"
+# Columns are numpy.ndarray objects
+NUMPY = "numpy"
+# Columns are array.array objects for numbers, lists for all other values
+ARRAY = "array"
+BACKENDS = (ARROW, NUMPY, ARRAY)
+
+# GitHub always returns timestamps as YYYY-MM-DDTHH:MM:SSZ
+_TIMESTAMP = re.compile(r"\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z")
+
+
+def defaultBackend() -> str:
+    """
+    Returns the best backend available: ARROW if pyarrow is installed, NUMPY if numpy is installed, ARRAY otherwise.
+    """
+    for backend, module in [(ARROW, "pyarrow"), (NUMPY, "numpy")]:
+        try:
+            __import__(module)
+            return backend
+        except ImportError:
+            pass
+    return ARRAY
+
+
+def columnValues(elements: Iterable[Dict[str, Any]], fields: Sequence[str]) -> Dict[str, List[Any]]:
+    """
+    Collects the values of the given fields of the elements, a field like ``user.login`` refers to a nested value.
+
+    Missing values are None.
+
+    """
+    paths = [field.split(".") for field in fields]
+    values: Dict[str, List[Any]] = {field: [] for field in fields}
+    for element in elements:
+        for field, path in zip(fields, paths):
+            value: Any = element
+            for key in path:
+                value = value.get(key) if isinstance(value, dict) else None
+            values[field].append(value)
+    return values
+
+
+def toColumn(values: List[Any], backend: str) -> Any:
+    """
+    Converts the values of one field into a typed column of the given backend.
+
+    The column type is inferred from the values: bool, int, float, timestamp or other (usually str). Timestamps are
+    parsed in bulk by pyarrow and numpy.
+
+    """
+    assert backend in BACKENDS, backend
+    kind = _kind(values)
+    if backend == ARROW:
+        return _arrowColumn(values, kind)
+    if backend == NUMPY:
+        return _numpyColumn(values, kind)
+    return _arrayColumn(values, kind)
+
+
+def _kind(values: List[Any]) -> Optional[str]:
+    present = [value for value in values if value is not None]
+    if not present:
+        return None
+    if all(isinstance(value, bool) for value in present):
+        return "bool"
+    if all(isinstance(value, int) and not isinstance(value, bool) for value in present):
+        return "int"
+    if all(isinstance(value, (int, float)) and not isinstance(value, bool) for value in present):
+        return "float"
+    if all(isinstance(value, str) and _TIMESTAMP.fullmatch(value) for value in present):
+        return "timestamp"
+    return None
+
+
+def _arrowColumn(values: List[Any], kind: Optional[str]) -> Any:
+    import pyarrow
+    import pyarrow.compute
+
+    if kind == "timestamp":
+        strings = pyarrow.array(values, pyarrow.string())
+        naive = pyarrow.compute.strptime(strings, format="%Y-%m-%dT%H:%M:%SZ", unit="s")
+        return naive.cast(pyarrow.timestamp("s", tz="UTC"))
+    if kind == "float":
+        return pyarrow.array(values, pyarrow.float64())
+    return pyarrow.array(values)
+
+
+def _numpyColumn(values: List[Any], kind: Optional[str]) -> Any:
+    import numpy
+
+    nulls = any(value is None for value in values)
+    if kind == "timestamp":
+        # numpy parses timestamps without timezone, all GitHub timestamps are UTC
+        return numpy.array([None if value is None else value[:-1] for value in values], dtype="datetime64[s]")
+    if kind == "int" and not nulls:
+        return numpy.array(values, dtype=numpy.int64)
+    if kind in ("int", "float"):
+        return numpy.array([numpy.nan if value is None else value for value in values], dtype=numpy.float64)
+    if kind == "bool" and not nulls:
+        return numpy.array(values, dtype=numpy.bool_)
+    return numpy.array(values, dtype=object)
+
+
+def _arrayColumn(values: List[Any], kind: Optional[str]) -> Any:
+    nulls = any(value is None for value in values)
+    if kind == "timestamp":
+        return [None if value is None else _datetime_from_github_isoformat(value) for value in values]
+    if kind == "int" and not nulls:
+        return array.array("q", values)
+    if kind in ("int", "float"):
+        return array.array("d", [float("nan") if value is None else value for value in values])
+    if kind == "bool" and not nulls:
+        return array.array("b", values)
+    return values
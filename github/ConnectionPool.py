@@ -0,0 +1,151 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, Union
+
+import requests.adapters
+from urllib3 import Retry
+
+
+class ConnectionPool:
+    """
+    This class shares the connections to a GitHub host among all :class:`github.Requester.Requester` instances of
+    a process.
+
+    Requesters with the same host, port, TLS verification, timeout, retry and pool size settings use the same
+    connection, i.e. the same ``requests.Session`` and ``HTTPAdapter``, so TLS handshakes and sockets do not
+    multiply with the number of ``Github`` objects. This includes the connections to other hosts, like
+    ``uploads.github.com`` for release assets. Closing a ``Github`` object does not close shared connections, they
+    are closed once they have not been used for :attr:`idle_timeout` seconds, when more than :attr:`max_pools`
+    pools exist and they are the least recently used, or by :meth:`resetPools`.
+
+    """
+
+    # maximum number of connections kept by each pool, None for the pool size of the requesters
+    max_connections: Optional[int] = None
+    # seconds after which pools that have not been used are closed
+    idle_timeout: float = 300
+    # maximum number of pools, i.e. of distinct hosts and settings, the least recently used pool is closed beyond
+    max_pools: int = 32
+
+    __pools: Dict[Tuple[Hashable, ...], "ConnectionPool"] = {}
+    __pools_lock = threading.Lock()
+    __last_eviction = 0.0
+
+    @classmethod
+    def configure(cls, max_connections: Optional[int] = None, idle_timeout: float = 300, max_pools: int = 32) -> None:
+        """
+        Configures the pools of this process, closing the existing pools.
+
+        :param max_connections: maximum number of connections kept by each pool, None for the ``pool_size`` of the
+            requesters
+        :param idle_timeout: seconds after which pools that have not been used are closed
+        :param max_pools: maximum number of pools, the least recently used pool is closed when exceeded
+        """
+        assert max_connections is None or isinstance(max_connections, int) and max_connections > 0, max_connections
+        assert idle_timeout > 0, idle_timeout
+        assert isinstance(max_pools, int) and max_pools > 0, max_pools
+        with cls.__pools_lock:
+            cls.max_connections = max_connections
+            cls.idle_timeout = idle_timeout
+            cls.max_pools = max_pools
+        cls.resetPools()
+
+    @classmethod
+    def get(
+        cls,
+        connectionClass: Callable[..., Any],
+        hostname: str,
+        port: Optional[int],
+        retry: Optional[Union[int, Retry]],
+        pool_size: Optional[int],
+        timeout: Optional[int],
+        verify: Union[bool, str],
+    ) -> Any:
+        """
+        Returns the connection shared by all requests to hostname and port with the given settings.
+        """
+        if cls.max_connections is not None:
+            pool_size = min(pool_size or requests.adapters.DEFAULT_POOLSIZE, cls.max_connections)
+        key = (connectionClass, hostname, port, cls.__retryKey(retry), pool_size, timeout, verify)
+        now = time.monotonic()
+        pool = cls.__pools.get(key)
+        if pool is None or now - cls.__last_eviction > cls.idle_timeout:
+            with cls.__pools_lock:
+                cls.__evictIdle(now)
+                pool = cls.__pools.get(key)
+                if pool is None:
+                    if len(cls.__pools) >= cls.max_pools:
+                        cls.__evictLeastRecentlyUsed()
+                    pool = ConnectionPool(
+                        connectionClass(
+                            hostname, port, retry=retry, pool_size=pool_size, timeout=timeout, verify=verify
+                        )
+                    )
+                    cls.__pools[key] = pool
+        pool.__last_used = now
+        return pool.connection
+
+    @classmethod
+    def resetPools(cls) -> None:
+        """
+        Closes and drops all pools of this process.
+        """
+        with cls.__pools_lock:
+            pools = list(cls.__pools.values())
+            cls.__pools.clear()
+        for pool in pools:
+            pool.connection.close()
+
+    @classmethod
+    def __evictIdle(cls, now: float) -> None:
+        # must be called while holding __pools_lock
+        cls.__last_eviction = now
+        for key, pool in list(cls.__pools.items()):
+            if now - pool.__last_used > cls.idle_timeout:
+                del cls.__pools[key]
+                pool.connection.close()
+
+    @classmethod
+    def __evictLeastRecentlyUsed(cls) -> None:
+        # must be called while holding __pools_lock
+        key = min(cls.__pools, key=lambda key: cls.__pools[key].__last_used)
+        cls.__pools.pop(key).connection.close()
+
+    @staticmethod
+    def __retryKey(retry: Optional[Union[int, Retry]]) -> Hashable:
+        # Retry instances of equal configuration are interchangeable
+        if isinstance(retry, Retry):
+            # private attributes are state rather than configuration, sets are sorted as their order varies
+            return type(retry), repr(
+                sorted(
+                    (name, sorted(value) if isinstance(value, (set, frozenset)) else value)
+                    for name, value in vars(retry).items()
+                    if not name.startswith("_")
+                )
+            )
+        return retry
+
+    def __init__(self, connection: Any) -> None:
+        self.connection = connection
+        self.__last_used = time.monotonic()
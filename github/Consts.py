@@ -71,6 +71,7 @@ RES_LAST_MODIFIED = "last-modified"
 headerRateLimit = "x-ratelimit-limit"
 headerRateRemaining = "x-ratelimit-remaining"
 headerRateReset = "x-ratelimit-reset"
+headerRateResource = "x-ratelimit-resource"
 headerOAuthScopes = "x-oauth-scopes"
 headerOTP = "x-github-otp"
 
@@ -161,6 +162,8 @@ DEFAULT_USER_AGENT = "PyGithub/Python"
 # latency.
 DEFAULT_TIMEOUT = 15
 DEFAULT_PER_PAGE = 30
+# size of the chunks in bytes that downloads are streamed in
+DEFAULT_CHUNK_SIZE = 1024 * 1024
 
 # JWT expiry in seconds. Could be set for max 600 seconds (10 minutes).
 # https://docs.github.com/en/developers/apps/building-github-apps/authenticating-with-github-apps#authenticating-as-a-github-app
@@ -54,14 +54,18 @@
 
 from __future__ import annotations
 
+import mimetypes
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from os.path import basename
-from typing import Any, BinaryIO
+from typing import Any, BinaryIO, Callable, Iterable, Iterator
 
 import github.GitReleaseAsset
 import github.NamedUser
 from github.GithubObject import Attribute, CompletableGithubObject, NotSet, Opt
 from github.PaginatedList import PaginatedList
+from github.Requester import UploadProgress
 
 from . import Consts
 
@@ -281,6 +285,102 @@ class GitRelease(CompletableGithubObject):
         )
         return github.GitReleaseAsset.GitReleaseAsset(self._requester, resp_headers, data, completed=True)
 
+    def upload_asset_from_stream(
+        self,
+        chunks: Iterable[bytes],
+        size: int,
+        name: str,
+        content_type: Opt[str] = NotSet,
+        label: str = "",
+        progress: Callable[[UploadProgress], None] | None = None,
+    ) -> github.GitReleaseAsset.GitReleaseAsset:
+        """
+        Uploads an asset.
+
+        Unlike ``upload_asset_from_memory()`` this method reads the content from an iterable of bytes chunks, e.g. a
+        generator, only while it is sent, so the content never has to be in memory entirely.
+        :calls: `POST https://<upload_url>/repos/{owner}/{repo}/releases/{release_id}/assets <https://docs.github.com/en/rest/reference/repos#upload-a-release-asset>`_
+        :param chunks: iterable of bytes, that provides exactly ``size`` bytes
+        :param size: int, size in bytes of the asset
+        :param progress: callable, called with a :class:`github.Requester.UploadProgress` whenever bytes have been sent
+
+        """
+        assert isinstance(name, str), name
+        assert isinstance(size, int), size
+        assert isinstance(label, str), label
+        assert progress is None or callable(progress), progress
+
+        post_parameters = {"label": label, "name": name}
+        content_type = content_type if content_type is not NotSet else Consts.defaultMediaType
+        headers = {"Content-Type": content_type}
+
+        resp_headers, data = self._requester.requestStreamAndCheck(
+            "POST",
+            self.upload_url.split("{?")[0],
+            parameters=post_parameters,
+            headers=headers,
+            chunks=chunks,
+            size=size,
+            progress=progress,
+        )
+        return github.GitReleaseAsset.GitReleaseAsset(self._requester, resp_headers, data, completed=True)
+
+    def upload_assets(
+        self,
+        paths: list[str],
+        max_workers: int = 4,
+        progress: Callable[[str, UploadProgress], None] | None = None,
+        resume: bool = False,
+        chunk_size: int = Consts.DEFAULT_CHUNK_SIZE,
+    ) -> list[github.GitReleaseAsset.GitReleaseAsset]:
+        """
+        Uploads the files at the given paths as assets named after the files, up to ``max_workers`` at a time.
+
+        With ``resume=True``, assets that have been uploaded completely before with the same name and size are not
+        uploaded again, and assets left over by failed uploads are replaced.
+        :calls: `POST https://<upload_url>/repos/{owner}/{repo}/releases/{release_id}/assets <https://docs.github.com/en/rest/reference/repos#upload-a-release-asset>`_
+        :param paths: list of paths of files to upload
+        :param max_workers: int, number of concurrent uploads
+        :param progress: callable, called with the asset name and a :class:`github.Requester.UploadProgress`
+        :param resume: bool
+        :param chunk_size: int, size of the chunks in bytes the files are read in
+        :rtype: list of :class:`github.GitReleaseAsset.GitReleaseAsset` in the order of ``paths``
+
+        """
+        assert isinstance(paths, list) and all(isinstance(path, str) for path in paths), paths
+        assert isinstance(max_workers, int) and max_workers > 0, max_workers
+        assert progress is None or callable(progress), progress
+
+        existing: dict[str, github.GitReleaseAsset.GitReleaseAsset] = {}
+        if resume:
+            existing = {asset.name: asset for asset in self.get_assets()}
+
+        def read(path: str) -> Iterator[bytes]:
+            with open(path, "rb") as f:
+                yield from iter(lambda: f.read(chunk_size), b"")
+
+        def upload(path: str) -> github.GitReleaseAsset.GitReleaseAsset:
+            name = basename(path)
+            size = os.path.getsize(path)
+            asset = existing.get(name)
+            if asset is not None:
+                if asset.state == "uploaded" and asset.size == size:
+                    return asset
+                # the name of an asset cannot be reused before it is deleted
+                asset.delete_asset()
+
+            content_type = mimetypes.guess_type(path)[0] or Consts.defaultMediaType
+            return self.upload_asset_from_stream(
+                read(path),
+                size,
+                name,
+                content_type=content_type,
+                progress=(lambda p: progress(name, p)) if progress is not None else None,
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(upload, paths))
+
     def get_assets(self) -> PaginatedList[github.GitReleaseAsset.GitReleaseAsset]:
         """
         :calls: `GET /repos/{owner}/{repo}/releases/{release_id}/assets <https://docs.github.com/en/rest/reference/repos#list-release-assets>`_
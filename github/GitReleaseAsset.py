@@ -40,9 +40,10 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any
+from typing import Any, BinaryIO, Iterator
 
 import github.NamedUser
+from github import Consts
 from github.GithubObject import Attribute, CompletableGithubObject, NotSet
 
 
@@ -149,6 +150,32 @@ class GitReleaseAsset(CompletableGithubObject):
         headers, data = self._requester.requestJsonAndCheck("PATCH", self.url, input=post_parameters)
         return GitReleaseAsset(self._requester, headers, data, completed=True)
 
+    def download_to(
+        self, path_or_fileobj: str | BinaryIO, chunk_size: int = Consts.DEFAULT_CHUNK_SIZE, resume: bool = False
+    ) -> str:
+        """
+        :calls: `GET /repos/{owner}/{repo}/releases/assets/{asset_id} <https://docs.github.com/en/rest/releases/assets#get-a-release-asset>`_
+        :param path_or_fileobj: path of the file to write, or binary file object
+        :param chunk_size: size of the chunks in bytes the asset is downloaded in
+        :param resume: complete a file at the given path partially downloaded with resume before, unless the
+            content has changed since
+        :rtype: string, the SHA-256 hex digest of the asset
+        """
+        return self._requester.getFile(
+            self.url, path_or_fileobj, {"Accept": "application/octet-stream"}, chunk_size, resume
+        )
+
+    def download_stream(self, chunk_size: int = Consts.DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        :calls: `GET /repos/{owner}/{repo}/releases/assets/{asset_id} <https://docs.github.com/en/rest/releases/assets#get-a-release-asset>`_
+        :param chunk_size: size of the chunks in bytes the asset is downloaded in
+        :rtype: iterator of bytes
+        """
+        status, headers, chunks = self._requester.getStream(
+            self.url, {"Accept": "application/octet-stream"}, chunk_size
+        )
+        return chunks
+
     def _useAttributes(self, attributes: dict[str, Any]) -> None:
         if "url" in attributes:  # pragma no branch
             self._url = self._makeStringAttribute(attributes["url"])
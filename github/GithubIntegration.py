@@ -30,7 +30,8 @@ from __future__ import annotations
 
 import urllib.parse
 import warnings
-from typing import Any
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, NamedTuple
 
 import deprecated
 import urllib3
@@ -39,14 +40,28 @@ from urllib3 import Retry
 import github
 from github import Consts
 from github.Auth import AppAuth
+from github.Cache import Cache
 from github.GithubApp import GithubApp
 from github.GithubException import GithubException
 from github.Installation import Installation
 from github.InstallationAuthorization import InstallationAuthorization
 from github.PaginatedList import PaginatedList
+from github.RequestScheduler import INTERACTIVE, PRIORITIES
 from github.Requester import Requester
 
 
+class InstallationResult(NamedTuple):
+    """
+    The result of a function run for an installation by :meth:`GithubIntegration.fan_out`.
+    """
+
+    installation: Installation
+    # the value returned by the function, None if it raised
+    result: Any
+    # the exception raised by the function, if any
+    exception: Exception | None
+
+
 class GithubIntegration:
     """
     Main class to obtain tokens for a GitHub integration.
@@ -80,6 +95,11 @@ class GithubIntegration:
         jwt_issued_at: int = Consts.DEFAULT_JWT_ISSUED_AT,
         jwt_algorithm: str = Consts.DEFAULT_JWT_ALGORITHM,
         auth: AppAuth | None = None,
+        cache: Cache | None = None,
+        priority: str = INTERACTIVE,
+        lazy_attributes: bool = False,
+        identity_map: bool = False,
+        coalesce_requests: bool = False,
     ) -> None:
         """
         :param integration_id: int deprecated, use auth=github.Auth.AppAuth(...) instead
@@ -97,6 +117,15 @@ class GithubIntegration:
         :param jwt_issued_at: int deprecated, use auth=github.Auth.AppAuth(...) instead
         :param jwt_algorithm: string deprecated, use auth=github.Auth.AppAuth(...) instead
         :param auth: authentication method
+        :param cache: github.Cache.Cache to revalidate GET responses with conditional requests
+        :param priority: string, github.RequestScheduler.INTERACTIVE or github.RequestScheduler.BATCH, batch requests
+                         are spread over the rate limit window and leave some rate limit to interactive requests
+                         and wait for the reset of an exhausted rate limit, interactive requests raise
+                         RateLimitExceededException instead
+        :param lazy_attributes: bool, decode attributes of returned objects on first access rather than on creation
+        :param identity_map: bool, share nested objects with the same url, e.g. the users of a list of issues, so
+                             that they are created and completed only once
+        :param coalesce_requests: bool, let concurrent identical GET requests of multiple threads share one response
         """
         if integration_id is not None:
             assert isinstance(integration_id, (int, str)), integration_id
@@ -114,6 +143,11 @@ class GithubIntegration:
         assert isinstance(jwt_expiry, int), jwt_expiry
         assert Consts.MIN_JWT_EXPIRY <= jwt_expiry <= Consts.MAX_JWT_EXPIRY, jwt_expiry
         assert isinstance(jwt_issued_at, int)
+        assert cache is None or isinstance(cache, Cache), cache
+        assert priority in PRIORITIES, priority
+        assert isinstance(lazy_attributes, bool), lazy_attributes
+        assert isinstance(identity_map, bool), identity_map
+        assert isinstance(coalesce_requests, bool), coalesce_requests
 
         self.base_url = base_url
 
@@ -154,6 +188,11 @@ class GithubIntegration:
             pool_size=pool_size,
             seconds_between_requests=seconds_between_requests,
             seconds_between_writes=seconds_between_writes,
+            cache=cache,
+            priority=priority,
+            lazy_attributes=lazy_attributes,
+            identity_map=identity_map,
+            coalesce_requests=coalesce_requests,
         )
 
     def close(self) -> None:
@@ -264,6 +303,46 @@ class GithubIntegration:
             list_item="installations",
         )
 
+    def fan_out(
+        self,
+        func: Callable[[Installation, github.Github], Any],
+        installations: Iterable[Installation] | None = None,
+        max_workers: int = 16,
+    ) -> list[InstallationResult]:
+        """
+        Runs a function for each installation of the app, with up to ``max_workers`` installations at a time.
+
+        The function is called with the installation and a :class:`github.Github` authenticated as that
+        installation. Installation tokens are obtained concurrently by the first request of each installation, and
+        the rate limit of each installation is respected separately. All installations share the connection pool of
+        this integration.
+
+        Exceptions raised by the function are returned, so that failing installations do not stop the others::
+
+            for r in integration.fan_out(lambda installation, g: len(list(installation.get_repos()))):
+                if r.exception is None:
+                    print(r.installation.id, r.result)
+
+        :param func: the function to run per installation
+        :param installations: the installations to run the function for, all installations of the app by default
+        :param max_workers: the maximum number of installations to run the function for concurrently
+        :return: the results in the order of the installations
+        """
+        assert isinstance(max_workers, int) and max_workers > 0, max_workers
+        if installations is None:
+            installations = self.get_installations()
+
+        def run(installation: Installation) -> InstallationResult:
+            # authenticates as the installation and shares the connection pool, see ConnectionPool
+            g = installation.get_github_for_installation()
+            try:
+                return InstallationResult(installation, func(installation, g), None)
+            except Exception as e:
+                return InstallationResult(installation, None, e)
+
+        with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="fan_out") as executor:
+            return list(executor.map(run, installations))
+
     def get_org_installation(self, org: str) -> Installation:
         """
         :calls: `GET /orgs/{org}/installation <https://docs.github.com/en/rest/apps/apps#get-an-organization-installation-for-the-authenticated-app>`
@@ -50,7 +50,7 @@ import typing
 from datetime import datetime, timezone
 from decimal import Decimal
 from operator import itemgetter
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple, Type, Union
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, List, Optional, Sequence, Tuple, Type, Union
 
 from typing_extensions import Protocol, TypeGuard
 
@@ -67,6 +67,8 @@ T_gh = typing.TypeVar("T_gh", bound="GithubObject")
 
 
 class Attribute(Protocol[T_co]):
+    __slots__ = ()
+
     @property
     def value(self) -> T_co:
         raise NotImplementedError
@@ -138,6 +140,9 @@ def is_optional_list(v: Any, type: Union[Type, Tuple[Type, ...]]) -> bool:
 
 
 class _ValuedAttribute(Attribute[T]):
+    # objects have one attribute instance per attribute, so these are kept as small as possible
+    __slots__ = ("_value",)
+
     def __init__(self, value: T):
         self._value = value
 
@@ -146,7 +151,15 @@ class _ValuedAttribute(Attribute[T]):
         return self._value
 
 
+# attributes are immutable, so those of the most frequent values are shared
+_NoneAttribute: Attribute[Any] = _ValuedAttribute(None)
+_TrueAttribute: Attribute[bool] = _ValuedAttribute(True)
+_FalseAttribute: Attribute[bool] = _ValuedAttribute(False)
+
+
 class _BadAttribute(Attribute):
+    __slots__ = ("__value", "__expectedType", "__exception")
+
     def __init__(self, value: Any, expectedType: Any, exception: Optional[Exception] = None):
         self.__value = value
         self.__expectedType = expectedType
@@ -170,6 +183,8 @@ class GithubObject:
     CHECK_AFTER_INIT_FLAG = False
     _url: Attribute[str]
 
+    __unset_attributes: Dict[type, Optional[FrozenSet[str]]] = {}
+
     @classmethod
     def setCheckAfterInitFlag(cls, flag: bool) -> None:
         cls.CHECK_AFTER_INIT_FLAG = flag
@@ -182,21 +197,98 @@ class GithubObject:
         completed: bool,
     ):
         self._requester = requester
-        self._initAttributes()
-        self._storeAndUseAttributes(headers, attributes)
+        if requester is not None and requester.lazy_attributes:
+            # attributes are decoded from _rawData when first accessed, see __getattr__
+            self._headers = headers
+            self._rawData = attributes
+            self.__materialized = False
+        else:
+            self.__materialized = True
+            self.__initAttributes()
+            self._storeAndUseAttributes(headers, attributes)
 
         # Ask requester to do some checking, for debug and test purpose
         # Since it's most handy to access and kinda all-knowing
         if self.CHECK_AFTER_INIT_FLAG:  # pragma no branch (Flag always set in tests)
             requester.check_me(self)
 
+    @classmethod
+    def __unsetAttributes(cls) -> Optional[FrozenSet[str]]:
+        """
+        Returns the names of the attributes that _initAttributes sets to NotSet, or None if it sets other values.
+
+        Those attributes are not stored in objects until they are set, which keeps the objects small.
+
+        """
+        names = GithubObject.__unset_attributes.get(cls, NotSet)
+        if isinstance(names, _NotSetType):
+            # objects of cls initialize all attributes until the probe has finished
+            GithubObject.__unset_attributes[cls] = None
+            probe = cls.__new__(cls)
+            try:
+                probe._initAttributes()
+                initialized = probe.__dict__
+            except Exception:
+                initialized = {}
+            if initialized and all(value is NotSet for value in initialized.values()):
+                names = frozenset(initialized)
+            else:
+                names = None
+            GithubObject.__unset_attributes[cls] = names
+        return names
+
+    def __initAttributes(self) -> None:
+        if self.__unsetAttributes() is None:
+            self._initAttributes()
+
     def _storeAndUseAttributes(self, headers: Dict[str, Union[str, int]], attributes: Any) -> None:
+        # New attributes are used on top of the existing attributes, so all of those have to be decoded first
+        if not self.__materialized:
+            self.__materialize()
         # Make sure headers are assigned before calling _useAttributes
         # (Some derived classes will use headers in _useAttributes)
         self._headers = headers
         self._rawData = attributes
         self._useAttributes(attributes)
 
+    if not TYPE_CHECKING:
+        # hidden from type checkers, which would otherwise accept any attribute of any GithubObject
+
+        def __getattr__(self, name: str) -> Any:
+            # only called for attributes that are not stored: undecoded attributes of lazy objects and unset attributes
+            if name.startswith("_") and not name.startswith("__"):
+                state = self.__dict__
+                if not state.get("_GithubObject__materialized", True):
+                    # attribute _foo is usually decoded from key foo alone
+                    key = name[1:]
+                    rawData = state["_rawData"]
+                    if isinstance(rawData, dict) and key in rawData:
+                        assigned = dict(state)
+                        self._useAttributes({key: rawData[key]})
+                        # other attributes decoded alongside may depend on further keys, those are decoded when accessed
+                        for other in [other for other in state if other != name and other not in assigned]:
+                            state.pop(other, None)
+                        state.update(assigned)
+                        if name in state:
+                            return state[name]
+
+                    self.__materialize()
+                    if name in state:
+                        return state[name]
+
+                names = self.__unsetAttributes()
+                if names is not None and name in names:
+                    return NotSet
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'")
+
+    def __materialize(self) -> None:
+        # decodes all attributes, attributes that have been set since creation (e.g. by edit) are retained
+        assigned = dict(self.__dict__)
+        self.__initAttributes()
+        self._useAttributes(self._rawData)
+        self.__dict__.update(assigned)
+        self.__materialized = True
+
     @property
     def raw_data(self) -> Dict[str, Any]:
         """
@@ -219,7 +311,13 @@ class GithubObject:
 
     @staticmethod
     def __makeSimpleAttribute(value: Any, type: Type[T]) -> Attribute[T]:
-        if value is None or isinstance(value, type):
+        if value is None:
+            return _NoneAttribute
+        elif value is True and type is bool:
+            return _TrueAttribute  # type: ignore
+        elif value is False and type is bool:
+            return _FalseAttribute  # type: ignore
+        elif isinstance(value, type):
             return _ValuedAttribute(value)  # type: ignore
         else:
             return _BadAttribute(value, type)  # type: ignore
@@ -234,7 +332,7 @@ class GithubObject:
     @staticmethod
     def __makeTransformedAttribute(value: T, type: Type[T], transform: Callable[[T], K]) -> Attribute[K]:
         if value is None:
-            return _ValuedAttribute(None)  # type: ignore
+            return _NoneAttribute
         elif isinstance(value, type):
             try:
                 return _ValuedAttribute(transform(value))
@@ -287,9 +385,19 @@ class GithubObject:
         return GithubObject.__makeTransformedAttribute(
             value,
             dict,
-            lambda value: klass(self._requester, self._headers, value, completed=False),
+            lambda value: self.__makeNestedObject(klass, value),
         )
 
+    def __makeNestedObject(self, klass: Type[T_gh], value: Any) -> T_gh:
+        def create() -> T_gh:
+            return klass(self._requester, self._headers, value, completed=False)
+
+        # completable objects are identified by their url, and can be shared through the identity map of the requester
+        url = value.get("url")
+        if self._requester is None or not issubclass(klass, CompletableGithubObject) or not isinstance(url, str):
+            return create()
+        return self._requester.sharedObject((klass, url), create)
+
     @staticmethod
     def _makeListOfStringsAttribute(value: Union[List[List[str]], List[str], List[Union[str, int]]]) -> Attribute:
         return GithubObject.__makeSimpleListAttribute(value, str)
@@ -312,9 +420,7 @@ class GithubObject:
 
     def _makeListOfClassesAttribute(self, klass: Type[T_gh], value: Any) -> Attribute[List[T_gh]]:
         if isinstance(value, list) and all(isinstance(element, dict) for element in value):
-            return _ValuedAttribute(
-                [klass(self._requester, self._headers, element, completed=False) for element in value]
-            )
+            return _ValuedAttribute([self.__makeNestedObject(klass, element) for element in value])
         else:
             return _BadAttribute(value, [dict])
 
@@ -329,9 +435,7 @@ class GithubObject:
         if isinstance(value, dict) and all(
             isinstance(key, str) and isinstance(element, dict) for key, element in value.items()
         ):
-            return _ValuedAttribute(
-                {key: klass(self._requester, self._headers, element, completed=False) for key, element in value.items()}
-            )
+            return _ValuedAttribute({key: self.__makeNestedObject(klass, element) for key, element in value.items()})
         else:
             return _BadAttribute(value, {str: dict})
 
@@ -418,6 +522,12 @@ class CompletableGithubObject(GithubObject):
         if not self.__completed:
             self.__complete()
 
+    def _needsCompletion(self, attributes: Optional[Sequence[str]] = None) -> bool:
+        # Returns True if the object has not been completed and any of the given attributes (all if None) is not set
+        if self.__completed:
+            return False
+        return attributes is None or any(is_undefined(getattr(self, f"_{name}", NotSet)) for name in attributes)
+
     def __complete(self) -> None:
         if self._url.value is None:
             raise IncompletableObject(400, message="Returned object contains no URL")
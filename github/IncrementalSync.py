@@ -0,0 +1,200 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from datetime import datetime
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterator, NamedTuple, Optional, Sequence, Type, Union
+
+import github.Commit
+import github.Issue
+import github.IssueComment
+from github import Consts
+from github.GithubObject import GithubObject
+from github.PaginatedList import PaginatedList
+
+if TYPE_CHECKING:
+    from github.Repository import Repository
+
+# Issues, including pull requests, by updated_at
+ISSUES = "issues"
+# Comments on issues and pull requests, by updated_at
+ISSUE_COMMENTS = "issue_comments"
+# Commits of the default branch, by commit date
+COMMITS = "commits"
+RESOURCES = (ISSUES, ISSUE_COMMENTS, COMMITS)
+
+# The record has been created or updated
+UPSERT = "upsert"
+# The record has been deleted, only reported by full syncs
+DELETE = "delete"
+
+
+class _Resource(NamedTuple):
+    klass: Type[GithubObject]
+    path: str
+    parameters: Dict[str, Any]
+    key: Callable[[Any], Union[int, str]]
+    timestamp: Callable[[Any], datetime]
+
+
+_RESOURCES = {
+    ISSUES: _Resource(
+        github.Issue.Issue,
+        "/issues",
+        {"state": "all", "sort": "updated", "direction": "asc"},
+        lambda issue: issue.id,
+        lambda issue: issue.updated_at,
+    ),
+    ISSUE_COMMENTS: _Resource(
+        github.IssueComment.IssueComment,
+        "/issues/comments",
+        {"sort": "updated", "direction": "asc"},
+        lambda comment: comment.id,
+        lambda comment: comment.updated_at,
+    ),
+    COMMITS: _Resource(
+        github.Commit.Commit,
+        "/commits",
+        {},
+        lambda commit: commit.sha,
+        lambda commit: commit.commit.committer.date,
+    ),
+}
+
+
+class SyncDelta(NamedTuple):
+    """
+    A change of a record of a repository, as returned by :meth:`IncrementalSync.sync`.
+    """
+
+    # url of the repository
+    repository: str
+    # one of RESOURCES
+    resource: str
+    # UPSERT or DELETE
+    operation: str
+    # id of issues and comments, sha of commits
+    key: Union[int, str]
+    # the created or updated record, None for deletes
+    record: Optional[GithubObject]
+
+
+class IncrementalSync:
+    """
+    This class synchronizes issues (including pull requests), issue comments and commits of repositories
+    incrementally.
+
+    For each resource of a repository, the sync keeps a high-water mark, the latest ``updated_at`` (or commit date)
+    seen, and only requests records changed since through the ``since`` parameter. The first page is requested
+    conditionally with the ``ETag`` of the previous response, so resources that have not changed cost a
+    ``304 Not Modified`` response that does not count against the rate limit.
+
+    Incremental listings do not report deleted records. With ``track_deletes``, the keys of all records are kept in
+    the state, and a ``full`` sync returns DELETE deltas for records that are not listed anymore.
+
+    The state is a dict that can be serialized as JSON to persist it between runs. The state of a resource is updated
+    once all of its deltas have been consumed, so an interrupted sync returns the unconsumed deltas again.
+
+    """
+
+    def __init__(
+        self,
+        state: Optional[Dict[str, Any]] = None,
+        resources: Sequence[str] = RESOURCES,
+        track_deletes: bool = False,
+    ):
+        assert state is None or isinstance(state, dict), state
+        assert all(resource in RESOURCES for resource in resources), resources
+        assert isinstance(track_deletes, bool), track_deletes
+        self.__state: Dict[str, Any] = {} if state is None else state
+        self.__resources = tuple(resources)
+        self.__track_deletes = track_deletes
+
+    @property
+    def state(self) -> Dict[str, Any]:
+        """
+        :type: dict
+        """
+        return self.__state
+
+    def sync(self, repository: "Repository", full: bool = False) -> Iterator[SyncDelta]:
+        """
+        Returns the changes of the given repository since the last sync, all records on the first sync.
+
+        :param repository: :class:`github.Repository.Repository`, e.g. from ``Github.get_repo(full_name, lazy=True)``
+        :param full: list all records instead of the changes, and return DELETE deltas with ``track_deletes``
+        """
+        for resource in self.__resources:
+            yield from self.__syncResource(repository, resource, full)
+
+    def __syncResource(self, repository: "Repository", resource: str, full: bool) -> Iterator[SyncDelta]:
+        definition = _RESOURCES[resource]
+        requester = repository._requester
+        url = f"{repository.url}{definition.path}"
+        state = self.__state.get(repository.url, {}).get(resource)
+        incremental = not full and state is not None
+
+        parameters = dict(definition.parameters)
+        if requester.per_page != 30:
+            parameters["per_page"] = requester.per_page
+        headers = {}
+        if incremental:
+            if state["since"] is not None:
+                parameters["since"] = state["since"]
+            if state["etag"] is not None:
+                headers[Consts.REQ_IF_NONE_MATCH] = state["etag"]
+
+        status, responseHeaders, output = requester.requestJson("GET", url, parameters=parameters, headers=headers)
+        if status == 304:
+            return
+        responseHeaders, data = requester._check(status, responseHeaders, output)
+        records = PaginatedList(
+            definition.klass, requester, url, parameters, firstData=data or [], firstHeaders=responseHeaders
+        )
+        # the first page only tells about later pages if there are none
+        etag = responseHeaders.get(Consts.RES_ETAG) if not records._couldGrow() else None
+
+        # since is inclusive, records at the mark have been returned before unless they changed
+        since = state["since"] if incremental else None
+        since_keys = set(state["since_keys"]) if incremental else set()
+        mark, mark_keys = since, set(since_keys)
+        listed = set()
+        for record in records:
+            key = definition.key(record)
+            timestamp = definition.timestamp(record).strftime("%Y-%m-%dT%H:%M:%SZ")
+            listed.add(key)
+            if timestamp == since and key in since_keys:
+                continue
+            if mark is None or timestamp > mark:
+                mark, mark_keys = timestamp, {key}
+            elif timestamp == mark:
+                mark_keys.add(key)
+            yield SyncDelta(repository.url, resource, UPSERT, key, record)
+
+        newState: Dict[str, Any] = {"since": mark, "since_keys": sorted(mark_keys), "etag": etag}
+        if self.__track_deletes:
+            known = set(state.get("keys", [])) if state is not None else set()
+            if incremental:
+                newState["keys"] = sorted(known | listed)
+            else:
+                for key in sorted(known - listed):
+                    yield SyncDelta(repository.url, resource, DELETE, key, None)
+                newState["keys"] = sorted(listed)
+        self.__state.setdefault(repository.url, {})[resource] = newState
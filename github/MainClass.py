@@ -94,7 +94,7 @@ import pickle
 import urllib.parse
 import warnings
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, BinaryIO, TypeVar
+from typing import TYPE_CHECKING, Any, BinaryIO, Callable, TypeVar
 
 import urllib3
 from urllib3.util import Retry
@@ -102,6 +102,8 @@ from urllib3.util import Retry
 import github.ApplicationOAuth
 import github.Auth
 import github.AuthenticatedUser
+import github.BatchCompletion
+import github.Cache
 import github.Enterprise
 import github.Event
 import github.Gist
@@ -112,6 +114,7 @@ import github.GitignoreTemplate
 import github.GlobalAdvisory
 import github.License
 import github.NamedUser
+import github.RequestScheduler
 import github.Topic
 from github import Consts
 from github.GithubIntegration import GithubIntegration
@@ -119,7 +122,7 @@ from github.GithubObject import GithubObject, NotSet, Opt, is_defined
 from github.GithubRetry import GithubRetry
 from github.HookDelivery import HookDelivery, HookDeliverySummary
 from github.HookDescription import HookDescription
-from github.PaginatedList import PaginatedList
+from github.PaginatedList import GraphqlPaginatedList, PaginatedList
 from github.RateLimit import RateLimit
 from github.Requester import Requester
 
@@ -179,6 +182,11 @@ class Github:
         seconds_between_requests: float | None = Consts.DEFAULT_SECONDS_BETWEEN_REQUESTS,
         seconds_between_writes: float | None = Consts.DEFAULT_SECONDS_BETWEEN_WRITES,
         auth: github.Auth.Auth | None = None,
+        cache: github.Cache.Cache | None = None,
+        priority: str = github.RequestScheduler.INTERACTIVE,
+        lazy_attributes: bool = False,
+        identity_map: bool = False,
+        coalesce_requests: bool = False,
     ) -> None:
         """
         :param login_or_token: string deprecated, use auth=github.Auth.Login(...) or auth=github.Auth.Token(...) instead
@@ -197,6 +205,15 @@ class Github:
         :param seconds_between_requests: float
         :param seconds_between_writes: float
         :param auth: authentication method
+        :param cache: github.Cache.Cache to revalidate GET responses with conditional requests
+        :param priority: string, github.RequestScheduler.INTERACTIVE or github.RequestScheduler.BATCH, batch requests
+                         are spread over the rate limit window and leave some rate limit to interactive requests
+                         and wait for the reset of an exhausted rate limit, interactive requests raise
+                         RateLimitExceededException instead
+        :param lazy_attributes: bool, decode attributes of returned objects on first access rather than on creation
+        :param identity_map: bool, share nested objects with the same url, e.g. the users of a list of issues, so
+                             that they are created and completed only once
+        :param coalesce_requests: bool, let concurrent identical GET requests of multiple threads share one response
         """
 
         assert login_or_token is None or isinstance(login_or_token, str), login_or_token
@@ -212,6 +229,11 @@ class Github:
         assert seconds_between_requests is None or seconds_between_requests >= 0
         assert seconds_between_writes is None or seconds_between_writes >= 0
         assert auth is None or isinstance(auth, github.Auth.Auth), auth
+        assert cache is None or isinstance(cache, github.Cache.Cache), cache
+        assert priority in github.RequestScheduler.PRIORITIES, priority
+        assert isinstance(lazy_attributes, bool), lazy_attributes
+        assert isinstance(identity_map, bool), identity_map
+        assert isinstance(coalesce_requests, bool), coalesce_requests
 
         if password is not None:
             warnings.warn(
@@ -252,6 +274,11 @@ class Github:
             pool_size,
             seconds_between_requests,
             seconds_between_writes,
+            cache,
+            priority,
+            lazy_attributes,
+            identity_map,
+            coalesce_requests,
         )
 
     def close(self) -> None:
@@ -376,6 +403,18 @@ class Github:
         headers, data = self.__requester.requestJsonAndCheck("GET", f"/user/{user_id}")
         return github.NamedUser.NamedUser(self.__requester, headers, data, completed=True)
 
+    def lookup_users(self, logins: list[str]) -> list[NamedUser | None]:
+        """
+        :calls: `POST /graphql <https://docs.github.com/en/graphql>`_
+        Looks up many users with few GraphQL queries of up to 100 aliased ``user`` fields each.
+        Attributes not returned by the query are completed through REST on access.
+
+        :param logins: list of logins
+        :rtype: list of :class:`github.NamedUser.NamedUser`, None where the user cannot be found
+
+        """
+        return github.BatchCompletion.lookup_users(self.__requester, logins)
+
     def get_users(self, since: Opt[int] = NotSet) -> PaginatedList[NamedUser]:
         """
         :calls: `GET /users <https://docs.github.com/en/rest/reference/users>`_
@@ -432,6 +471,18 @@ class Github:
         headers, data = self.__requester.requestJsonAndCheck("GET", url)
         return github.Repository.Repository(self.__requester, headers, data, completed=True)
 
+    def lookup_repos(self, full_names: list[str]) -> list[Repository | None]:
+        """
+        :calls: `POST /graphql <https://docs.github.com/en/graphql>`_
+        Looks up many repositories with few GraphQL queries of up to 100 aliased ``repository`` fields each.
+        Attributes not returned by the query are completed through REST on access.
+
+        :param full_names: list of full names like ``PyGithub/PyGithub``
+        :rtype: list of :class:`github.Repository.Repository`, None where the repository cannot be found
+
+        """
+        return github.BatchCompletion.lookup_repos(self.__requester, full_names)
+
     def get_repos(
         self,
         since: Opt[int] = NotSet,
@@ -984,6 +1035,55 @@ class Github:
         """
         return self.create_from_raw_data(*pickle.load(f))
 
+    def resume_paginated_list(
+        self,
+        cursor: dict[str, Any],
+        attributesTransformer: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ) -> PaginatedList[Any]:
+        """
+        Continues a paginated list from a cursor previously obtained by :meth:`PaginatedList.checkpoint`, e.g. after
+        a restart.
+
+        :param cursor: dict
+        :param attributesTransformer: the attributes transformer of the original list, if any
+        :rtype: :class:`PaginatedList`
+
+        """
+        return PaginatedList.resume(self.__requester, cursor, attributesTransformer)
+
+    def get_graphql_connection(
+        self,
+        klass: type[TGithubObject],
+        connection: list[str],
+        nodes: str,
+        variables: dict[str, Any] | None = None,
+        page_size: int = 100,
+        attributesTransformer: Callable[[dict[str, Any]], dict[str, Any]] | None = None,
+    ) -> GraphqlPaginatedList[TGithubObject]:
+        """
+        :calls: `POST /graphql <https://docs.github.com/en/graphql>`_
+        :param klass: the class of the nodes, e.g. :class:`github.PullRequest.PullRequest`
+        :param connection: the fields leading to the connection, e.g.
+            ``["repository(owner: $owner, name: $name)", "pullRequests(states: OPEN)"]``
+        :param nodes: the selection of the nodes, nested connections like reviews, labels or commits are returned
+            in the same request
+        :param variables: the variables used by the arguments of the fields
+        :param page_size: the number of nodes per page, at most 100
+        :param attributesTransformer: a function transforming the selected fields into the attributes of the objects
+        :rtype: :class:`github.PaginatedList.GraphqlPaginatedList`
+
+        """
+        assert isinstance(nodes, str), nodes
+        assert variables is None or isinstance(variables, dict), variables
+        return GraphqlPaginatedList(
+            klass,
+            self.__requester,
+            GraphqlPaginatedList.connection_query(connection, nodes, variables, page_size),
+            variables or {},
+            GraphqlPaginatedList.connection_path(connection),
+            attributesTransformer,
+        )
+
     def get_oauth_application(self, client_id: str, client_secret: str) -> ApplicationOAuth:
         return github.ApplicationOAuth.ApplicationOAuth(
             self.__requester,
@@ -49,9 +49,12 @@
 #                                                                              #
 ################################################################################
 
-from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Type, TypeVar, Union
-from urllib.parse import parse_qs
+import importlib
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Generic, Iterator, List, Optional, Tuple, Type, TypeVar, Union
+from urllib.parse import parse_qs, urlencode, urlparse
 
+import github.Columns
 from github.GithubObject import GithubObject
 from github.Requester import Requester
 
@@ -143,6 +146,30 @@ class PaginatedList(PaginatedListBase[T]):
 
         some_repos = user.get_repos().get_page(0)
         some_other_repos = user.get_repos().get_page(3)
+
+    Large lists can be fetched faster by requesting subsequent pages concurrently, while elements are still
+    enumerated in order::
+
+        for issue in repo.get_issues(state="all").prefetch(max_workers=8):
+            print(issue.title)
+
+    Exports that only need the data of the elements can skip creating objects::
+
+        for issue in repo.get_issues(state="all").iter_raw():
+            print(issue["title"])
+
+    Selected fields can be exported into typed columns, e.g. pyarrow arrays when pyarrow is installed::
+
+        columns = repo.get_issues(state="all").to_columns(["number", "created_at", "user.login"])
+
+    Long-running crawlers can persist their progress and continue after a restart::
+
+        issues = repo.get_issues(state="all")
+        for index, issue in enumerate(issues):
+            process(issue)
+            save(issues.checkpoint(index + 1))
+
+        issues = g.resume_paginated_list(load())
     """
 
     def __init__(
@@ -163,15 +190,29 @@ class PaginatedList(PaginatedListBase[T]):
         self.__firstUrl = firstUrl
         self.__firstParams = firstParams or ()
         self.__nextUrl = firstUrl
+        # url of the first page to iterate, the last page for reversed lists
+        self.__startUrl = firstUrl
         self.__nextParams = firstParams or {}
         self.__headers = headers
         self.__list_item = list_item
         self.__total_count_item = total_count_item
         if self.__requester.per_page != 30:
             self.__nextParams["per_page"] = self.__requester.per_page
+        self.__startParams = self.__nextParams
+        # elements of the first page to drop, when resuming within a page
+        self.__startSkip = 0
+        self.__skip = 0
+        # number of elements of the pages fetched so far
+        self.__fetched = 0
+        # index of the first element, url and params of the page fetched last
+        self.__page: Tuple[int, str, Any] = (0, self.__nextUrl, self.__nextParams)
         self._reversed = False
         self.__totalCount: Optional[int] = None
         self._attributesTransformer = attributesTransformer
+        self.__lastUrl: Optional[str] = None
+        self.__prefetchWorkers: Optional[int] = None
+        self.__prefetchExecutor: Optional[ThreadPoolExecutor] = None
+        self.__prefetchedPages: Dict[int, "Future[Tuple[Dict[str, Any], Any]]"] = {}
 
         first_page = []
         if firstData is not None and firstHeaders is not None:
@@ -202,7 +243,7 @@ class PaginatedList(PaginatedListBase[T]):
                 else:
                     self.__totalCount = 0
             else:
-                links = self.__parseLinkHeader(headers)
+                links = self._parseLinkHeader(headers)
                 lastUrl = links.get("last")
                 if lastUrl:
                     self.__totalCount = int(parse_qs(lastUrl)["page"][0])
@@ -214,7 +255,7 @@ class PaginatedList(PaginatedListBase[T]):
         headers, data = self.__requester.requestJsonAndCheck(
             "GET", self.__firstUrl, parameters=self.__nextParams, headers=self.__headers
         )
-        links = self.__parseLinkHeader(headers)
+        links = self._parseLinkHeader(headers)
         return links.get("last")
 
     @property
@@ -236,40 +277,266 @@ class PaginatedList(PaginatedListBase[T]):
         lastUrl = self._getLastPageUrl()
         if lastUrl:
             self.__nextUrl = lastUrl
+            self.__startUrl = lastUrl
+
+    def prefetch(self, max_workers: int = 4) -> "PaginatedList[T]":
+        """
+        Returns a copy of this list that requests up to ``max_workers`` subsequent pages concurrently.
+
+        Once the first page is known, pages are fetched ahead through ``page=`` urls of the last page link.
+        Elements are still returned in order. Lists that are paginated by cursor rather than by page number,
+        or reversed lists, are fetched page by page.
+        """
+        assert isinstance(max_workers, int) and max_workers > 0, max_workers
+        r = PaginatedList(
+            self.__contentClass,
+            self.__requester,
+            self.__firstUrl,
+            self.__firstParams,
+            self.__headers,
+            self.__list_item,
+            self.__total_count_item,
+            attributesTransformer=self._attributesTransformer,
+        )
+        r._reversed = self._reversed
+        r.__nextUrl = r.__startUrl = self.__startUrl
+        r.__nextParams = r.__startParams = self.__startParams
+        r.__skip = r.__startSkip = self.__startSkip
+        r.__prefetchWorkers = max_workers
+        return r
+
+    def iter_raw(self) -> Iterator[Dict[str, Any]]:
+        """
+        Iterates the elements of this list as the dicts decoded from the responses, without creating objects.
+
+        Pages are requested anew, like a reversed or prefetching list. Elements are not cached by this list.
+        """
+        for _, elements in self.iter_raw_pages():
+            yield from elements
+
+    def iter_raw_pages(self) -> Iterator[Tuple[Dict[str, Any], List[Dict[str, Any]]]]:
+        """
+        Iterates the pages of this list as tuples of the response headers and the dicts of the elements of the page,
+        without creating objects.
+        """
+        r = PaginatedList(
+            self.__contentClass,
+            self.__requester,
+            self.__firstUrl,
+            self.__firstParams,
+            self.__headers,
+            self.__list_item,
+            self.__total_count_item,
+        )
+        r._reversed = self._reversed
+        r.__nextUrl = self.__startUrl
+        r.__nextParams = self.__startParams
+        r.__skip = self.__startSkip
+        r.__prefetchWorkers = self.__prefetchWorkers
+        try:
+            while r._couldGrow():
+                headers, data = r.__requestNextPage()
+                yield headers, r._getRawPage(data, headers)
+        finally:
+            r.__stopPrefetching()
+
+    def to_columns(self, fields: List[str], backend: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Returns the given fields of all elements of this list as typed columns, without creating objects.
+
+        A field like ``user.login`` refers to a nested value, missing values are None (nan in float columns).
+        Pages are streamed through :meth:`iter_raw_pages` and each field is converted into a column once.
+        Timestamps are parsed in bulk by pyarrow and numpy.
+
+        :param fields: the fields to export
+        :param backend: ``"arrow"`` for pyarrow arrays, ``"numpy"`` for numpy arrays or ``"array"`` for
+            :mod:`array` arrays of numbers and lists of other values, defaults to the first that is installed
+        """
+        assert isinstance(fields, list) and all(isinstance(field, str) for field in fields), fields
+        assert backend is None or backend in github.Columns.BACKENDS, backend
+        if backend is None:
+            backend = github.Columns.defaultBackend()
+        values: Dict[str, List[Any]] = {field: [] for field in fields}
+        for _, elements in self.iter_raw_pages():
+            for field, page_values in github.Columns.columnValues(elements, fields).items():
+                values[field].extend(page_values)
+        return {field: github.Columns.toColumn(values[field], backend) for field in fields}
+
+    def checkpoint(self, index: Optional[int] = None) -> Dict[str, Any]:
+        """
+        Returns a cursor to continue this list with :meth:`resume` or :meth:`github.MainClass.Github.resume_paginated_list`,
+        e.g. in another process.
+
+        The cursor is a dict that can be serialized as JSON. It holds the urls and parameters of this list, but no
+        credentials.
+
+        :param index: the number of elements already processed, the resumed list starts with the element at this
+            index; defaults to all elements fetched so far, only elements of the last page fetched can be skipped
+        """
+        if index is None or index == self.__fetched:
+            # elements of a resumed list that have not been fetched yet are still to be skipped
+            url, params, skip = self.__nextUrl, self.__nextParams, self.__skip
+        else:
+            start, url, params = self.__page
+            assert isinstance(index, int) and max(start, 0) <= index < self.__fetched, (index, start, self.__fetched)
+            skip = index - start
+        return {
+            "class": f"{self.__contentClass.__module__}.{self.__contentClass.__name__}",
+            "url": self.__firstUrl,
+            "params": dict(self.__firstParams),
+            "headers": self.__headers,
+            "list_item": self.__list_item,
+            "total_count_item": self.__total_count_item,
+            "reversed": self._reversed,
+            "next_url": url,
+            "next_params": None if params is None else dict(params),
+            "skip": skip,
+        }
+
+    @classmethod
+    def resume(
+        cls,
+        requester: Requester,
+        cursor: Dict[str, Any],
+        attributesTransformer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ) -> "PaginatedList[Any]":
+        """
+        Returns a list that continues where the list that returned the cursor from :meth:`checkpoint` left off.
+
+        :param requester: the requester to send requests with
+        :param cursor: the cursor returned by :meth:`checkpoint`
+        :param attributesTransformer: the transformer of the original list, if any, as it is not part of the cursor
+        """
+        module, _, name = cursor["class"].rpartition(".")
+        # do not import arbitrary modules named by the cursor
+        assert module.startswith("github."), cursor["class"]
+        contentClass = getattr(importlib.import_module(module), name)
+        assert issubclass(contentClass, GithubObject), contentClass
+        r = PaginatedList(
+            contentClass,
+            requester,
+            cursor["url"],
+            dict(cursor["params"]),
+            cursor["headers"],
+            cursor["list_item"],
+            cursor["total_count_item"],
+            attributesTransformer=attributesTransformer,
+        )
+        r._reversed = cursor["reversed"]
+        r.__nextUrl = r.__startUrl = cursor["next_url"]
+        r.__nextParams = r.__startParams = cursor["next_params"]
+        r.__skip = r.__startSkip = cursor["skip"]
+        return r
+
+    def __iter__(self) -> Iterator[T]:
+        try:
+            yield from super().__iter__()
+        finally:
+            self.__stopPrefetching()
 
     def _couldGrow(self) -> bool:
         return self.__nextUrl is not None
 
     def _fetchNextPage(self) -> List[T]:
-        headers, data = self.__requester.requestJsonAndCheck(
-            "GET", self.__nextUrl, parameters=self.__nextParams, headers=self.__headers
-        )
-        data = data if data else []
+        headers, data = self.__requestNextPage()
         return self._getPage(data, headers)
 
+    def __requestNextPage(self) -> Tuple[Dict[str, Any], Any]:
+        self.__page = (self.__fetched - self.__skip, self.__nextUrl, self.__nextParams)
+        page = self.__prefetchablePage(self.__nextUrl)
+        if page is not None:
+            headers, data = self.__prefetchedPages.pop(page).result()
+        else:
+            headers, data = self.__requester.requestJsonAndCheck(
+                "GET", self.__nextUrl, parameters=self.__nextParams, headers=self.__headers
+            )
+        return headers, data if data else []
+
+    def __prefetchablePage(self, url: str) -> Optional[int]:
+        # Returns the page number of the given url if it can be prefetched, making sure
+        # that this page and up to __prefetchWorkers pages ahead of it have been requested
+        if self.__prefetchWorkers is None or self._reversed or self.__lastUrl is None:
+            return None
+        page = self.__pageNumber(url)
+        lastPage = self.__pageNumber(self.__lastUrl)
+        if page is None or lastPage is None or page > lastPage:
+            return None
+
+        if self.__prefetchExecutor is None:
+            self.__prefetchExecutor = ThreadPoolExecutor(
+                max_workers=self.__prefetchWorkers, thread_name_prefix="PaginatedList"
+            )
+        for p in range(page, min(page + self.__prefetchWorkers, lastPage + 1)):
+            if p not in self.__prefetchedPages:
+                self.__prefetchedPages[p] = self.__prefetchExecutor.submit(
+                    self.__requester.requestJsonAndCheck,
+                    "GET",
+                    self.__pageUrl(self.__lastUrl, p),
+                    headers=self.__headers,
+                )
+        if page == lastPage:
+            self.__prefetchExecutor.shutdown(wait=False)
+            self.__prefetchExecutor = None
+        return page
+
+    def __stopPrefetching(self) -> None:
+        # cancels the pages prefetched but not used, e.g. when iteration stopped early
+        if self.__prefetchExecutor is None:
+            return
+        for future in self.__prefetchedPages.values():
+            future.cancel()
+        self.__prefetchExecutor.shutdown(wait=False)
+        self.__prefetchExecutor = None
+        self.__prefetchedPages = {
+            page: future for page, future in self.__prefetchedPages.items() if not future.cancelled()
+        }
+
+    @staticmethod
+    def __pageNumber(url: str) -> Optional[int]:
+        page = parse_qs(urlparse(url).query).get("page")
+        if page is None or not page[0].isdigit():
+            return None
+        return int(page[0])
+
+    @staticmethod
+    def __pageUrl(url: str, page: int) -> str:
+        o = urlparse(url)
+        query = parse_qs(o.query)
+        query["page"] = [str(page)]
+        return o._replace(query=urlencode(query, doseq=True)).geturl()
+
     def _getPage(self, data: Any, headers: Dict[str, Any]) -> List[T]:
+        return [
+            self.__contentClass(self.__requester, headers, self._transformAttributes(element), completed=False)
+            for element in self._getRawPage(data, headers)
+        ]
+
+    def _getRawPage(self, data: Any, headers: Dict[str, Any]) -> List[Dict[str, Any]]:
         self.__nextUrl = None  # type: ignore
         if len(data) > 0:
-            links = self.__parseLinkHeader(headers)
+            links = self._parseLinkHeader(headers)
             if self._reversed:
                 if "prev" in links:
                     self.__nextUrl = links["prev"]
             elif "next" in links:
                 self.__nextUrl = links["next"]
+            if "last" in links:
+                self.__lastUrl = links["last"]
         self.__nextParams = None
         if self.__list_item in data:
             self.__totalCount = data.get(self.__total_count_item)
             data = data[self.__list_item]
-        content = [
-            self.__contentClass(self.__requester, headers, self._transformAttributes(element), completed=False)
-            for element in data
-            if element is not None
-        ]
+        content = [element for element in data if element is not None]
         if self._reversed:
-            return content[::-1]
+            content = content[::-1]
+        if self.__skip:
+            content = content[self.__skip :]
+            self.__skip = 0
+        self.__fetched += len(content)
         return content
 
-    def __parseLinkHeader(self, headers: Dict[str, str]) -> Dict[str, str]:
+    @staticmethod
+    def _parseLinkHeader(headers: Dict[str, str]) -> Dict[str, str]:
         links = {}
         if "link" in headers:
             linkHeaders = headers["link"].split(", ")
@@ -317,3 +584,162 @@ class PaginatedList(PaginatedListBase[T]):
             else:
                 d1[k] = v
         return d1
+
+
+class GraphqlPaginatedList(PaginatedListBase[T]):
+    """
+    This class abstracts the `pagination of GraphQL connections
+    <https://docs.github.com/en/graphql/guides/using-pagination-in-the-graphql-api>`_.
+
+    The query is sent with the ``cursor`` variable set to the ``endCursor`` of the previous page, until
+    ``hasNextPage`` is false. The nodes of the connection are turned into objects like
+    :meth:`github.MainClass.Github.create_from_raw_data` does, so nodes should select their fields under the names
+    of the REST attributes, using aliases where they differ::
+
+        pulls = g.get_graphql_connection(
+            PullRequest,
+            ["repository(owner: $owner, name: $name)", "pullRequests(states: OPEN)"],
+            "number title created_at: createdAt labels(first: 10) { nodes { name } }",
+            {"owner": "PyGithub", "name": "PyGithub"},
+        )
+        for pull in pulls:
+            print(pull.number, pull.raw_data["labels"]["nodes"])
+
+    Only the selected attributes of the objects are set.
+    """
+
+    def __init__(
+        self,
+        contentClass: Type[T],
+        requester: Requester,
+        query: str,
+        variables: Dict[str, Any],
+        path: List[str],
+        attributesTransformer: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None,
+    ):
+        self.__requester = requester
+        self.__contentClass = contentClass
+        self.__query = query
+        self.__variables = variables
+        # keys of the connection in the data of the response
+        self.__path = path
+        self._attributesTransformer = attributesTransformer
+        self.__cursor: Optional[str] = None
+        self.__hasNextPage = True
+        self.__prefetch = False
+        self.__prefetchExecutor: Optional[ThreadPoolExecutor] = None
+        self.__prefetchedPage: Optional["Future[Tuple[Dict[str, Any], Dict[str, Any]]]"] = None
+        super().__init__()
+
+    @staticmethod
+    def connection_query(
+        connection: List[str], nodes: str, variables: Optional[Dict[str, Any]] = None, page_size: int = 100
+    ) -> str:
+        """
+        Builds the query of a connection, e.g. ``connection_query(["viewer", "repositories"], "name")`` returns::
+
+            query($cursor: String) { viewer { repositories(first: 100, after: $cursor) { nodes { name }
+            pageInfo { endCursor hasNextPage } } } }
+
+        :param connection: the fields leading to the connection, with their arguments, the last one is the connection
+        :param nodes: the selection of the nodes of the connection
+        :param variables: the variables used by the arguments, their types are derived from their values
+        :param page_size: the number of nodes per page, at most 100
+        """
+        assert isinstance(connection, list) and len(connection) > 0, connection
+        assert all(isinstance(field, str) for field in connection), connection
+        assert isinstance(nodes, str), nodes
+        assert isinstance(page_size, int) and 0 < page_size <= 100, page_size
+
+        declarations = [
+            f"${name}: {GraphqlPaginatedList.__variableType(value)}" for name, value in (variables or {}).items()
+        ]
+        declarations.append("$cursor: String")
+        pagination = f"first: {page_size}, after: $cursor"
+        last = connection[-1]
+        last = f"{last[:-1]}, {pagination})" if last.endswith(")") else f"{last}({pagination})"
+        query = f"{last} {{ nodes {{ {nodes} }} pageInfo {{ endCursor hasNextPage }} }}"
+        for field in reversed(connection[:-1]):
+            query = f"{field} {{ {query} }}"
+        return f"query({', '.join(declarations)}) {{ {query} }}"
+
+    @staticmethod
+    def connection_path(connection: List[str]) -> List[str]:
+        """
+        Returns the keys of the connection in the data of the response, i.e. the names or aliases of the fields.
+        """
+        return [field.split("(")[0].split(":")[0].strip() for field in connection]
+
+    @staticmethod
+    def __variableType(value: Any) -> str:
+        # bool is an int, so check it first
+        for pythonType, graphqlType in ((bool, "Boolean"), (int, "Int"), (float, "Float"), (str, "String")):
+            if isinstance(value, pythonType):
+                return f"{graphqlType}!"
+            if isinstance(value, list) and value and all(isinstance(v, pythonType) for v in value):
+                return f"[{graphqlType}!]!"
+        raise TypeError(f"Cannot derive the GraphQL type of variable value {value!r}")
+
+    def prefetch(self) -> "GraphqlPaginatedList[T]":
+        """
+        Returns a copy of this list that requests the next page while the elements of the current page are used.
+
+        Pages of a connection are known only from the cursor of the previous page, so at most one page is fetched
+        ahead.
+        """
+        r = GraphqlPaginatedList(
+            self.__contentClass,
+            self.__requester,
+            self.__query,
+            self.__variables,
+            self.__path,
+            self._attributesTransformer,
+        )
+        r.__prefetch = True
+        return r
+
+    def _transformAttributes(self, element: Dict[str, Any]) -> Dict[str, Any]:
+        if self._attributesTransformer is None:
+            return element
+        return self._attributesTransformer(element)
+
+    def _couldGrow(self) -> bool:
+        return self.__hasNextPage
+
+    def _fetchNextPage(self) -> List[T]:
+        if self.__prefetchedPage is not None:
+            headers, connection = self.__prefetchedPage.result()
+            self.__prefetchedPage = None
+        else:
+            headers, connection = self.__requestPage(self.__cursor)
+
+        pageInfo = connection["pageInfo"]
+        self.__cursor = pageInfo["endCursor"]
+        self.__hasNextPage = bool(pageInfo["hasNextPage"]) and self.__cursor is not None
+        if self.__prefetch and self.__hasNextPage:
+            if self.__prefetchExecutor is None:
+                self.__prefetchExecutor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="GraphqlPaginatedList")
+            self.__prefetchedPage = self.__prefetchExecutor.submit(self.__requestPage, self.__cursor)
+        elif self.__prefetchExecutor is not None:
+            self.__prefetchExecutor.shutdown(wait=False)
+            self.__prefetchExecutor = None
+
+        # nodes that cannot be accessed are null
+        return [
+            self.__contentClass(self.__requester, headers, self._transformAttributes(node), completed=True)
+            for node in connection["nodes"]
+            if node is not None
+        ]
+
+    def __requestPage(self, cursor: Optional[str]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        headers, data = self.__requester.requestJsonAndCheck(
+            "POST",
+            self.__requester.graphql_url,
+            input={"query": self.__query, "variables": {**self.__variables, "cursor": cursor}},
+        )
+        if "errors" in data:
+            raise self.__requester.createException(400, headers, data)
+        connection = data["data"]
+        for key in self.__path:
+            connection = connection[key]
+        return headers, connection
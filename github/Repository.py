@@ -150,7 +150,7 @@ import urllib.parse
 from base64 import b64encode
 from collections.abc import Iterable
 from datetime import date, datetime, timezone
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator
 
 from deprecated import deprecated
 
@@ -1960,6 +1960,45 @@ class Repository(CompletableGithubObject):
         :param ref: string
         :rtype: string
         """
+        headers, data = self._requester.requestJsonAndCheck("GET", self.__archive_url(archive_format, ref))
+        return headers["location"]
+
+    def download_archive_to(
+        self,
+        archive_format: str,
+        path_or_fileobj: str | BinaryIO,
+        ref: Opt[str] = NotSet,
+        chunk_size: int = Consts.DEFAULT_CHUNK_SIZE,
+        resume: bool = False,
+    ) -> str:
+        """
+        :calls: `GET /repos/{owner}/{repo}/{archive_format}/{ref} <https://docs.github.com/en/rest/reference/repos#contents>`_
+        :param archive_format: string
+        :param path_or_fileobj: path of the file to write, or binary file object
+        :param ref: string
+        :param chunk_size: size of the chunks in bytes the archive is downloaded in
+        :param resume: complete a file at the given path partially downloaded with resume before, unless the
+            content has changed since
+        :rtype: string, the SHA-256 hex digest of the archive
+        """
+        return self._requester.getFile(
+            self.__archive_url(archive_format, ref), path_or_fileobj, None, chunk_size, resume
+        )
+
+    def download_archive_stream(
+        self, archive_format: str, ref: Opt[str] = NotSet, chunk_size: int = Consts.DEFAULT_CHUNK_SIZE
+    ) -> Iterator[bytes]:
+        """
+        :calls: `GET /repos/{owner}/{repo}/{archive_format}/{ref} <https://docs.github.com/en/rest/reference/repos#contents>`_
+        :param archive_format: string
+        :param ref: string
+        :param chunk_size: size of the chunks in bytes the archive is downloaded in
+        :rtype: iterator of bytes
+        """
+        status, headers, chunks = self._requester.getStream(self.__archive_url(archive_format, ref), None, chunk_size)
+        return chunks
+
+    def __archive_url(self, archive_format: str, ref: Opt[str]) -> str:
         assert isinstance(archive_format, str), archive_format
         archive_format = urllib.parse.quote(archive_format)
         assert is_optional(ref, str), ref
@@ -1967,8 +2006,7 @@ class Repository(CompletableGithubObject):
         if is_defined(ref):
             ref = urllib.parse.quote(ref)
             url += f"/{ref}"
-        headers, data = self._requester.requestJsonAndCheck("GET", url)
-        return headers["location"]
+        return url
 
     def get_assignees(self) -> PaginatedList[NamedUser]:
         """
@@ -0,0 +1,176 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import hashlib
+import threading
+import weakref
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional
+
+import github.Consts as Consts
+
+# Requests of interactive priority may use the entire rate limit, they are never deferred for the rate limit
+# and raise RateLimitExceededException once it is exhausted
+INTERACTIVE = "interactive"
+# Requests of batch priority are spread over the remaining rate limit window,
+# and leave BATCH_RESERVED_RATIO of the rate limit to interactive requests,
+# so they wait for the reset once their share of the rate limit is exhausted
+BATCH = "batch"
+PRIORITIES = (INTERACTIVE, BATCH)
+BATCH_RESERVED_RATIO = 0.1
+# The rate limit resource of requests that are not GraphQL or search requests
+CORE_RESOURCE = "core"
+
+
+class RequestScheduler:
+    """
+    This class schedules the requests sent with one authentication token to one GitHub host.
+
+    All :class:`github.Requester.Requester` instances that use the same token share a scheduler, across threads.
+    A request is deferred so that at least ``seconds_between_requests`` have passed since the last request (and
+    ``seconds_between_writes`` since the last write request), and, for requests of :data:`BATCH` priority, so that
+    the rate limit reported by the ``X-RateLimit-Remaining`` and ``X-RateLimit-Reset`` headers lasts until it is
+    reset. The rate limit is kept
+    per resource given by the ``X-RateLimit-Resource`` header, e.g. ``core``, ``search`` or ``graphql``.
+
+    """
+
+    __schedulers: "weakref.WeakValueDictionary[str, RequestScheduler]" = weakref.WeakValueDictionary()
+    __schedulers_lock = threading.Lock()
+
+    @classmethod
+    def get(cls, hostname: str, authorization: Optional[str]) -> "RequestScheduler":
+        """
+        Returns the scheduler shared by all requests to hostname with the given Authorization header.
+
+        Schedulers are only kept as long as they are referenced, e.g. by a Requester.
+        """
+        # do not keep tokens in memory longer than needed
+        digest = hashlib.sha256((authorization or "").encode("utf-8")).hexdigest()
+        key = f"{hostname}:{digest}"
+        with cls.__schedulers_lock:
+            scheduler = cls.__schedulers.get(key)
+            if scheduler is None:
+                scheduler = RequestScheduler()
+                cls.__schedulers[key] = scheduler
+            return scheduler
+
+    @classmethod
+    def resetSchedulers(cls) -> None:
+        with cls.__schedulers_lock:
+            cls.__schedulers.clear()
+
+    def __init__(self) -> None:
+        self.__lock = threading.Lock()
+        self.__last_requests: Dict[str, float] = dict()
+        # rate limit state by resource
+        self.__remaining: Dict[str, int] = dict()
+        self.__limit: Dict[str, int] = dict()
+        self.__reset: Dict[str, float] = dict()
+        self.__last_batch_request: Dict[str, float] = dict()
+
+    @property
+    def rate_limiting(self) -> Optional[Dict[str, Any]]:
+        """
+        The core rate limit as of the last response and the requests scheduled since, None if not known.
+        """
+        with self.__lock:
+            if CORE_RESOURCE not in self.__remaining:
+                return None
+            return dict(
+                remaining=self.__remaining[CORE_RESOURCE],
+                limit=self.__limit.get(CORE_RESOURCE),
+                reset=self.__reset[CORE_RESOURCE],
+            )
+
+    def reserve(
+        self,
+        verb: str,
+        seconds_between_requests: Optional[float],
+        seconds_between_writes: Optional[float],
+        priority: str = INTERACTIVE,
+        resource: str = CORE_RESOURCE,
+    ) -> float:
+        """
+        Reserves the next slot for a request of the given rate limit resource and returns the seconds to wait
+        before sending it.
+
+        Concurrent callers get consecutive slots.
+        """
+        assert priority in PRIORITIES, priority
+        with self.__lock:
+            now = self.__now()
+            requests = self.__last_requests.values()
+            writes = [l for v, l in self.__last_requests.items() if v != "GET"]
+
+            last_request = max(requests) if requests else 0
+            last_write = max(writes) if writes else 0
+
+            next_request = (last_request + seconds_between_requests) if seconds_between_requests else 0
+            next_write = (last_write + seconds_between_writes) if seconds_between_writes else 0
+
+            next = next_request if verb == "GET" else max(next_request, next_write)
+            next = max(next, self.__nextWithinRateLimit(now, priority, resource), now)
+
+            self.__last_requests[verb] = max(next, self.__last_requests.get(verb, 0))
+            if priority == BATCH:
+                self.__last_batch_request[resource] = next
+            if self.__remaining.get(resource, 0) > 0:
+                self.__remaining[resource] -= 1
+            return next - now
+
+    def __nextWithinRateLimit(self, now: float, priority: str, resource: str) -> float:
+        # Returns the earliest time of the next request that leaves enough rate limit for the rest of the window
+        # interactive requests are sent right away, the server rejects them once the rate limit is exhausted
+        remaining = self.__remaining.get(resource)
+        reset = self.__reset.get(resource, 0)
+        if priority != BATCH or remaining is None or reset <= now:
+            return 0
+
+        available = remaining - int(self.__limit.get(resource, 0) * BATCH_RESERVED_RATIO)
+        if available <= 0:
+            return reset
+        return self.__last_batch_request.get(resource, 0) + (reset - now) / available
+
+    def release(self, verb: str) -> None:
+        """
+        Records the end of a request, later requests are deferred relative to this time.
+        """
+        with self.__lock:
+            # slots reserved by concurrent requests after this request are kept
+            self.__last_requests[verb] = max(self.__now(), self.__last_requests.get(verb, 0))
+
+    def update(self, responseHeaders: Dict[str, Any]) -> None:
+        """
+        Updates the rate limit of the resource of the given (lower-cased) response headers.
+        """
+        if Consts.headerRateRemaining in responseHeaders and Consts.headerRateReset in responseHeaders:
+            resource = responseHeaders.get(Consts.headerRateResource, CORE_RESOURCE)
+            with self.__lock:
+                # ints expected but sometimes floats returned: https://github.com/PyGithub/PyGithub/pull/2697
+                self.__remaining[resource] = int(float(responseHeaders[Consts.headerRateRemaining]))
+                self.__reset[resource] = int(float(responseHeaders[Consts.headerRateReset]))
+                if Consts.headerRateLimit in responseHeaders:
+                    self.__limit[resource] = int(float(responseHeaders[Consts.headerRateLimit]))
+
+    @staticmethod
+    def __now() -> float:
+        return datetime.now(timezone.utc).timestamp()
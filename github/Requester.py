@@ -72,6 +72,7 @@
 #                                                                              #
 ################################################################################
 
+import hashlib
 import io
 import json
 import logging
@@ -82,8 +83,9 @@ import threading
 import time
 import urllib
 import urllib.parse
+import weakref
 from collections import deque
-from datetime import datetime, timezone
+from concurrent.futures import Future
 from io import IOBase
 from typing import (
     TYPE_CHECKING,
@@ -94,7 +96,10 @@ from typing import (
     Dict,
     Generic,
     ItemsView,
+    Iterable,
+    Iterator,
     List,
+    NamedTuple,
     Optional,
     Tuple,
     Type,
@@ -108,6 +113,9 @@ from urllib3 import Retry
 
 import github.Consts as Consts
 import github.GithubException as GithubException
+from github.Cache import Cache, CachedResponse
+from github.ConnectionPool import ConnectionPool
+from github.RequestScheduler import CORE_RESOURCE, INTERACTIVE, PRIORITIES, RequestScheduler
 
 if TYPE_CHECKING:
     from .AppAuthentication import AppAuthentication
@@ -116,6 +124,7 @@ if TYPE_CHECKING:
     from .InstallationAuthorization import InstallationAuthorization
 
 T = TypeVar("T")
+T_gh = TypeVar("T_gh", bound="GithubObject")
 
 # For App authentication, time remaining before token expiration to request a new one
 ACCESS_TOKEN_REFRESH_THRESHOLD_SECONDS = 20
@@ -126,7 +135,16 @@ class RequestsResponse:
     def __init__(self, r: requests.Response):
         self.status = r.status_code
         self.headers = r.headers
-        self.text = r.text
+        self.__response = r
+
+    @property
+    def text(self) -> str:
+        return self.__response.text
+
+    @property
+    def content(self) -> bytes:
+        # the raw bytes, which the JSON decoder reads without decoding them into an intermediate str
+        return self.__response.content
 
     def getheaders(self) -> ItemsView[str, str]:
         return self.headers.items()
@@ -135,7 +153,109 @@ class RequestsResponse:
         return self.text
 
 
-class HTTPSRequestsConnectionClass:
+class UploadProgress(NamedTuple):
+    """
+    The progress of an upload, as reported to progress callbacks.
+    """
+
+    # bytes sent so far
+    uploaded: int
+    # bytes to send in total
+    total: int
+    # seconds since the first bytes were sent
+    elapsed: float
+
+    @property
+    def throughput(self) -> float:
+        """
+        Bytes sent per second.
+        """
+        return self.uploaded / self.elapsed if self.elapsed > 0 else 0.0
+
+
+class StreamedInput(io.RawIOBase):
+    # file-like request body that reads the given chunks only when they are sent,
+    # its length makes requests send it with a Content-Length header instead of chunked transfer encoding
+    def __init__(
+        self,
+        chunks: Iterable[bytes],
+        size: int,
+        progress: Optional[Callable[[UploadProgress], None]] = None,
+    ):
+        super().__init__()
+        self.__chunks = iter(chunks)
+        self.__size = size
+        self.__progress = progress
+        self.__buffer = memoryview(b"")
+        self.__uploaded = 0
+        self.__started: Optional[float] = None
+
+    def __len__(self) -> int:
+        return self.__size
+
+    def readable(self) -> bool:
+        return True
+
+    def tell(self) -> int:
+        return self.__uploaded
+
+    def readinto(self, b: Any) -> int:
+        if self.__started is None:
+            self.__started = time.monotonic()
+        while len(self.__buffer) == 0:
+            chunk = next(self.__chunks, None)
+            if chunk is None:
+                if self.__uploaded != self.__size:
+                    raise ValueError(f"Expected {self.__size} bytes but chunks provided {self.__uploaded} bytes")
+                return 0
+            self.__buffer = memoryview(chunk)
+
+        n = min(len(b), len(self.__buffer))
+        b[:n] = self.__buffer[:n]
+        self.__buffer = self.__buffer[n:]
+        self.__uploaded += n
+        if self.__uploaded > self.__size:
+            raise ValueError(f"Expected {self.__size} bytes but chunks provided more")
+        if self.__progress is not None:
+            self.__progress(UploadProgress(self.__uploaded, self.__size, time.monotonic() - self.__started))
+        return n
+
+
+class PendingRequest:
+    # mimic the httplib request() / getresponse() pair
+    # the pending request is kept per thread, so that threads can share a connection and its connection pool
+    _pending: threading.local
+
+    def request(
+        self,
+        verb: str,
+        url: str,
+        input: Optional[Union[str, io.BufferedReader]],
+        headers: Dict[str, str],
+    ) -> None:
+        self._pending.verb = verb
+        self._pending.url = url
+        self._pending.input = input
+        self._pending.headers = headers
+
+    @property
+    def verb(self) -> str:
+        return self._pending.verb
+
+    @property
+    def url(self) -> str:
+        return self._pending.url
+
+    @property
+    def input(self) -> Optional[Union[str, io.BufferedReader]]:
+        return self._pending.input
+
+    @property
+    def headers(self) -> Dict[str, str]:
+        return self._pending.headers
+
+
+class HTTPSRequestsConnectionClass(PendingRequest):
     retry: Union[int, Retry]
 
     # mimic the httplib connection object
@@ -154,6 +274,7 @@ class HTTPSRequestsConnectionClass:
         self.protocol = "https"
         self.timeout = timeout
         self.verify = kwargs.get("verify", True)
+        self._pending = threading.local()
         self.session = requests.Session()
         # having Session.auth set something other than None disables falling back to .netrc file
         # https://github.com/psf/requests/blob/d63e94f552ebf77ccf45d97e5863ac46500fa2c7/src/requests/sessions.py#L480-L481
@@ -177,18 +298,6 @@ class HTTPSRequestsConnectionClass:
         )
         self.session.mount("https://", self.adapter)
 
-    def request(
-        self,
-        verb: str,
-        url: str,
-        input: Optional[Union[str, io.BufferedReader]],
-        headers: Dict[str, str],
-    ) -> None:
-        self.verb = verb
-        self.url = url
-        self.input = input
-        self.headers = headers
-
     def getresponse(self) -> RequestsResponse:
         verb = getattr(self.session, self.verb.lower())
         url = f"{self.protocol}://{self.host}:{self.port}{self.url}"
@@ -206,7 +315,7 @@ class HTTPSRequestsConnectionClass:
         self.session.close()
 
 
-class HTTPRequestsConnectionClass:
+class HTTPRequestsConnectionClass(PendingRequest):
     # mimic the httplib connection object
     def __init__(
         self,
@@ -223,6 +332,7 @@ class HTTPRequestsConnectionClass:
         self.protocol = "http"
         self.timeout = timeout
         self.verify = kwargs.get("verify", True)
+        self._pending = threading.local()
         self.session = requests.Session()
         # having Session.auth set something other than None disables falling back to .netrc file
         # https://github.com/psf/requests/blob/d63e94f552ebf77ccf45d97e5863ac46500fa2c7/src/requests/sessions.py#L480-L481
@@ -246,12 +356,6 @@ class HTTPRequestsConnectionClass:
         )
         self.session.mount("http://", self.adapter)
 
-    def request(self, verb: str, url: str, input: None, headers: Dict[str, str]) -> None:
-        self.verb = verb
-        self.url = url
-        self.input = input
-        self.headers = headers
-
     def getresponse(self) -> RequestsResponse:
         verb = getattr(self.session, self.verb.lower())
         url = f"{self.protocol}://{self.host}:{self.port}{self.url}"
@@ -277,6 +381,7 @@ class Requester:
     __httpsConnectionClass = HTTPSRequestsConnectionClass
     __persist = True
     __logger: Optional[logging.Logger] = None
+    __jsonDecoder: Callable[[Union[str, bytes]], Any] = json.loads
 
     _frameBuffer: List[Any]
 
@@ -308,6 +413,21 @@ class Requester:
     def resetLogger(cls) -> None:
         cls.__logger = None
 
+    @classmethod
+    def setJsonDecoder(cls, decoder: Callable[[Union[str, bytes]], Any]) -> None:
+        """
+        Sets the function that decodes JSON response bodies, given as str or as UTF-8 encoded bytes.
+
+        Defaults to ``json.loads``. ``orjson.loads`` decodes JSON several times faster, install the ``orjson`` extra
+        and call ``Requester.setJsonDecoder(orjson.loads)``. Note that orjson rejects integers wider than 64 bits.
+        """
+        assert callable(decoder), decoder
+        cls.__jsonDecoder = decoder
+
+    @classmethod
+    def resetJsonDecoder(cls) -> None:
+        cls.__jsonDecoder = json.loads
+
     #############################################################
     # For Debug
     @classmethod
@@ -342,7 +462,9 @@ class Requester:
 
             self._frameCount = len(self._frameBuffer) - 1
 
-    def DEBUG_ON_RESPONSE(self, statusCode: int, responseHeader: Dict[str, Union[str, int]], data: str) -> None:
+    def DEBUG_ON_RESPONSE(
+        self, statusCode: int, responseHeader: Dict[str, Union[str, int]], data: Union[str, bytes]
+    ) -> None:
         """
         Update current frame with response Current frame index will be attached to responseHeader.
         """
@@ -388,7 +510,16 @@ class Requester:
         pool_size: Optional[int],
         seconds_between_requests: Optional[float] = None,
         seconds_between_writes: Optional[float] = None,
+        cache: Optional[Cache] = None,
+        priority: str = INTERACTIVE,
+        lazy_attributes: bool = False,
+        identity_map: bool = False,
+        coalesce_requests: bool = False,
     ):
+        assert priority in PRIORITIES, priority
+        assert isinstance(lazy_attributes, bool), lazy_attributes
+        assert isinstance(identity_map, bool), identity_map
+        assert isinstance(coalesce_requests, bool), coalesce_requests
         self._initializeDebugFeature()
 
         self.__auth = auth
@@ -405,7 +536,18 @@ class Requester:
         self.__pool_size = pool_size
         self.__seconds_between_requests = seconds_between_requests
         self.__seconds_between_writes = seconds_between_writes
-        self.__last_requests: Dict[str, float] = dict()
+        self.__cache = cache
+        self.__priority = priority
+        self.__lazy_attributes = lazy_attributes
+        self.__identity_map = identity_map
+        self.__objects: "weakref.WeakValueDictionary[Any, GithubObject]" = weakref.WeakValueDictionary()
+        self.__objects_lock = threading.Lock()
+        self.__coalesce_requests = coalesce_requests
+        # responses of the GET requests currently sent, by request
+        self.__in_flight: Dict[str, "Future[Tuple[int, Dict[str, Any], Union[str, bytes]]]"] = {}
+        self.__in_flight_lock = threading.Lock()
+        self.__scheduler: Optional[RequestScheduler] = None
+        self.__scheduler_authorization: Optional[str] = None
         self.__scheme = o.scheme
         if o.scheme == "https":
             self.__connectionClass = self.__httpsConnectionClass
@@ -416,6 +558,7 @@ class Requester:
         self.__connection: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = None
         self.__connection_lock = threading.Lock()
         self.__custom_connections: Deque[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = deque()
+        self.__stream_session: Optional[requests.Session] = None
         self.rate_limiting = (-1, -1)
         self.rate_limiting_resettime = 0
         self.FIX_REPO_GET_GIT_REF = True
@@ -444,6 +587,17 @@ class Requester:
         del state["_Requester__connection"]
         # __custom_connections is not usable on remote, so ignore it
         del state["_Requester__custom_connections"]
+        # __stream_session is not usable on remote, so ignore it
+        del state["_Requester__stream_session"]
+        # __objects and __objects_lock are not picklable, objects are shared within this process only
+        del state["_Requester__objects"]
+        del state["_Requester__objects_lock"]
+        # __in_flight and __in_flight_lock are not picklable, requests are coalesced within this process only
+        del state["_Requester__in_flight"]
+        del state["_Requester__in_flight_lock"]
+        # __scheduler is shared with other requesters of this process only
+        state["_Requester__scheduler"] = None
+        state["_Requester__scheduler_authorization"] = None
         return state
 
     def __setstate__(self, state: Dict[str, Any]) -> None:
@@ -451,6 +605,11 @@ class Requester:
         self.__connection_lock = threading.Lock()
         self.__connection = None
         self.__custom_connections = deque()
+        self.__stream_session = None
+        self.__objects = weakref.WeakValueDictionary()
+        self.__objects_lock = threading.Lock()
+        self.__in_flight = {}
+        self.__in_flight_lock = threading.Lock()
 
     @staticmethod
     # replace with str.removesuffix once support for Python 3.7 is dropped
@@ -470,7 +629,8 @@ class Requester:
 
     def close(self) -> None:
         """
-        Close the connection to the server.
+        Close the connection to the server. Connections shared with other requesters are closed by
+        :class:`github.ConnectionPool.ConnectionPool` once they are idle.
         """
         with self.__connection_lock:
             if self.__connection is not None:
@@ -478,6 +638,10 @@ class Requester:
                 self.__connection = None
         while self.__custom_connections:
             self.__custom_connections.popleft().close()
+        with self.__connection_lock:
+            if self.__stream_session is not None:
+                self.__stream_session.close()
+                self.__stream_session = None
 
     @property
     def kwargs(self) -> Dict[str, Any]:
@@ -496,6 +660,11 @@ class Requester:
             pool_size=self.__pool_size,
             seconds_between_requests=self.__seconds_between_requests,
             seconds_between_writes=self.__seconds_between_writes,
+            cache=self.__cache,
+            priority=self.__priority,
+            lazy_attributes=self.__lazy_attributes,
+            identity_map=self.__identity_map,
+            coalesce_requests=self.__coalesce_requests,
         )
 
     @property
@@ -514,9 +683,49 @@ class Requester:
     def auth(self) -> Optional["Auth"]:
         return self.__auth
 
+    @property
+    def cache(self) -> Optional[Cache]:
+        return self.__cache
+
+    @property
+    def priority(self) -> str:
+        return self.__priority
+
+    @property
+    def lazy_attributes(self) -> bool:
+        return self.__lazy_attributes
+
+    @property
+    def identity_map(self) -> bool:
+        return self.__identity_map
+
+    @property
+    def coalesce_requests(self) -> bool:
+        return self.__coalesce_requests
+
+    def sharedObject(self, key: Any, create: Callable[[], "T_gh"]) -> "T_gh":
+        """
+        Returns the object of the identity map with the given key, or the object returned by create, which is then
+        added to the identity map. Without identity map, returns the object returned by create.
+
+        Objects are kept in the identity map as long as they are referenced elsewhere.
+
+        """
+        if not self.__identity_map:
+            return create()
+        with self.__objects_lock:
+            obj = self.__objects.get(key)
+        if obj is None:
+            # objects are created outside the lock as they create their nested objects through this identity map
+            created = create()
+            with self.__objects_lock:
+                obj = self.__objects.setdefault(key, created)
+        return obj  # type: ignore
+
     def withAuth(self, auth: Optional["Auth"]) -> "Requester":
         """
         Create a new requester instance with identical configuration but the given authentication method.
+        The new requester shares the connection pool of this requester, see :class:`github.ConnectionPool.ConnectionPool`.
 
         :param auth: authentication method
         :return: new Requester implementation
@@ -534,7 +743,7 @@ class Requester:
         headers: Optional[Dict[str, str]] = None,
         input: Optional[Any] = None,
     ) -> Tuple[Dict[str, Any], Any]:
-        return self.__check(*self.requestJson(verb, url, parameters, headers, input, self.__customConnection(url)))
+        return self.__check(*self.__requestJson(verb, url, parameters, headers, input, self.__customConnection(url)))
 
     def requestMultipartAndCheck(
         self,
@@ -544,7 +753,9 @@ class Requester:
         headers: Optional[Dict[str, Any]] = None,
         input: Optional[Dict[str, str]] = None,
     ) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
-        return self.__check(*self.requestMultipart(verb, url, parameters, headers, input, self.__customConnection(url)))
+        return self.__check(
+            *self.__requestMultipart(verb, url, parameters, headers, input, self.__customConnection(url))
+        )
 
     def requestBlobAndCheck(
         self,
@@ -555,7 +766,7 @@ class Requester:
         input: Optional[str] = None,
         cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = None,
     ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
-        return self.__check(*self.requestBlob(verb, url, parameters, headers, input, self.__customConnection(url)))
+        return self.__check(*self.__requestBlob(verb, url, parameters, headers, input, self.__customConnection(url)))
 
     def graphql_query(self, query: str, variables: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
         """
@@ -591,13 +802,23 @@ class Requester:
         self,
         status: int,
         responseHeaders: Dict[str, Any],
-        output: str,
+        output: Union[str, bytes],
     ) -> Tuple[Dict[str, Any], Any]:
         data = self.__structuredFromJson(output)
         if status >= 400:
             raise self.createException(status, responseHeaders, data)
         return responseHeaders, data
 
+    def _check(
+        self,
+        status: int,
+        responseHeaders: Dict[str, Any],
+        output: Union[str, bytes],
+    ) -> Tuple[Dict[str, Any], Any]:
+        # Decodes the output of a response, raises the GithubException of an error status.
+        # Used by the asyncio requester and by requests sent through requestJson.
+        return self.__check(status, responseHeaders, output)
+
     def __customConnection(
         self, url: str
     ) -> Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]]:
@@ -610,21 +831,22 @@ class Requester:
                 or (o.scheme != self.__scheme and not (o.scheme == "https" and self.__scheme == "http"))
             ):  # issue80
                 if o.scheme == "http":
-                    cnx = self.__httpConnectionClass(
-                        o.hostname,  # type: ignore
-                        o.port,
-                        retry=self.__retry,
-                        pool_size=self.__pool_size,
-                    )
-                    self.__custom_connections.append(cnx)
+                    cnx = self.__otherHostConnection(self.__httpConnectionClass, o.hostname, o.port)  # type: ignore
                 elif o.scheme == "https":
-                    cnx = self.__httpsConnectionClass(
-                        o.hostname,  # type: ignore
-                        o.port,
-                        retry=self.__retry,
-                        pool_size=self.__pool_size,
-                    )
-                    self.__custom_connections.append(cnx)
+                    cnx = self.__otherHostConnection(self.__httpsConnectionClass, o.hostname, o.port)  # type: ignore
+        return cnx
+
+    def __otherHostConnection(
+        self, connectionClass: Any, hostname: str, port: Optional[int]
+    ) -> Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]:
+        if self.__persist:
+            # connections to other hosts are shared and evicted like those to the API host,
+            # they have no timeout as uploads may take long to be processed once their body has been sent
+            return ConnectionPool.get(
+                connectionClass, hostname, port, self.__retry, self.__pool_size, None, self.__verify
+            )
+        cnx = connectionClass(hostname, port, retry=self.__retry, pool_size=self.__pool_size)
+        self.__custom_connections.append(cnx)
         return cnx
 
     @classmethod
@@ -674,18 +896,22 @@ class Requester:
             or message.endswith("please wait a few minutes before you try again.")
         )
 
-    def __structuredFromJson(self, data: str) -> Any:
+    def __structuredFromJson(self, data: Union[str, bytes]) -> Any:
         if len(data) == 0:
             return None
         else:
-            if isinstance(data, bytes):
-                data = data.decode("utf-8")
             try:
-                return json.loads(data)
+                # accessed through the class, so that the decoder is not bound to self
+                return Requester.__jsonDecoder(data)
             except ValueError:
-                if data.startswith("{") or data.startswith("["):
+                text = self.__text(data)
+                if text.startswith("{") or text.startswith("["):
                     raise
-                return {"data": data}
+                return {"data": text}
+
+    @staticmethod
+    def __text(output: Union[str, bytes]) -> str:
+        return output.decode("utf-8") if isinstance(output, bytes) else output
 
     def requestJson(
         self,
@@ -696,6 +922,18 @@ class Requester:
         input: Optional[Any] = None,
         cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = None,
     ) -> Tuple[int, Dict[str, Any], str]:
+        status, responseHeaders, output = self.__requestJson(verb, url, parameters, headers, input, cnx)
+        return status, responseHeaders, self.__text(output)
+
+    def __requestJson(
+        self,
+        verb: str,
+        url: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        input: Optional[Any] = None,
+        cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = None,
+    ) -> Tuple[int, Dict[str, Any], Union[str, bytes]]:
         def encode(input: Any) -> Tuple[str, str]:
             return "application/json", json.dumps(input)
 
@@ -710,6 +948,18 @@ class Requester:
         input: Optional[Dict[str, str]] = None,
         cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = None,
     ) -> Tuple[int, Dict[str, Any], str]:
+        status, responseHeaders, output = self.__requestMultipart(verb, url, parameters, headers, input, cnx)
+        return status, responseHeaders, self.__text(output)
+
+    def __requestMultipart(
+        self,
+        verb: str,
+        url: str,
+        parameters: Optional[Dict[str, Any]] = None,
+        headers: Optional[Dict[str, Any]] = None,
+        input: Optional[Dict[str, str]] = None,
+        cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = None,
+    ) -> Tuple[int, Dict[str, Any], Union[str, bytes]]:
         def encode(input: Dict[str, Any]) -> Tuple[str, str]:
             boundary = "----------------------------3c3ba8b523b2"
             eol = "\r\n"
@@ -734,6 +984,18 @@ class Requester:
         input: Optional[str] = None,
         cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = None,
     ) -> Tuple[int, Dict[str, Any], str]:
+        status, responseHeaders, output = self.__requestBlob(verb, url, parameters, headers, input, cnx)
+        return status, responseHeaders, self.__text(output)
+
+    def __requestBlob(
+        self,
+        verb: str,
+        url: str,
+        parameters: Optional[Dict[str, str]] = None,
+        headers: Optional[Dict[str, str]] = None,
+        input: Optional[str] = None,
+        cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]] = None,
+    ) -> Tuple[int, Dict[str, Any], Union[str, bytes]]:
         if headers is None:
             headers = {}
 
@@ -767,6 +1029,205 @@ class Requester:
             cnx = self.__customConnection(url)
         return self.__check(*self.__requestEncode(cnx, verb, url, parameters, headers, file_like, encode))
 
+    def requestStreamAndCheck(
+        self,
+        verb: str,
+        url: str,
+        parameters: Any,
+        headers: Dict[str, Any],
+        chunks: Iterable[bytes],
+        size: int,
+        progress: Optional[Callable[[UploadProgress], None]] = None,
+    ) -> Tuple[Dict[str, Any], Any]:
+        """
+        Sends the given chunks of bytes as the body of the request, reading them only while they are sent.
+        The chunks must provide exactly size bytes, progress is called after each block is sent.
+        """
+        assert isinstance(size, int) and size >= 0, size
+        input = StreamedInput(chunks, size, progress)
+
+        # The expected signature of encode means that the argument is ignored.
+        def encode(_: Any) -> Tuple[str, Any]:
+            return headers["Content-Type"], input
+
+        headers["Content-Length"] = str(size)
+        return self.__check(
+            *self.__requestEncode(self.__customConnection(url), verb, url, parameters, headers, input, encode)
+        )
+
+    def getStream(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = Consts.DEFAULT_CHUNK_SIZE,
+        offset: int = 0,
+        if_range: Optional[str] = None,
+    ) -> Tuple[int, Dict[str, Any], Iterator[bytes]]:
+        """
+        Downloads the content of the given API url in chunks of chunk_size bytes, without reading the entire content
+        into memory. Redirections, e.g. to a storage host, are followed without sending the Authorization header.
+
+        With a positive offset, only the content from that byte on is requested. The server honours that range if
+        it responds with status 206, with status 200 it sends the entire content. With if_range, the ETag of the
+        content the range refers to, the server sends the entire content if the content has changed since.
+
+        The response is closed once the returned iterator is exhausted or closed.
+        """
+        assert isinstance(chunk_size, int) and chunk_size > 0, chunk_size
+        assert isinstance(offset, int) and offset >= 0, offset
+
+        # the input is None, so encode is never called
+        path, requestHeaders, _ = self._prepareRequest("GET", url, None, headers, None, lambda _: ("", None))
+        # ranges refer to the content as stored, not as transferred with a content encoding
+        requestHeaders["Accept-Encoding"] = "identity"
+        if offset > 0:
+            requestHeaders["Range"] = f"bytes={offset}-"
+            if if_range is not None:
+                requestHeaders["If-Range"] = if_range
+        port = f":{self.__port}" if self.__port is not None else ""
+
+        scheduler = self._scheduler(requestHeaders)
+        self.__deferRequest(scheduler, "GET", path)
+        try:
+            response = self.__streamSession().get(
+                f"{self.__scheme}://{self.__hostname}{port}{path}",
+                headers=requestHeaders,
+                timeout=self.__timeout,
+                verify=self.__verify,
+                stream=True,
+                allow_redirects=True,
+            )
+            # rate limit headers are those of the API response, not of the storage host it redirected to
+            apiResponse = response.history[0] if response.history else response
+            apiHeaders = {k.lower(): v for k, v in apiResponse.headers.items()}
+            scheduler.update(apiHeaders)
+            self._processResponseHeaders(apiHeaders)
+        finally:
+            scheduler.release("GET")
+
+        status = response.status_code
+        responseHeaders = {k.lower(): v for k, v in response.headers.items()}
+        self.__log("GET", path, requestHeaders, None, status, responseHeaders, "<stream>")
+
+        if status >= 400:
+            output = response.text
+            response.close()
+            self.__check(status, responseHeaders, output)
+
+        def chunks() -> Iterator[bytes]:
+            try:
+                yield from response.iter_content(chunk_size)
+            finally:
+                response.close()
+
+        return status, responseHeaders, chunks()
+
+    def getFile(
+        self,
+        url: str,
+        file: Union[str, BinaryIO],
+        headers: Optional[Dict[str, str]] = None,
+        chunk_size: int = Consts.DEFAULT_CHUNK_SIZE,
+        resume: bool = False,
+        algorithm: str = "sha256",
+    ) -> str:
+        """
+        Downloads the content of the given API url to the file at the given path, or into the given binary file
+        object, chunk by chunk.
+
+        With resume=True, a partially downloaded file at the given path is completed by requesting the missing range.
+        The ETag of such a download is kept in a file next to it, the ``.etag`` suffix appended, until it completes.
+        The missing range is only appended if the content still has that ETag, otherwise the file is replaced.
+        Returns the hex digest of the entire content computed with the given hashlib algorithm while downloading.
+        """
+        assert isinstance(file, str) or hasattr(file, "write"), file
+        digest = hashlib.new(algorithm)
+
+        def write(chunks: Iterator[bytes], f: BinaryIO) -> None:
+            for chunk in chunks:
+                f.write(chunk)
+                digest.update(chunk)
+
+        def digestFile(path: str) -> None:
+            with open(path, "rb") as downloaded:
+                for chunk in iter(lambda: downloaded.read(chunk_size), b""):
+                    digest.update(chunk)
+
+        if not isinstance(file, str):
+            status, _, chunks = self.getStream(url, headers, chunk_size)
+            try:
+                write(chunks, file)
+            finally:
+                chunks.close()  # type: ignore
+            return digest.hexdigest()
+
+        etagFile = f"{file}.etag"
+        offset, etag = 0, None
+        if resume and os.path.exists(file) and os.path.exists(etagFile):
+            # a partial download without ETag cannot be validated, it is downloaded again
+            with open(etagFile) as stored:
+                etag = stored.read()
+            offset = os.path.getsize(file)
+
+        try:
+            status, responseHeaders, chunks = self.getStream(url, headers, chunk_size, offset, etag)
+            if status == 206 and responseHeaders.get(Consts.RES_ETAG) != etag:
+                # the server ignored If-Range, the range belongs to other content
+                chunks.close()  # type: ignore
+                os.remove(etagFile)
+                return self.getFile(url, file, headers, chunk_size, resume, algorithm)
+        except GithubException.GithubException as e:
+            if e.status != 416 or offset == 0:
+                raise
+            os.remove(etagFile)
+            if (e.headers or {}).get("content-range") != f"bytes */{offset}":
+                # the file is longer than the content, which has changed since
+                return self.getFile(url, file, headers, chunk_size, resume, algorithm)
+            # the file has been downloaded completely before
+            digestFile(file)
+            return digest.hexdigest()
+
+        try:
+            if resume:
+                # weak ETags cannot validate ranges
+                etag = responseHeaders.get(Consts.RES_ETAG)
+                if etag is not None and not etag.startswith("W/"):
+                    with open(etagFile, "w") as stored:
+                        stored.write(etag)
+                elif os.path.exists(etagFile):
+                    os.remove(etagFile)
+            if status == 206:
+                # the downloaded part is part of the digest
+                digestFile(file)
+                with open(file, "ab") as f:
+                    write(chunks, f)
+            else:
+                # the server sends the entire content
+                with open(file, "wb") as f:
+                    write(chunks, f)
+        finally:
+            chunks.close()  # type: ignore
+        if resume and os.path.exists(etagFile):
+            os.remove(etagFile)
+        return digest.hexdigest()
+
+    def __streamSession(self) -> requests.Session:
+        # downloads are streamed through a dedicated session, which follows redirections to other hosts
+        with self.__connection_lock:
+            if self.__stream_session is None:
+                session = requests.Session()
+                # disable falling back to .netrc file, see HTTPSRequestsConnectionClass
+                session.auth = Requester.noopAuth
+                adapter = requests.adapters.HTTPAdapter(
+                    max_retries=requests.adapters.DEFAULT_RETRIES if self.__retry is None else self.__retry,
+                    pool_connections=self.__pool_size or requests.adapters.DEFAULT_POOLSIZE,
+                    pool_maxsize=self.__pool_size or requests.adapters.DEFAULT_POOLSIZE,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                self.__stream_session = session
+            return self.__stream_session
+
     def __requestEncode(
         self,
         cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]],
@@ -776,7 +1237,64 @@ class Requester:
         requestHeaders: Optional[Dict[str, str]],
         input: Optional[T],
         encode: Callable[[T], Tuple[str, Any]],
-    ) -> Tuple[int, Dict[str, Any], str]:
+    ) -> Tuple[int, Dict[str, Any], Union[str, bytes]]:
+        # the request is prepared again when it is retried with another authorization
+        originalHeaders = dict(requestHeaders) if requestHeaders is not None else None
+        while True:
+            path, headers, encoded_input = self._prepareRequest(verb, url, parameters, requestHeaders, input, encode)
+            # responses from custom hosts are not cached as url does not identify the host
+            cacheKey = self._cacheKey(verb, path, headers) if cnx is None else None
+            cached = self._addCacheValidators(cacheKey, headers)
+
+            self.NEW_DEBUG_FRAME(headers)
+
+            # streamed input cannot be sent again
+            retryable = not isinstance(encoded_input, IOBase)
+            output: Union[str, bytes]
+            if cached is not None and self.__cache is not None and self.__cache.is_fresh(cached):
+                # fresh responses are used without contacting the server, their rate limit headers are outdated
+                status, responseHeaders, output = 200, dict(cached.headers), cached.output
+            else:
+                status, responseHeaders, output = self.__requestRawCoalesced(cnx, verb, path, headers, encoded_input)
+                status, responseHeaders, output = self._useCache(cacheKey, cached, status, responseHeaders, output)
+
+                self._processResponseHeaders(responseHeaders)
+
+            self.DEBUG_ON_RESPONSE(status, responseHeaders, output)
+
+            if not (retryable and self._failover(headers, status, responseHeaders, output)):
+                return status, responseHeaders, output
+            requestHeaders = dict(originalHeaders) if originalHeaders is not None else None
+
+    def _failover(
+        self, requestHeaders: Dict[str, str], status: int, responseHeaders: Dict[str, Any], output: Union[str, bytes]
+    ) -> bool:
+        # Returns True if the primary rate limit of the request's authorization has been exceeded
+        # and the auth provides another authorization to retry the request with, see github.Auth.TokenPool
+        if self.__auth is None or status != 403:
+            return False
+        try:
+            data = self.__structuredFromJson(output)
+        except ValueError:
+            return False
+        if not isinstance(data, dict) or not self.isPrimaryRateLimitError(data.get("message", "")):
+            return False
+        retry = self.__auth.rate_limit_exceeded(requestHeaders, responseHeaders)
+        if retry:
+            self._logger.info("Rate limit exceeded, retrying request with another authorization")
+        return retry
+
+    def _prepareRequest(
+        self,
+        verb: str,
+        url: str,
+        parameters: Optional[Dict[str, Any]],
+        requestHeaders: Optional[Dict[str, str]],
+        input: Optional[T],
+        encode: Callable[[T], Tuple[str, Any]],
+    ) -> Tuple[str, Dict[str, str], Any]:
+        # Builds url (path and query), headers and encoded body of a request.
+        # Shared with github.AsyncRequester, which sends the request through a different transport.
         assert verb in ["HEAD", "GET", "POST", "PATCH", "PUT", "DELETE"]
         if parameters is None:
             parameters = {}
@@ -784,7 +1302,7 @@ class Requester:
             requestHeaders = {}
 
         if self.__auth is not None:
-            requestHeaders["Authorization"] = f"{self.__auth.token_type} {self.__auth.token}"
+            self.__auth.authentication(requestHeaders)
         requestHeaders["User-Agent"] = self.__userAgent
 
         url = self.__makeAbsoluteUrl(url)
@@ -794,10 +1312,60 @@ class Requester:
         if input is not None:
             requestHeaders["Content-Type"], encoded_input = encode(input)
 
-        self.NEW_DEBUG_FRAME(requestHeaders)
+        return url, requestHeaders, encoded_input
 
-        status, responseHeaders, output = self.__requestRaw(cnx, verb, url, requestHeaders, encoded_input)
+    def _cacheKey(self, verb: str, url: str, requestHeaders: Dict[str, str]) -> Optional[str]:
+        # Returns the cache key of the response to the given prepared request, None if it is not to be cached.
+        # Requests that bring their own conditional headers (e.g. CompletableGithubObject.update) bypass the cache.
+        if self.__cache is None or verb != "GET":
+            return None
+        if Consts.REQ_IF_NONE_MATCH in requestHeaders or Consts.REQ_IF_MODIFIED_SINCE in requestHeaders:
+            return None
+        port = f":{self.__port}" if self.__port is not None else ""
+        authorization = hashlib.sha256(requestHeaders.get("Authorization", "").encode("utf-8")).hexdigest()
+        return json.dumps(
+            [f"{self.__scheme}://{self.__hostname}{port}{url}", requestHeaders.get("Accept"), authorization]
+        )
+
+    def _addCacheValidators(self, key: Optional[str], requestHeaders: Dict[str, str]) -> Optional[CachedResponse]:
+        # Makes the request conditional on the cached response, which is returned
+        if key is None:
+            return None
+        assert self.__cache is not None
+        cached = self.__cache.get(key)
+        if cached is not None:
+            if Consts.RES_ETAG in cached.headers:
+                requestHeaders[Consts.REQ_IF_NONE_MATCH] = cached.headers[Consts.RES_ETAG]
+            if Consts.RES_LAST_MODIFIED in cached.headers:
+                requestHeaders[Consts.REQ_IF_MODIFIED_SINCE] = cached.headers[Consts.RES_LAST_MODIFIED]
+        return cached
+
+    def _useCache(
+        self,
+        key: Optional[str],
+        cached: Optional[CachedResponse],
+        status: int,
+        responseHeaders: Dict[str, Any],
+        output: Union[str, bytes],
+    ) -> Tuple[int, Dict[str, Any], Union[str, bytes]]:
+        # Returns the cached response if the server has not modified it, otherwise caches the given response
+        if key is None:
+            return status, responseHeaders, output
+        assert self.__cache is not None
+        if status == 304 and cached is not None:
+            # headers of the 304 response (e.g. rate limit) are more recent than the cached headers
+            headers = dict(cached.headers)
+            headers.update(responseHeaders)
+            self.__cache.set(key, CachedResponse(headers, cached.output, time.time()))
+            return 200, dict(headers), cached.output
+        if status == 200 and (Consts.RES_ETAG in responseHeaders or Consts.RES_LAST_MODIFIED in responseHeaders):
+            self.__cache.set(key, CachedResponse(dict(responseHeaders), self.__text(output), time.time()))
+        elif cached is not None:
+            self.__cache.delete(key)
+        return status, responseHeaders, output
 
+    def _processResponseHeaders(self, responseHeaders: Dict[str, Any]) -> None:
+        # Updates rate limiting and oauth scopes from the given (lower-cased) response headers
         if Consts.headerRateRemaining in responseHeaders and Consts.headerRateLimit in responseHeaders:
             self.rate_limiting = (
                 # ints expected but sometimes floats returned: https://github.com/PyGithub/PyGithub/pull/2697
@@ -811,8 +1379,39 @@ class Requester:
         if Consts.headerOAuthScopes in responseHeaders:
             self.oauth_scopes = responseHeaders[Consts.headerOAuthScopes].split(", ")
 
-        self.DEBUG_ON_RESPONSE(status, responseHeaders, output)
+    def __requestRawCoalesced(
+        self,
+        cnx: Optional[Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]],
+        verb: str,
+        url: str,
+        requestHeaders: Dict[str, str],
+        input: Optional[Any],
+    ) -> Tuple[int, Dict[str, Any], Union[str, bytes]]:
+        # With coalesce_requests, a GET request that is identical to a request currently sent by another thread
+        # (same url, parameters and headers, including authorization) waits for and returns that response
+        if not self.__coalesce_requests or verb != "GET" or cnx is not None or input is not None:
+            return self.__requestRaw(cnx, verb, url, requestHeaders, input)
+
+        key = json.dumps([url, sorted(requestHeaders.items())])
+        with self.__in_flight_lock:
+            inFlight = self.__in_flight.get(key)
+            if inFlight is None:
+                future: "Future[Tuple[int, Dict[str, Any], Union[str, bytes]]]" = Future()
+                self.__in_flight[key] = future
+        if inFlight is not None:
+            status, responseHeaders, output = inFlight.result()
+            return status, dict(responseHeaders), output
 
+        try:
+            status, responseHeaders, output = self.__requestRaw(cnx, verb, url, requestHeaders, input)
+        except BaseException as e:
+            with self.__in_flight_lock:
+                del self.__in_flight[key]
+            future.set_exception(e)
+            raise
+        with self.__in_flight_lock:
+            del self.__in_flight[key]
+        future.set_result((status, dict(responseHeaders), output))
         return status, responseHeaders, output
 
     def __requestRaw(
@@ -822,8 +1421,9 @@ class Requester:
         url: str,
         requestHeaders: Dict[str, str],
         input: Optional[Any],
-    ) -> Tuple[int, Dict[str, Any], str]:
-        self.__deferRequest(verb)
+    ) -> Tuple[int, Dict[str, Any], Union[str, bytes]]:
+        scheduler = self._scheduler(requestHeaders)
+        self.__deferRequest(scheduler, verb, url)
 
         try:
             original_cnx = cnx
@@ -834,13 +1434,15 @@ class Requester:
 
             status = response.status
             responseHeaders = {k.lower(): v for k, v in response.getheaders()}
-            output = response.read()
+            # the JSON decoder is given the raw bytes, when the connection provides them
+            output = response.content if isinstance(response, RequestsResponse) else response.read()
 
             if input:
                 if isinstance(input, IOBase):
                     input.close()
 
             self.__log(verb, url, requestHeaders, input, status, responseHeaders, output)
+            scheduler.update(responseHeaders)
 
             if status == 202 and (
                 verb == "GET" or verb == "HEAD"
@@ -849,61 +1451,83 @@ class Requester:
                 return self.__requestRaw(original_cnx, verb, url, requestHeaders, input)
 
             if status == 301 and "location" in responseHeaders:
-                location = responseHeaders["location"]
-                o = urllib.parse.urlparse(location)
-                if o.scheme != self.__scheme:
-                    raise RuntimeError(
-                        f"Github server redirected from {self.__scheme} protocol to {o.scheme}, "
-                        f"please correct your Github server URL via base_url: Github(base_url=...)"
-                    )
-                if o.hostname != self.__hostname:
-                    raise RuntimeError(
-                        f"Github server redirected from host {self.__hostname} to {o.hostname}, "
-                        f"please correct your Github server URL via base_url: Github(base_url=...)"
-                    )
-                if o.path == url:
-                    port = ":" + str(self.__port) if self.__port is not None else ""
-                    requested_location = f"{self.__scheme}://{self.__hostname}{port}{url}"
-                    raise RuntimeError(
-                        f"Requested {requested_location} but server redirected to {location}, "
-                        f"you may need to correct your Github server URL "
-                        f"via base_url: Github(base_url=...)"
-                    )
-                if self._logger.isEnabledFor(logging.INFO):
-                    self._logger.info(f"Following Github server redirection from {url} to {o.path}")
-                return self.__requestRaw(original_cnx, verb, o.path, requestHeaders, input)
+                path = self._redirectPath(url, responseHeaders["location"])
+                return self.__requestRaw(original_cnx, verb, path, requestHeaders, input)
 
             return status, responseHeaders, output
         finally:
             # we record the time of this request after it finished
             # to defer next request starting from this request's end, not start
-            self.__recordRequestTime(verb)
+            scheduler.release(verb)
+
+    def _redirectPath(self, url: str, location: str) -> str:
+        # Returns the path to follow for a 301 redirection from url to location,
+        # raises if that redirection indicates a misconfigured base_url
+        o = urllib.parse.urlparse(location)
+        if o.scheme != self.__scheme:
+            raise RuntimeError(
+                f"Github server redirected from {self.__scheme} protocol to {o.scheme}, "
+                f"please correct your Github server URL via base_url: Github(base_url=...)"
+            )
+        if o.hostname != self.__hostname:
+            raise RuntimeError(
+                f"Github server redirected from host {self.__hostname} to {o.hostname}, "
+                f"please correct your Github server URL via base_url: Github(base_url=...)"
+            )
+        if o.path == url:
+            port = ":" + str(self.__port) if self.__port is not None else ""
+            requested_location = f"{self.__scheme}://{self.__hostname}{port}{url}"
+            raise RuntimeError(
+                f"Requested {requested_location} but server redirected to {location}, "
+                f"you may need to correct your Github server URL "
+                f"via base_url: Github(base_url=...)"
+            )
+        if self._logger.isEnabledFor(logging.INFO):
+            self._logger.info(f"Following Github server redirection from {url} to {o.path}")
+        return o.path
+
+    def _scheduler(self, requestHeaders: Dict[str, str]) -> RequestScheduler:
+        # Returns the scheduler shared by all requesters that use the authorization of the given request.
+        # The requester references the scheduler, so that its state is kept between requests.
+        authorization = requestHeaders.get("Authorization")
+        scheduler = self.__scheduler
+        if scheduler is None or authorization != self.__scheduler_authorization:
+            scheduler = RequestScheduler.get(self.__hostname, authorization)
+            self.__scheduler = scheduler
+            self.__scheduler_authorization = authorization
+        return scheduler
+
+    def _rateLimitResource(self, url: str) -> str:
+        # Returns the rate limit resource that requests to the given absolute path count against
+        if url.startswith(self.__graphql_prefix):
+            return "graphql"
+        if url.startswith(f"{self.__prefix}/search/code"):
+            return "code_search"
+        if url.startswith(f"{self.__prefix}/search/"):
+            return "search"
+        return CORE_RESOURCE
+
+    def _reserveRequest(self, scheduler: RequestScheduler, verb: str, url: str) -> float:
+        # Returns the seconds to wait before sending the next request
+        defer = scheduler.reserve(
+            verb,
+            self.__seconds_between_requests,
+            self.__seconds_between_writes,
+            self.__priority,
+            self._rateLimitResource(url),
+        )
+        if defer > 0:
+            self._logger.debug(f"sleeping {defer}s before next GitHub request")
+        return defer
 
-    def __deferRequest(self, verb: str) -> None:
+    def __deferRequest(self, scheduler: RequestScheduler, verb: str, url: str) -> None:
         # Ensures at least self.__seconds_between_requests seconds have passed since any last request
-        # and self.__seconds_between_writes seconds have passed since last write request (if verb refers to a write).
-        # Uses self.__last_requests.
-        requests = self.__last_requests.values()
-        writes = [l for v, l in self.__last_requests.items() if v != "GET"]
-
-        last_request = max(requests) if requests else 0
-        last_write = max(writes) if writes else 0
-
-        next_request = (last_request + self.__seconds_between_requests) if self.__seconds_between_requests else 0
-        next_write = (last_write + self.__seconds_between_writes) if self.__seconds_between_writes else 0
-
-        next = next_request if verb == "GET" else max(next_request, next_write)
-        defer = max(next - datetime.now(timezone.utc).timestamp(), 0)
+        # and self.__seconds_between_writes seconds have passed since last write request (if verb refers to a write),
+        # and the remaining rate limit allows for this request.
+        defer = self._reserveRequest(scheduler, verb, url)
         if defer > 0:
-            if self.__logger is None:
-                self.__logger = logging.getLogger(__name__)
-            self.__logger.debug(f"sleeping {defer}s before next GitHub request")
             time.sleep(defer)
 
-    def __recordRequestTime(self, verb: str) -> None:
-        # Updates self.__last_requests with current timestamp for given verb
-        self.__last_requests[verb] = datetime.now(timezone.utc).timestamp()
-
     def __makeAbsoluteUrl(self, url: str) -> str:
         # URLs generated locally will be relative to __base_url
         # URLs returned from the server will start with __base_url
@@ -939,11 +1563,20 @@ class Requester:
     ) -> Union[HTTPRequestsConnectionClass, HTTPSRequestsConnectionClass]:
         if self.__persist and self.__connection is not None:
             return self.__connection
+        if self.__persist:
+            # connections are shared by all requesters of this process with the same host and settings
+            return ConnectionPool.get(
+                self.__connectionClass,
+                self.__hostname,
+                self.__port,
+                self.__retry,
+                self.__pool_size,
+                self.__timeout,
+                self.__verify,
+            )
 
         with self.__connection_lock:
             if self.__connection is not None:
-                if self.__persist:
-                    return self.__connection
                 self.__connection.close()
             self.__connection = self.__connectionClass(
                 self.__hostname,
@@ -970,7 +1603,7 @@ class Requester:
         input: Optional[Any],
         status: Optional[int],
         responseHeaders: Dict[str, Any],
-        output: Optional[str],
+        output: Optional[Union[str, bytes]],
     ) -> None:
         if self._logger.isEnabledFor(logging.DEBUG):
             headersForRequest = requestHeaders.copy()
@@ -982,9 +1615,9 @@ class Requester:
                 elif requestHeaders["Authorization"].startswith("Bearer"):
                     headersForRequest["Authorization"] = "Bearer (jwt removed)"
                 else:  # pragma no cover (Cannot happen, but could if we add an authentication method => be prepared)
-                    headersForRequest[
-                        "Authorization"
-                    ] = "(unknown auth removed)"  # pragma no cover (Cannot happen, but could if we add an authentication method => be prepared)
+                    headersForRequest["Authorization"] = (
+                        "(unknown auth removed)"  # pragma no cover (Cannot happen, but could if we add an authentication method => be prepared)
+                    )
             self._logger.debug(
                 "%s %s://%s%s %s %s ==> %i %s %s",
                 verb,
@@ -995,7 +1628,7 @@ class Requester:
                 input,
                 status,
                 responseHeaders,
-                output,
+                self.__text(output) if output is not None else None,
             )
 
 
@@ -0,0 +1,287 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import abc
+import heapq
+import itertools
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+import weakref
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Tuple
+
+
+class StoredToken(NamedTuple):
+    """
+    An access token, as stored by a :class:`TokenStore`.
+    """
+
+    token: str
+    # unix timestamp of when the token expires
+    expires_at: float
+
+
+class TokenStore(abc.ABC):
+    """
+    This class is the base class of all stores of installation access tokens for Auth.AppInstallationAuth.
+
+    Authentications sharing a store use the same token for the same app, installation and permissions, and only
+    one of them requests a new token when the stored token is about to expire. Implementations must be thread-safe.
+
+    """
+
+    @abc.abstractmethod
+    def get_or_refresh(self, key: str, refresh: Callable[[], StoredToken], min_ttl: float) -> StoredToken:
+        """
+        Returns the token stored for the given key if it expires in more than ``min_ttl`` seconds. Otherwise, calls
+        ``refresh`` to obtain a new token, stores and returns it. Concurrent callers wait for that token rather
+        than calling ``refresh`` themselves.
+        """
+
+
+class MemoryTokenStore(TokenStore):
+    """
+    This class stores tokens in memory, shared by the threads of a process.
+    """
+
+    def __init__(self) -> None:
+        self.__tokens: Dict[str, StoredToken] = {}
+        self.__lock = threading.Lock()
+        # tokens of different keys are refreshed concurrently
+        self.__key_locks: Dict[str, threading.Lock] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # locks are not picklable
+        del state["_MemoryTokenStore__lock"]
+        del state["_MemoryTokenStore__key_locks"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__lock = threading.Lock()
+        self.__key_locks = {}
+
+    def get_or_refresh(self, key: str, refresh: Callable[[], StoredToken], min_ttl: float) -> StoredToken:
+        with self.__lock:
+            key_lock = self.__key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            token = self.__tokens.get(key)
+            if token is None or token.expires_at - time.time() <= min_ttl:
+                token = refresh()
+                self.__tokens[key] = token
+            return token
+
+
+class SqliteTokenStore(TokenStore):
+    """
+    This class stores tokens in an SQLite database file, which can be shared by threads and processes.
+
+    The process refreshing the token of a key holds a lease on that key, so other processes wait for that token
+    rather than refreshing it themselves, while tokens of other keys are refreshed concurrently. Database
+    transactions are never held while a token is refreshed. A lease that is not released within ``timeout``
+    seconds, e.g. because its process died, is taken over. The file contains access tokens and must be protected
+    accordingly.
+
+    """
+
+    # seconds between checks whether the lease of another process has been released
+    LEASE_POLL_INTERVAL = 0.05
+
+    def __init__(self, path: str, timeout: float = 30):
+        assert isinstance(path, str), path
+        assert timeout > 0, timeout
+        self.__path = path
+        self.__timeout = timeout
+        self.__connection: Optional[sqlite3.Connection] = None
+        self.__lock = threading.Lock()
+        # threads of this process wait for each other rather than polling the lease
+        self.__key_locks: Dict[str, threading.Lock] = {}
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        # locks and __connection are not picklable
+        del state["_SqliteTokenStore__lock"]
+        del state["_SqliteTokenStore__key_locks"]
+        del state["_SqliteTokenStore__connection"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self.__connection = None
+        self.__lock = threading.Lock()
+        self.__key_locks = {}
+
+    @property
+    def path(self) -> str:
+        return self.__path
+
+    def close(self) -> None:
+        """
+        Close the connection to the database.
+        """
+        with self.__lock:
+            if self.__connection is not None:
+                self.__connection.close()
+                self.__connection = None
+
+    def __connect(self) -> sqlite3.Connection:
+        # must be called while holding __lock
+        if self.__connection is None:
+            # autocommit mode, transactions are started explicitly
+            cnx = sqlite3.connect(self.__path, timeout=self.__timeout, check_same_thread=False, isolation_level=None)
+            cnx.execute("PRAGMA journal_mode=WAL")
+            cnx.execute(
+                "CREATE TABLE IF NOT EXISTS tokens (key TEXT PRIMARY KEY, token TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            cnx.execute(
+                "CREATE TABLE IF NOT EXISTS leases (key TEXT PRIMARY KEY, owner TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self.__connection = cnx
+        return self.__connection
+
+    @staticmethod
+    def __select(cnx: sqlite3.Connection, key: str, min_ttl: float) -> Optional[StoredToken]:
+        row = cnx.execute("SELECT token, expires_at FROM tokens WHERE key = ?", (key,)).fetchone()
+        if row is None or row[1] - time.time() <= min_ttl:
+            return None
+        return StoredToken(row[0], row[1])
+
+    def __acquire(self, key: str, min_ttl: float, owner: str) -> Tuple[Optional[StoredToken], bool]:
+        # Returns the stored token if it is valid, otherwise whether the key could be leased to owner.
+        # The short write transaction only makes the check and the lease atomic.
+        with self.__lock:
+            cnx = self.__connect()
+            token = self.__select(cnx, key, min_ttl)
+            if token is not None:
+                return token, False
+            cnx.execute("BEGIN IMMEDIATE")
+            try:
+                token = self.__select(cnx, key, min_ttl)
+                leased = False
+                if token is None:
+                    now = time.time()
+                    row = cnx.execute("SELECT expires_at FROM leases WHERE key = ?", (key,)).fetchone()
+                    if row is None or row[0] <= now:
+                        cnx.execute(
+                            "INSERT OR REPLACE INTO leases (key, owner, expires_at) VALUES (?, ?, ?)",
+                            (key, owner, now + self.__timeout),
+                        )
+                        leased = True
+                cnx.execute("COMMIT")
+            except BaseException:
+                cnx.execute("ROLLBACK")
+                raise
+            return token, leased
+
+    def __release(self, key: str, owner: str, token: Optional[StoredToken]) -> None:
+        # Stores the refreshed token, if any, and releases the lease of owner
+        with self.__lock:
+            cnx = self.__connect()
+            cnx.execute("BEGIN IMMEDIATE")
+            try:
+                if token is not None:
+                    cnx.execute(
+                        "INSERT OR REPLACE INTO tokens (key, token, expires_at) VALUES (?, ?, ?)",
+                        (key, token.token, token.expires_at),
+                    )
+                cnx.execute("DELETE FROM leases WHERE key = ? AND owner = ?", (key, owner))
+                cnx.execute("COMMIT")
+            except BaseException:
+                cnx.execute("ROLLBACK")
+                raise
+
+    def get_or_refresh(self, key: str, refresh: Callable[[], StoredToken], min_ttl: float) -> StoredToken:
+        with self.__lock:
+            key_lock = self.__key_locks.setdefault(key, threading.Lock())
+        with key_lock:
+            owner = uuid.uuid4().hex
+            while True:
+                stored, leased = self.__acquire(key, min_ttl, owner)
+                if stored is not None:
+                    return stored
+                if leased:
+                    break
+                # another process refreshes the token
+                time.sleep(self.LEASE_POLL_INTERVAL)
+
+            token: Optional[StoredToken] = None
+            try:
+                token = refresh()
+                return token
+            finally:
+                self.__release(key, owner, token)
+
+
+class TokenRefresher:
+    """
+    This class renews tokens in a daemon thread before they expire, so that requests do not wait for a renewal.
+
+    Scheduled refresh functions are referenced weakly, they are dropped once their authentication is garbage
+    collected. A refresh function returns the unix timestamp of its next refresh. When it raises, the refresh is
+    retried after ``retry_interval`` seconds.
+
+    """
+
+    def __init__(self, retry_interval: float = 10):
+        assert retry_interval > 0, retry_interval
+        self.__retry_interval = retry_interval
+        self.__condition = threading.Condition()
+        # heap of the time of the next refresh, a sequence number, the object and function of the refresh method
+        self.__scheduled: List[Tuple[float, int, "weakref.ref[Any]", Callable[[Any], float]]] = []
+        self.__sequence = itertools.count()
+        self.__thread: Optional[threading.Thread] = None
+
+    def schedule(self, refresh: Callable[[], float], at: float) -> None:
+        """
+        Schedules the bound method ``refresh`` to be called at the unix timestamp ``at``.
+        """
+        with self.__condition:
+            obj, func = refresh.__self__, refresh.__func__  # type: ignore[attr-defined]
+            heapq.heappush(self.__scheduled, (at, next(self.__sequence), weakref.ref(obj), func))
+            if self.__thread is None:
+                self.__thread = threading.Thread(target=self.__run, name="TokenRefresher", daemon=True)
+                self.__thread.start()
+            self.__condition.notify()
+
+    def __run(self) -> None:
+        while True:
+            with self.__condition:
+                while not self.__scheduled or self.__scheduled[0][0] > time.time():
+                    self.__condition.wait(self.__scheduled[0][0] - time.time() if self.__scheduled else None)
+                _, _, ref, func = heapq.heappop(self.__scheduled)
+
+            obj = ref()
+            if obj is None:
+                continue
+            try:
+                at = func(obj)
+            except Exception:
+                logging.getLogger(__name__).warning("Refreshing token failed", exc_info=True)
+                at = time.time() + self.__retry_interval
+            self.schedule(func.__get__(obj), at)
+            del obj
+
+
+# refresher used by authentications that refresh their token in the background
+DEFAULT_REFRESHER = TokenRefresher()
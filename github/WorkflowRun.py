@@ -32,11 +32,12 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Any, NamedTuple
+from typing import TYPE_CHECKING, Any, BinaryIO, Iterator, NamedTuple
 
 import github.GitCommit
 import github.PullRequest
 import github.WorkflowJob
+from github import Consts
 from github.GithubObject import Attribute, CompletableGithubObject, NotSet, Opt, is_optional
 from github.PaginatedList import PaginatedList
 
@@ -271,6 +272,28 @@ class WorkflowRun(CompletableGithubObject):
         status, _, _ = self._requester.requestJson("DELETE", self.url)
         return status == 204
 
+    def download_logs_to(
+        self, path_or_fileobj: str | BinaryIO, chunk_size: int = Consts.DEFAULT_CHUNK_SIZE, resume: bool = False
+    ) -> str:
+        """
+        :calls: `GET /repos/{owner}/{repo}/actions/runs/{run_id}/logs <https://docs.github.com/en/rest/actions/workflow-runs#download-workflow-run-logs>`_
+        :param path_or_fileobj: path of the file to write, or binary file object
+        :param chunk_size: size of the chunks in bytes the logs archive is downloaded in
+        :param resume: complete a file at the given path partially downloaded with resume before, unless the
+            content has changed since
+        :rtype: string, the SHA-256 hex digest of the logs archive
+        """
+        return self._requester.getFile(self.logs_url, path_or_fileobj, None, chunk_size, resume)
+
+    def download_logs_stream(self, chunk_size: int = Consts.DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """
+        :calls: `GET /repos/{owner}/{repo}/actions/runs/{run_id}/logs <https://docs.github.com/en/rest/actions/workflow-runs#download-workflow-run-logs>`_
+        :param chunk_size: size of the chunks in bytes the logs archive is downloaded in
+        :rtype: iterator of bytes
+        """
+        status, headers, chunks = self._requester.getStream(self.logs_url, None, chunk_size)
+        return chunks
+
     def jobs(self, _filter: Opt[str] = NotSet) -> PaginatedList[WorkflowJob]:
         """
         :calls "`GET /repos/{owner}/{repo}/actions/runs/{run_id}/jobs <https://docs.github.com/en/rest/reference/actions#list-jobs-for-a-workflow-run>`_
@@ -48,8 +48,10 @@ All classes inherit from :class:`github.GithubObject.GithubObject`.
 
 import logging
 
-from . import Auth
+from . import Auth, Cache, ConnectionPool, RequestScheduler, TokenStore
 from .AppAuthentication import AppAuthentication
+from .AsyncMainClass import AsyncGithub
+from .BatchCompletion import complete_all
 from .GithubException import (
     BadAttributeException,
     BadCredentialsException,
@@ -62,6 +64,7 @@ from .GithubException import (
 )
 from .GithubIntegration import GithubIntegration
 from .GithubRetry import GithubRetry
+from .IncrementalSync import IncrementalSync
 from .InputFileContent import InputFileContent
 from .InputGitAuthor import InputGitAuthor
 from .InputGitTreeElement import InputGitTreeElement
@@ -91,19 +94,26 @@ def enable_console_debug_logging() -> None:  # pragma no cover (Function useful
 __all__ = [
     "Auth",
     "AppAuthentication",
+    "AsyncGithub",
     "BadAttributeException",
     "BadCredentialsException",
     "BadUserAgentException",
+    "Cache",
+    "ConnectionPool",
+    "complete_all",
     "enable_console_debug_logging",
     "Github",
     "GithubException",
     "GithubIntegration",
     "GithubRetry",
     "IncompletableObject",
+    "IncrementalSync",
     "InputFileContent",
     "InputGitAuthor",
     "InputGitTreeElement",
     "RateLimitExceededException",
+    "RequestScheduler",
+    "TokenStore",
     "TwoFactorException",
     "UnknownObjectException",
 ]
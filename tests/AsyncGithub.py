@@ -0,0 +1,299 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import asyncio
+import json
+import threading
+import unittest
+from unittest import mock
+
+from aiohttp import web
+
+import github
+from github.AsyncPaginatedList import AsyncPaginatedList
+from github.Repository import Repository
+
+
+class FakeResponse:
+    def __init__(self, status, headers, body):
+        self.status = status
+        self.headers = headers
+        self.__body = body
+
+    async def read(self):
+        return json.dumps(self.__body).encode("utf-8")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        pass
+
+
+class FakeSession:
+    def __init__(self, responses, overlap=None):
+        self.responses = responses
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        # responses are only returned once this many requests are in flight
+        self.overlap = overlap
+        self.overlapping = None
+
+    def request(self, verb, url, headers, data, allow_redirects):
+        self.requests.append((verb, url, headers, data))
+        status, response_headers, body = self.responses[url]
+        return self.Context(self, FakeResponse(status, response_headers, body))
+
+    class Context:
+        def __init__(self, session, response):
+            self.session = session
+            self.response = response
+
+        async def __aenter__(self):
+            self.session.in_flight += 1
+            self.session.max_in_flight = max(self.session.max_in_flight, self.session.in_flight)
+            if self.session.overlap is None:
+                # yield to the event loop so that concurrent requests overlap
+                await asyncio.sleep(0)
+                return self.response
+            if self.session.overlapping is None:
+                self.session.overlapping = asyncio.Event()
+            if self.session.in_flight == self.session.overlap:
+                self.session.overlapping.set()
+            await asyncio.wait_for(self.session.overlapping.wait(), 10)
+            return self.response
+
+        async def __aexit__(self, exc_type, exc_val, exc_tb):
+            self.session.in_flight -= 1
+
+
+class AsyncGithub(unittest.TestCase):
+    def setUp(self):
+        super().setUp()
+        # replay tests enable frame debugging globally, which does not apply to these fake responses
+        github.GithubObject.GithubObject.setCheckAfterInitFlag(False)
+        github.Requester.Requester.setDebugFlag(False)
+        github.Requester.Requester.setOnCheckMe(None)
+
+    def get_github(self, responses, overlap=None):
+        self.session = FakeSession(responses, overlap)
+        return github.AsyncGithub(
+            auth=github.Auth.Token("token"),
+            session=self.session,
+            seconds_between_requests=None,
+            seconds_between_writes=None,
+        )
+
+    def testGetRepo(self):
+        gh = self.get_github(
+            {
+                "https://api.github.com/repos/PyGithub/PyGithub": (
+                    200,
+                    {"X-RateLimit-Remaining": "4999", "X-RateLimit-Limit": "5000", "X-RateLimit-Reset": "1700000000"},
+                    {"full_name": "PyGithub/PyGithub", "stargazers_count": 6000},
+                )
+            }
+        )
+        repo = asyncio.run(gh.get_repo("PyGithub/PyGithub"))
+        self.assertIsInstance(repo, Repository)
+        self.assertEqual(repo.full_name, "PyGithub/PyGithub")
+        self.assertEqual(repo.stargazers_count, 6000)
+        self.assertEqual(gh.rate_limiting, (4999, 5000))
+        self.assertEqual(gh.rate_limiting_resettime, 1700000000)
+
+        verb, url, headers, data = self.session.requests[0]
+        self.assertEqual(verb, "GET")
+        self.assertEqual(headers["Authorization"], "token token")
+        self.assertEqual(headers["User-Agent"], "PyGithub/Python")
+        self.assertIsNone(data)
+
+    def testBlockingCallsDoNotBlockEventLoop(self):
+        threads = []
+
+        class BlockingAuth(github.Auth.Token):
+            # e.g. an installation authentication fetching an access token
+            def authentication(self, headers):
+                threads.append(threading.current_thread())
+                super().authentication(headers)
+
+        self.session = FakeSession({"https://api.github.com/users/login": (200, {}, {"login": "login"})})
+        gh = github.AsyncGithub(auth=BlockingAuth("token"), session=self.session, seconds_between_requests=None)
+        user = asyncio.run(gh.get_user("login"))
+        self.assertEqual(user.login, "login")
+        self.assertEqual(len(threads), 1)
+        self.assertIsNot(threads[0], threading.current_thread())
+        self.assertEqual(self.session.requests[0][2]["Authorization"], "token token")
+
+    def testNonBlockingCallsStayOnEventLoop(self):
+        threads = []
+        prepareRequest = github.Requester.Requester._prepareRequest
+
+        def _prepareRequest(requester, *args):
+            threads.append(threading.current_thread())
+            return prepareRequest(requester, *args)
+
+        # without cache, token authentication does no I/O and is not worth a round-trip to the executor
+        gh = self.get_github({"https://api.github.com/users/login": (200, {}, {"login": "login"})})
+        with mock.patch.object(github.Requester.Requester, "_prepareRequest", _prepareRequest):
+            user = asyncio.run(gh.get_user("login"))
+        self.assertEqual(user.login, "login")
+        self.assertEqual(threads, [threading.current_thread()])
+
+    def testConcurrentRequests(self):
+        names = [f"PyGithub/repo{i}" for i in range(20)]
+        gh = self.get_github(
+            {f"https://api.github.com/repos/{name}": (200, {}, {"full_name": name}) for name in names}, overlap=20
+        )
+
+        async def get_repos():
+            return await asyncio.gather(*[gh.get_repo(name) for name in names])
+
+        repos = asyncio.run(get_repos())
+        self.assertEqual([repo.full_name for repo in repos], names)
+        self.assertEqual(self.session.max_in_flight, 20)
+
+    def testException(self):
+        gh = self.get_github(
+            {"https://api.github.com/users/unknown": (404, {}, {"message": "Not Found"})},
+        )
+        with self.assertRaises(github.UnknownObjectException) as raisedexp:
+            asyncio.run(gh.get_user("unknown"))
+        self.assertEqual(raisedexp.exception.status, 404)
+
+    def testPagination(self):
+        gh = self.get_github(
+            {
+                "https://api.github.com/orgs/PyGithub/repos": (
+                    200,
+                    {"Link": '<https://api.github.com/organizations/1/repos?page=2>; rel="next"'},
+                    [{"full_name": "PyGithub/PyGithub"}, {"full_name": "PyGithub/Test"}],
+                ),
+                "https://api.github.com/organizations/1/repos?page=2": (
+                    200,
+                    {"Link": '<https://api.github.com/organizations/1/repos?page=1>; rel="prev"'},
+                    [{"full_name": "PyGithub/Other"}],
+                ),
+            }
+        )
+
+        async def collect(repos):
+            return [repo.full_name async for repo in repos]
+
+        repos = gh.get_organization_repos("PyGithub")
+        self.assertIsInstance(repos, AsyncPaginatedList)
+        self.assertEqual(
+            asyncio.run(collect(repos)),
+            ["PyGithub/PyGithub", "PyGithub/Test", "PyGithub/Other"],
+        )
+
+    def testSearchTotalCount(self):
+        gh = self.get_github(
+            {
+                "https://api.github.com/search/repositories?q=pygithub": (
+                    200,
+                    {},
+                    {"total_count": 1, "items": [{"full_name": "PyGithub/PyGithub"}]},
+                ),
+            }
+        )
+
+        async def collect(repos):
+            return [repo.full_name async for repo in repos]
+
+        repos = gh.search_repositories("pygithub")
+        self.assertEqual(asyncio.run(collect(repos)), ["PyGithub/PyGithub"])
+        self.assertEqual(repos.totalCount, 1)
+
+    def testRedirection(self):
+        gh = self.get_github(
+            {
+                "https://api.github.com/repos/EnricoMi/test": (
+                    301,
+                    {"Location": "https://api.github.com/repositories/638123443"},
+                    {"message": "Moved Permanently"},
+                ),
+                "https://api.github.com/repositories/638123443": (200, {}, {"name": "test-renamed"}),
+            }
+        )
+        repo = asyncio.run(gh.get_repo("EnricoMi/test"))
+        self.assertEqual(repo.name, "test-renamed")
+
+    def testThrottling(self):
+        session = FakeSession({"https://api.github.com/users/login": (200, {}, {"login": "login"})})
+        gh = github.AsyncGithub(session=session, seconds_between_requests=0.05, seconds_between_writes=None)
+
+        async def get_users():
+            loop = asyncio.get_event_loop()
+            start = loop.time()
+            await asyncio.gather(*[gh.get_user("login") for _ in range(3)])
+            return loop.time() - start
+
+        self.assertGreaterEqual(asyncio.run(get_users()), 0.1)
+        self.assertEqual(session.max_in_flight, 1)
+
+    def testClientSession(self):
+        received = []
+
+        async def get_repo(request):
+            received.append(request)
+            if request.match_info["repo"] == "unknown":
+                return web.json_response({"message": "Not Found"}, status=404)
+            return web.json_response(
+                {"full_name": f"{request.match_info['owner']}/{request.match_info['repo']}"},
+                headers={
+                    "X-RateLimit-Remaining": "4999",
+                    "X-RateLimit-Limit": "5000",
+                    "X-RateLimit-Reset": "1700000000",
+                },
+            )
+
+        async def run():
+            app = web.Application()
+            app.router.add_get("/api/v3/repos/{owner}/{repo}", get_repo)
+            runner = web.AppRunner(app)
+            await runner.setup()
+            site = web.TCPSite(runner, "127.0.0.1", 0)
+            await site.start()
+            port = runner.addresses[0][1]
+
+            # requests are sent through the aiohttp client session created by the requester
+            gh = github.AsyncGithub(
+                auth=github.Auth.Token("token"),
+                base_url=f"http://127.0.0.1:{port}/api/v3",
+                seconds_between_requests=None,
+                seconds_between_writes=None,
+            )
+            try:
+                repo = await gh.get_repo("PyGithub/PyGithub")
+                with self.assertRaises(github.UnknownObjectException):
+                    await gh.get_repo("PyGithub/unknown")
+                return repo, gh
+            finally:
+                await gh.close()
+                await runner.cleanup()
+
+        repo, gh = asyncio.run(run())
+        self.assertEqual(repo.full_name, "PyGithub/PyGithub")
+        self.assertEqual(gh.rate_limiting, (4999, 5000))
+        self.assertEqual(len(received), 2)
+        self.assertEqual(received[0].headers["Authorization"], "token token")
+        self.assertEqual(received[0].headers["User-Agent"], "PyGithub/Python")
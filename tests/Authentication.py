@@ -38,6 +38,7 @@
 ################################################################################
 
 import os
+import pickle
 from datetime import datetime, timezone
 from tempfile import NamedTemporaryFile
 from unittest import mock
@@ -314,6 +315,33 @@ class Authentication(Framework.BasicTestCase):
         )
         self.assertDictEqual(payload, {"iat": 1550055301, "exp": 1550055391, "iss": APP_ID})
 
+    def testAppAuthCachesJWT(self):
+        auth = github.Auth.AppAuth(APP_ID, PRIVATE_KEY)
+
+        with mock.patch("github.Auth.time") as t, mock.patch("github.Auth.jwt.encode", wraps=jwt.encode) as encode:
+            t.time = mock.Mock(return_value=1550055331.7435968)
+            token = auth.token
+            # the JWT expires at 1550055631, it is reused until 30 seconds before
+            t.time.return_value = 1550055600.5
+            self.assertEqual(auth.token, token)
+            self.assertEqual(encode.call_count, 1)
+
+            t.time.return_value = 1550055601
+            refreshed_token = auth.token
+            self.assertEqual(encode.call_count, 2)
+            # the parsed private key is reused
+            self.assertIs(encode.call_args_list[0].kwargs["key"], encode.call_args_list[1].kwargs["key"])
+
+        self.assertNotEqual(refreshed_token, token)
+        payload = jwt.decode(refreshed_token, key=PUBLIC_KEY, algorithms=["RS256"], options={"verify_exp": False})
+        self.assertDictEqual(payload, {"iat": 1550055541, "exp": 1550055901, "iss": APP_ID})
+
+        # the parsed key and lock are not pickled
+        restored = pickle.loads(pickle.dumps(auth))
+        with mock.patch("github.Auth.time") as t:
+            t.time = mock.Mock(return_value=1550055601)
+            self.assertEqual(restored.token, refreshed_token)
+
     def testUserAgent(self):
         g = github.Github(user_agent="PyGithubTester")
         self.assertEqual(g.get_user("jacquev6").name, "Vincent Jacques")
@@ -329,3 +357,91 @@ class Authentication(Framework.BasicTestCase):
         g = github.Github(auth=github.Auth.Token("ZmFrZV9sb2dpbjpmYWtlX3Bhc3N3b3Jk"))
         with self.assertRaises(github.GithubException):
             g.get_user().name
+
+    def testTokenPool(self):
+        auth = github.Auth.TokenPool([github.Auth.Token("token1"), github.Auth.Token("token2")])
+        g = github.Github(auth=auth)
+        requester = g._Github__requester
+
+        def authorization():
+            headers = {}
+            auth.authentication(headers)
+            return headers["Authorization"]
+
+        # tokens with unknown rate limit are used first
+        self.assertEqual(authorization(), "token token1")
+        reset = int(datetime.now(timezone.utc).timestamp()) + 3600
+        requester._scheduler({"Authorization": "token token1"}).update(
+            {"x-ratelimit-remaining": "4000", "x-ratelimit-limit": "5000", "x-ratelimit-reset": str(reset)}
+        )
+        self.assertEqual(authorization(), "token token2")
+        requester._scheduler({"Authorization": "token token2"}).update(
+            {"x-ratelimit-remaining": "3000", "x-ratelimit-limit": "5000", "x-ratelimit-reset": str(reset)}
+        )
+        self.assertEqual(authorization(), "token token1")
+        self.assertEqual(auth.current.token, "token1")
+
+    def testTokenPoolReadsChosenTokenOnly(self):
+        reads = []
+
+        class RefreshingToken(github.Auth.Token):
+            # e.g. an installation authentication requesting an access token
+            @property
+            def token(self):
+                reads.append(self._token)
+                return self._token
+
+        auths = [RefreshingToken(f"token{index}") for index in range(5)]
+        auth = github.Auth.TokenPool(auths)
+        g = github.Github(auth=auth)
+        requester = g._Github__requester
+        reset = str(int(datetime.now(timezone.utc).timestamp()) + 3600)
+
+        for index in range(5):
+            headers = {}
+            auth.authentication(headers)
+            self.assertEqual(headers["Authorization"], f"token token{index}")
+            requester._scheduler(headers).update(
+                {"x-ratelimit-remaining": str(4000 - index), "x-ratelimit-limit": "5000", "x-ratelimit-reset": reset}
+            )
+        self.assertEqual(reads, [f"token{index}" for index in range(5)])
+
+        # the auth with the most remaining rate limit is chosen from the rate limits seen before
+        headers = {}
+        auth.authentication(headers)
+        self.assertEqual(headers["Authorization"], "token token0")
+        self.assertEqual(reads[5:], ["token0"])
+
+    def testTokenPoolFailover(self):
+        auth = github.Auth.TokenPool([github.Auth.Token("token1"), github.Auth.Token("token2")])
+        g = github.Github(auth=auth)
+        reset = str(int(datetime.now(timezone.utc).timestamp()) + 3600)
+
+        def request(cnx, verb, url, headers, input):
+            if headers["Authorization"] == "token token1":
+                return (
+                    403,
+                    {"x-ratelimit-remaining": "0", "x-ratelimit-limit": "5000", "x-ratelimit-reset": reset},
+                    '{"message": "API rate limit exceeded for user ID 1."}',
+                )
+            return 200, {}, '{"login": "login"}'
+
+        with mock.patch.object(github.Requester.Requester, "_Requester__requestRaw", side_effect=request) as raw:
+            self.assertEqual(g.get_user("login").login, "login")
+            self.assertEqual(
+                [call.args[3]["Authorization"] for call in raw.call_args_list], ["token token1", "token token2"]
+            )
+
+            # the exhausted token is not used until its rate limit resets
+            self.assertEqual(g.get_user("login").login, "login")
+            self.assertEqual(raw.call_args_list[-1].args[3]["Authorization"], "token token2")
+
+    def testTokenPoolExhausted(self):
+        auth = github.Auth.TokenPool([github.Auth.Token("token1"), github.Auth.Token("token2")])
+        g = github.Github(auth=auth)
+        response = (403, {}, '{"message": "API rate limit exceeded for user ID 1."}')
+
+        with mock.patch.object(github.Requester.Requester, "_Requester__requestRaw", return_value=response) as raw:
+            with self.assertRaises(github.RateLimitExceededException):
+                g.get_user("login")
+            self.assertEqual(raw.call_count, 2)
@@ -0,0 +1,177 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import threading
+from datetime import datetime, timezone
+from unittest import mock
+
+import github
+from github.GithubException import GithubException
+from github.PullRequest import PullRequest
+
+from . import Framework
+
+URL = "https://api.github.com/repos/PyGithub/PyGithub/pulls"
+
+
+class BatchCompletion(Framework.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.lock = threading.Lock()
+        self.requests = []
+        self.requester = mock.Mock(
+            lazy_attributes=False,
+            identity_map=False,
+            base_url="https://api.github.com",
+            graphql_url="https://api.github.com/graphql",
+        )
+        self.requester.requestJsonAndCheck.side_effect = self.requestJsonAndCheck
+        self.requester.sharedObject.side_effect = lambda key, create: create()
+
+    def requestJsonAndCheck(self, verb, url, parameters=None, headers=None, input=None):
+        with self.lock:
+            self.requests.append((verb, url))
+        if verb == "POST" and "ids" not in input["variables"]:
+            return self.lookup(input["variables"])
+        if verb == "POST":
+            # the second pull request is not found
+            nodes = [
+                {"additions": 10 * i, "deletions": i, "mergedAt": "2024-01-02T03:04:05Z"} if i != 2 else None
+                for i in range(1, len(input["variables"]["ids"]) + 1)
+            ]
+            return {}, {"data": {"nodes": nodes}}
+        number = int(url.split("/")[-1])
+        return {}, {"url": url, "number": number, "additions": 20 * number, "deletions": 2 * number}
+
+    def lookup(self, variables):
+        data = {}
+        for name, value in variables.items():
+            if name.startswith("name"):
+                i = name[len("name") :]
+                owner = variables[f"owner{i}"]
+                data[f"r{i}"] = None if value == "missing" else self.repository(owner, value)
+            elif name.startswith("login"):
+                data[f"r{name[len('login') :]}"] = self.user(value)
+        if "error" in variables.values():
+            return {}, {"data": data, "errors": [{"type": "RATE_LIMITED", "message": "API rate limit exceeded"}]}
+        errors = [{"type": "NOT_FOUND", "path": [key]} for key, node in data.items() if node is None]
+        return {}, {"data": data, "errors": errors} if errors else {"data": data}
+
+    @staticmethod
+    def user(login):
+        return {
+            **dict.fromkeys(["company", "websiteUrl", "location", "email", "bio", "createdAt", "updatedAt"]),
+            "id": f"U_{login}",
+            "url": f"https://github.com/{login}",
+            "login": login,
+            "name": login.title(),
+            "followers": {"totalCount": 10},
+            "following": {"totalCount": 1},
+        }
+
+    @staticmethod
+    def repository(owner, name):
+        return {
+            **dict.fromkeys(["description", "homepageUrl", "isFork", "isArchived", "forkCount"]),
+            **dict.fromkeys(["createdAt", "updatedAt", "pushedAt"]),
+            "id": f"R_{name}",
+            "url": f"https://github.com/{owner}/{name}",
+            "name": name,
+            "nameWithOwner": f"{owner}/{name}",
+            "owner": {"login": owner},
+            "stargazerCount": len(name),
+            "isPrivate": False,
+        }
+
+    def pull(self, number, node_id=True):
+        attributes = {"url": f"{URL}/{number}", "number": number}
+        if node_id:
+            attributes["node_id"] = f"PR_{number}"
+        return PullRequest(self.requester, {}, attributes, completed=False)
+
+    def testCompleteAllThroughGraphql(self):
+        pulls = [self.pull(number) for number in range(1, 251)]
+        github.complete_all(pulls, fields=["additions", "deletions", "merged_at"])
+
+        # 3 GraphQL queries of at most 100 nodes, the pull requests not found are completed through REST
+        self.assertEqual(
+            sorted(self.requests),
+            [("GET", f"{URL}/{number}") for number in (102, 2, 202)] + [("POST", "https://api.github.com/graphql")] * 3,
+        )
+        self.assertEqual(pulls[0].additions, 10)
+        self.assertEqual(pulls[0].deletions, 1)
+        self.assertEqual(pulls[0].merged_at, datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc))
+        self.assertEqual(pulls[1].additions, 40)
+        self.assertEqual(pulls[249].additions, 500)
+        self.assertEqual(len(self.requests), 6)
+
+        # set fields are not requested again
+        self.requests.clear()
+        github.complete_all(pulls, fields=["additions"])
+        self.assertEqual(self.requests, [])
+
+    def testCompleteAllThroughRest(self):
+        # fields that are not available through GraphQL, and objects without node_id are completed through REST
+        pulls = [self.pull(1), self.pull(2, node_id=False)]
+        github.complete_all(pulls, fields=["additions", "maintainer_can_modify"])
+        github.complete_all([self.pull(3)])
+        self.assertEqual(sorted(self.requests), [("GET", f"{URL}/{number}") for number in (1, 2, 3)])
+        self.assertEqual([pull.additions for pull in pulls], [20, 40])
+
+    def testLookupRepos(self):
+        full_names = [f"PyGithub/repo{i}" for i in range(249)] + ["PyGithub/repo#249", "PyGithub/missing"]
+        repos = github.BatchCompletion.lookup_repos(self.requester, full_names)
+
+        # 3 queries of at most 100 aliased lookups
+        self.assertEqual(self.requests, [("POST", "https://api.github.com/graphql")] * 3)
+        self.assertEqual([repo.full_name for repo in repos[:-1]], full_names[:-1])
+        self.assertIsNone(repos[-1])
+        repo = repos[7]
+        self.assertEqual(repo.stargazers_count, 5)
+        self.assertEqual(repo._rawData["node_id"], "R_repo7")
+        self.assertEqual(repo.html_url, "https://github.com/PyGithub/repo7")
+        self.assertEqual(repo.url, "https://api.github.com/repos/PyGithub/repo7")
+        self.assertEqual(repo.owner.login, "PyGithub")
+        self.assertEqual(repo.owner.url, "https://api.github.com/users/PyGithub")
+        # names are quoted in urls
+        self.assertEqual(repos[-2].url, "https://api.github.com/repos/PyGithub/repo%23249")
+
+        # attributes not returned by GraphQL complete the repository through REST
+        self.requester.requestJsonAndCheck.side_effect = lambda verb, url, *args, **kwargs: (
+            {},
+            {"url": url, "full_name": "PyGithub/repo7", "default_branch": "main"},
+        )
+        self.assertEqual(repo.default_branch, "main")
+        self.requester.requestJsonAndCheck.assert_called_with("GET", "https://api.github.com/repos/PyGithub/repo7")
+
+    def testLookupUsers(self):
+        users = github.BatchCompletion.lookup_users(self.requester, ["jacquev6", "enricomi"], batch_size=1)
+        self.assertEqual(len(self.requests), 2)
+        self.assertEqual([user.name for user in users], ["Jacquev6", "Enricomi"])
+        self.assertEqual(users[1].url, "https://api.github.com/users/enricomi")
+        self.assertEqual(users[1].followers, 10)
+
+    def testLookupErrors(self):
+        self.requester.createException.side_effect = lambda status, headers, data: GithubException(
+            status, data, headers
+        )
+        with self.assertRaises(GithubException):
+            github.BatchCompletion.lookup_users(self.requester, ["jacquev6", "error"])
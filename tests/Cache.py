@@ -0,0 +1,166 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import os
+import sqlite3
+import tempfile
+import time
+from unittest import mock
+
+import github
+from github.Cache import CachedResponse, FileCache, MemoryCache, SqliteCache
+
+from . import Framework
+
+
+class Cache(Framework.TestCase):
+    def testRevalidation(self):
+        # test data copied from ConditionalRequestUpdate.setUp and ConditionalRequestUpdate.testDidNotUpdate
+        cache = MemoryCache()
+        g = github.Github(auth=self.login, cache=cache)
+        self.assertIs(g._Github__requester.cache, cache)
+
+        repo = g.get_repo("akfish/PyGithub")
+        self.assertEqual(len(cache), 1)
+
+        # the second request is answered with 304 Not Modified, so the cached response is used
+        cached_repo = g.get_repo("akfish/PyGithub")
+        self.assertEqual(cached_repo.raw_data, repo.raw_data)
+        self.assertEqual(cached_repo.etag, '"8600bedcb7fed1d8065e1693e05529ce"')
+        self.assertEqual(cached_repo.full_name, "akfish/PyGithub")
+
+    def testFreshResponse(self):
+        # test data copied from ConditionalRequestUpdate.setUp
+        cache = MemoryCache(ttl=60)
+        g = github.Github(auth=self.login, cache=cache)
+
+        repo = g.get_repo("akfish/PyGithub")
+        # the second response is fresh, so it is used without a request
+        cached_repo = g.get_repo("akfish/PyGithub")
+        self.assertEqual(cached_repo.raw_data, repo.raw_data)
+
+    def testMemoryCacheEvictsLeastRecentlyUsed(self):
+        cache = MemoryCache(max_entries=2)
+        cache.set("a", CachedResponse({"etag": "a"}, "A"))
+        cache.set("b", CachedResponse({"etag": "b"}, "B"))
+        self.assertEqual(cache.get("a"), CachedResponse({"etag": "a"}, "A"))
+        cache.set("c", CachedResponse({"etag": "c"}, "C"))
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        cache.delete("a")
+        self.assertIsNone(cache.get("a"))
+
+    def testFileCache(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = FileCache(path)
+            self.assertIsNone(cache.get("key"))
+            cache.set("key", CachedResponse({"etag": '"etag"'}, '{"id": 1}'))
+            self.assertEqual(FileCache(path).get("key"), CachedResponse({"etag": '"etag"'}, '{"id": 1}'))
+            cache.delete("key")
+            self.assertIsNone(cache.get("key"))
+
+    def testSqliteCache(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = SqliteCache(os.path.join(path, "cache.db"))
+            self.assertIsNone(cache.get("key"))
+            cache.set("key", CachedResponse({"etag": '"etag"'}, '{"id": 1}', 1700000000.0))
+
+            # another instance, e.g. in another process, sees the same responses
+            other = SqliteCache(os.path.join(path, "cache.db"))
+            self.assertEqual(other.get("key"), CachedResponse({"etag": '"etag"'}, '{"id": 1}', 1700000000.0))
+            other.delete("key")
+            self.assertIsNone(cache.get("key"))
+
+            cache.close()
+            other.close()
+
+    def testSqliteCacheEvictsLeastRecentlyUsed(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = SqliteCache(os.path.join(path, "cache.db"), max_size=250)
+            with mock.patch("github.Cache.time.time", return_value=1000.0):
+                cache.set("a", CachedResponse({}, "A" * 100))
+                cache.set("b", CachedResponse({}, "B" * 100))
+            with mock.patch("github.Cache.time.time", return_value=1100.0):
+                self.assertIsNotNone(cache.get("a"))
+                cache.set("c", CachedResponse({}, "C" * 100))
+            self.assertIsNone(cache.get("b"))
+            self.assertIsNotNone(cache.get("a"))
+            self.assertIsNotNone(cache.get("c"))
+            cache.close()
+
+    def testSqliteCacheWrites(self):
+        with tempfile.TemporaryDirectory() as path:
+            cache = SqliteCache(os.path.join(path, "cache.db"), max_size=1000)
+            cache.set("a", CachedResponse({}, "A" * 100))
+            cache.set("b", CachedResponse({}, "B" * 100))
+            cnx = cache._SqliteCache__connection
+
+            # cache hits within the access update interval do not write
+            changes = cnx.total_changes
+            for _ in range(3):
+                self.assertIsNotNone(cache.get("a"))
+            self.assertEqual(cnx.total_changes, changes)
+            with mock.patch(
+                "github.Cache.time.time", return_value=time.time() + SqliteCache.ACCESS_UPDATE_INTERVAL + 1
+            ):
+                self.assertIsNotNone(cache.get("a"))
+            self.assertEqual(cnx.total_changes, changes + 1)
+
+            # the total size is kept while responses are replaced, deleted and evicted
+            def total():
+                (value,) = cnx.execute("SELECT value FROM stats WHERE name = 'size'").fetchone()
+                (size,) = cnx.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()
+                self.assertEqual(value, size)
+                return value
+
+            self.assertEqual(total(), 206)
+            cache.set("a", CachedResponse({}, "A" * 200))
+            self.assertEqual(total(), 306)
+            cache.delete("b")
+            cache.delete("unknown")
+            self.assertEqual(total(), 203)
+            # sizes are counted in bytes
+            cache.set("é", CachedResponse({}, "é" * 100))
+            self.assertEqual(total(), 407)
+            cache.delete("é")
+            self.assertEqual(total(), 203)
+            for key in "cdefg":
+                cache.set(key, CachedResponse({}, key * 200))
+            self.assertLessEqual(total(), 1000)
+            cache.close()
+
+            # the total of a database without it is computed once
+            cnx = sqlite3.connect(cache.path)
+            with cnx:
+                cnx.execute("DROP TABLE stats")
+            cnx.close()
+            other = SqliteCache(cache.path)
+            other.get("a")
+            cnx = other._SqliteCache__connection
+            self.assertEqual(total(), 812)
+            other.close()
+
+    def testTtl(self):
+        cache = MemoryCache(ttl=60)
+        self.assertTrue(cache.is_fresh(CachedResponse({}, "", time.time())))
+        self.assertFalse(cache.is_fresh(CachedResponse({}, "", time.time() - 61)))
+        self.assertFalse(MemoryCache().is_fresh(CachedResponse({}, "", time.time())))
@@ -0,0 +1,110 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import array
+import math
+import unittest
+from datetime import datetime, timezone
+from unittest import mock
+
+import numpy
+import pyarrow
+
+import github.Columns
+
+# values of the fields of three issues, the second without milestone
+ELEMENTS = [
+    {"id": 1, "locked": False, "score": 1.5, "created_at": "2012-05-27T18:03:23Z", "milestone": {"number": 5}},
+    {"id": 2, "locked": True, "score": 2, "created_at": "2012-05-28T00:00:00Z", "milestone": None},
+    {"id": 3, "locked": False, "score": 0.5, "created_at": None, "milestone": {"number": 7}},
+]
+FIELDS = ["id", "locked", "score", "created_at", "milestone.number", "title"]
+
+
+class Columns(unittest.TestCase):
+    def columns(self, backend):
+        values = github.Columns.columnValues(ELEMENTS, FIELDS)
+        return {field: github.Columns.toColumn(values[field], backend) for field in FIELDS}
+
+    def testColumnValues(self):
+        values = github.Columns.columnValues(ELEMENTS, ["id", "milestone.number", "title"])
+        self.assertEqual(values, {"id": [1, 2, 3], "milestone.number": [5, None, 7], "title": [None, None, None]})
+
+    def testArrow(self):
+        columns = self.columns(github.Columns.ARROW)
+        for column in columns.values():
+            self.assertIsInstance(column, pyarrow.Array)
+        self.assertEqual(columns["id"].type, pyarrow.int64())
+        self.assertEqual(columns["id"].to_pylist(), [1, 2, 3])
+        self.assertEqual(columns["locked"].type, pyarrow.bool_())
+        self.assertEqual(columns["score"].type, pyarrow.float64())
+        self.assertEqual(columns["score"].to_pylist(), [1.5, 2.0, 0.5])
+        self.assertEqual(columns["created_at"].type, pyarrow.timestamp("s", tz="UTC"))
+        self.assertEqual(
+            columns["created_at"].to_pylist(),
+            [
+                datetime(2012, 5, 27, 18, 3, 23, tzinfo=timezone.utc),
+                datetime(2012, 5, 28, tzinfo=timezone.utc),
+                None,
+            ],
+        )
+        # missing values are nulls
+        self.assertEqual(columns["milestone.number"].type, pyarrow.int64())
+        self.assertEqual(columns["milestone.number"].to_pylist(), [5, None, 7])
+        self.assertEqual(columns["title"].null_count, 3)
+
+    def testNumpy(self):
+        columns = self.columns(github.Columns.NUMPY)
+        for column in columns.values():
+            self.assertIsInstance(column, numpy.ndarray)
+        self.assertEqual(columns["id"].dtype, numpy.int64)
+        self.assertEqual(columns["id"].tolist(), [1, 2, 3])
+        self.assertEqual(columns["locked"].dtype, numpy.bool_)
+        self.assertEqual(columns["locked"].tolist(), [False, True, False])
+        self.assertEqual(columns["score"].dtype, numpy.float64)
+        self.assertEqual(columns["score"].tolist(), [1.5, 2.0, 0.5])
+        self.assertEqual(columns["created_at"].dtype, numpy.dtype("datetime64[s]"))
+        self.assertEqual(columns["created_at"][0], numpy.datetime64("2012-05-27T18:03:23"))
+        self.assertTrue(numpy.isnat(columns["created_at"][2]))
+        # ints with missing values become floats with nan
+        self.assertEqual(columns["milestone.number"].dtype, numpy.float64)
+        self.assertEqual(columns["milestone.number"][0], 5)
+        self.assertTrue(math.isnan(columns["milestone.number"][1]))
+        self.assertEqual(columns["title"].dtype, object)
+        self.assertEqual(columns["title"].tolist(), [None, None, None])
+
+    def testArray(self):
+        columns = self.columns(github.Columns.ARRAY)
+        self.assertEqual(columns["id"], array.array("q", [1, 2, 3]))
+        self.assertEqual(columns["locked"], array.array("b", [0, 1, 0]))
+        self.assertEqual(columns["score"], array.array("d", [1.5, 2.0, 0.5]))
+        self.assertEqual(columns["created_at"][0], datetime(2012, 5, 27, 18, 3, 23, tzinfo=timezone.utc))
+        self.assertIsNone(columns["created_at"][2])
+        self.assertEqual(columns["milestone.number"].typecode, "d")
+        self.assertTrue(math.isnan(columns["milestone.number"][1]))
+        self.assertEqual(columns["title"], [None, None, None])
+
+    def testDefaultBackend(self):
+        self.assertEqual(github.Columns.defaultBackend(), github.Columns.ARROW)
+        with mock.patch.dict("sys.modules", {"pyarrow": None}):
+            self.assertEqual(github.Columns.defaultBackend(), github.Columns.NUMPY)
+            with mock.patch.dict("sys.modules", {"numpy": None}):
+                self.assertEqual(github.Columns.defaultBackend(), github.Columns.ARRAY)
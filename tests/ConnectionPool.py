@@ -0,0 +1,126 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from unittest import mock
+
+import github
+from github import Consts
+from github.ConnectionPool import ConnectionPool as ConnectionPoolImpl
+from github.GithubRetry import GithubRetry
+from github.Requester import HTTPSRequestsConnectionClass, Requester
+
+from . import Framework
+
+
+class ConnectionPool(Framework.TestCase):
+    def setUp(self):
+        super().setUp()
+        # use persistent real connections rather than the replaying connections of the tests
+        self.patches = [
+            mock.patch.object(Requester, "_Requester__persist", True),
+            mock.patch.object(Requester, "_Requester__httpsConnectionClass", HTTPSRequestsConnectionClass),
+        ]
+        for patch in self.patches:
+            patch.start()
+
+    def tearDown(self):
+        for patch in self.patches:
+            patch.stop()
+        ConnectionPoolImpl.configure()
+        super().tearDown()
+
+    @staticmethod
+    def connection(**kwargs):
+        return github.Github(**kwargs)._Github__requester._Requester__createConnection()
+
+    def testSharedConnections(self):
+        connection = self.connection()
+        self.assertIsInstance(connection, HTTPSRequestsConnectionClass)
+        # the connection is shared by requesters of different authentication and equal retry configuration
+        self.assertIs(self.connection(auth=github.Auth.Token("token")), connection)
+        self.assertIs(self.connection(retry=GithubRetry()), connection)
+        self.assertIs(
+            github.GithubIntegration(
+                auth=self.app_auth, retry=GithubRetry()
+            )._GithubIntegration__requester._Requester__createConnection(),
+            connection,
+        )
+
+        # requesters with other settings use other connections
+        self.assertIsNot(self.connection(timeout=5), connection)
+        self.assertIsNot(self.connection(verify=False), connection)
+        self.assertIsNot(self.connection(retry=3), connection)
+        self.assertIsNot(self.connection(base_url="https://my.enterprise.com/api/v3"), connection)
+
+        # closing a Github object does not close shared connections
+        with mock.patch.object(connection, "close") as close:
+            github.Github().close()
+        close.assert_not_called()
+
+    def testMaxConnections(self):
+        ConnectionPoolImpl.configure(max_connections=4)
+        connection = self.connection(pool_size=20)
+        self.assertEqual(connection.pool_size, 4)
+        self.assertIs(self.connection(pool_size=30), connection)
+        self.assertEqual(self.connection(pool_size=2).pool_size, 2)
+
+    def testIdleEviction(self):
+        ConnectionPoolImpl.configure(idle_timeout=60)
+        with mock.patch("github.ConnectionPool.time.monotonic", return_value=1000.0):
+            connection = self.connection()
+            idle = self.connection(timeout=5)
+        with mock.patch("github.ConnectionPool.time.monotonic", return_value=1050.0):
+            self.assertIs(self.connection(), connection)
+        with mock.patch("github.ConnectionPool.time.monotonic", return_value=1070.0), mock.patch.object(
+            idle, "close"
+        ) as close:
+            self.assertIs(self.connection(), connection)
+            self.assertIsNot(self.connection(timeout=5), idle)
+        close.assert_called_once_with()
+
+    def testOtherHosts(self):
+        requester = github.Github()._Github__requester
+        url = "https://uploads.github.com/repos/PyGithub/PyGithub/releases/1/assets?name=asset.zip"
+        connection = requester._Requester__customConnection(url)
+        self.assertEqual(connection.host, "uploads.github.com")
+        # uploads are not limited by the timeout of API requests
+        self.assertIsNone(connection.timeout)
+        self.assertEqual(requester._Requester__createConnection().timeout, Consts.DEFAULT_TIMEOUT)
+
+        # connections to other hosts are reused across requests and requesters, and not held by the requester
+        self.assertIs(requester._Requester__customConnection(url), connection)
+        self.assertIs(github.Github()._Github__requester._Requester__customConnection(url), connection)
+        self.assertEqual(len(requester._Requester__custom_connections), 0)
+        self.assertIsNot(requester._Requester__createConnection(), connection)
+
+    def testMaxPools(self):
+        ConnectionPoolImpl.configure(max_pools=2)
+        with mock.patch("github.ConnectionPool.time.monotonic", return_value=1000.0):
+            first = self.connection(timeout=1)
+        with mock.patch("github.ConnectionPool.time.monotonic", return_value=1001.0):
+            second = self.connection(timeout=2)
+        with mock.patch("github.ConnectionPool.time.monotonic", return_value=1002.0), mock.patch.object(
+            first, "close"
+        ) as close:
+            # the least recently used pool is closed
+            self.connection(timeout=3)
+            self.assertIs(self.connection(timeout=2), second)
+        close.assert_called_once_with()
@@ -202,6 +202,8 @@ class ReplayingConnection:
 
         httpretty.register_uri(verb, full_url.url, body=self.__request_callback)
 
+        # httpretty calls __request_callback from another thread, which cannot see the pending request of __cnx
+        self.__request = (verb, url, input, headers)
         self.__cnx.request(verb, url, input, headers)
 
     def __readNextRequest(self, verb, url, input, headers):
@@ -233,7 +235,7 @@ class ReplayingConnection:
         return (base, sorted(qs.split("&")))
 
     def __request_callback(self, request, uri, response_headers):
-        self.__readNextRequest(self.__cnx.verb, self.__cnx.url, self.__cnx.input, self.__cnx.headers)
+        self.__readNextRequest(*self.__request)
 
         status = int(readLine(self.__file))
         self.response_headers = CaseInsensitiveDict(eval(readLine(self.__file)))
@@ -291,6 +293,8 @@ class BasicTestCase(unittest.TestCase):
         super().setUp()
         self.__fileName = ""
         self.__file = None
+        # do not throttle requests based on requests of other tests
+        github.RequestScheduler.RequestScheduler.resetSchedulers()
         if (
             self.recordMode
         ):  # pragma no cover (Branch useful only when recording new tests, not used during automated tests)
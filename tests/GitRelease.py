@@ -44,8 +44,10 @@
 ################################################################################
 
 import os
+import tempfile
 import zipfile
 from datetime import datetime, timezone
+from unittest import mock
 
 from github import GithubException
 
@@ -265,3 +267,56 @@ class GitRelease(Framework.TestCase):
         self.assertTrue(asset_list is not None)
         self.assertEqual(len(asset_list), 1)
         self.tearDownNewRelease()
+
+    def testUploadAssetFromStream(self):
+        # test data copied from testUploadAssetFileLike
+        self.setUpNewRelease()
+        dat = FileLikeStub().dat
+        release = self.new_release
+        progress = []
+        asset = release.upload_asset_from_stream(
+            (dat[i : i + 40] for i in range(0, len(dat), 40)),
+            len(dat),
+            name="file_like",
+            content_type="text/plain",
+            label="another unit test artifact",
+            progress=progress.append,
+        )
+        self.assertEqual(asset.name, "file_like")
+        self.assertEqual(progress[-1].uploaded, len(dat))
+        self.assertEqual(progress[-1].total, len(dat))
+        asset_list = [x for x in release.get_assets()]
+        self.assertEqual(len(asset_list), 1)
+        self.tearDownNewRelease()
+
+    def testUploadAssets(self):
+        release = self.release
+        with tempfile.TemporaryDirectory() as path:
+            paths = []
+            for name, content in [("a.txt", b"a"), ("b.zip", b"bb"), ("c.txt", b"ccc")]:
+                paths.append(os.path.join(path, name))
+                with open(paths[-1], "wb") as f:
+                    f.write(content)
+
+            uploaded = mock.Mock(state="uploaded", size=1)
+            uploaded.name = "a.txt"
+            failed = mock.Mock(state="starter", size=0)
+            failed.name = "b.zip"
+
+            def upload(chunks, size, name, content_type, progress):
+                content = b"".join(chunks)
+                self.assertEqual(len(content), size)
+                progress(mock.Mock(uploaded=size))
+                return (name, content_type, content)
+
+            with mock.patch.object(release, "get_assets", return_value=[uploaded, failed]), mock.patch.object(
+                release, "upload_asset_from_stream", side_effect=upload
+            ):
+                progress = mock.Mock()
+                assets = release.upload_assets(paths, max_workers=2, progress=progress, resume=True)
+
+        # the complete asset is not uploaded again, the failed upload is replaced
+        self.assertEqual(assets, [uploaded, ("b.zip", "application/zip", b"bb"), ("c.txt", "text/plain", b"ccc")])
+        uploaded.delete_asset.assert_not_called()
+        failed.delete_asset.assert_called_once_with()
+        self.assertEqual(sorted(call.args[0] for call in progress.call_args_list), ["b.zip", "c.txt"])
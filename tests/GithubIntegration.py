@@ -32,6 +32,7 @@
 ################################################################################
 
 import time  # NOQA
+from unittest import mock
 
 import requests  # NOQA
 from urllib3.exceptions import InsecureRequestWarning
@@ -39,6 +40,7 @@ from urllib3.exceptions import InsecureRequestWarning
 import github
 from github import Consts
 from github.Auth import AppInstallationAuth
+from github.Installation import Installation
 
 from . import Framework
 
@@ -120,6 +122,35 @@ class GithubIntegration(Framework.BasicTestCase):
         self.assertEqual(installations[0].id, self.org_installation_id)
         self.assertEqual(installations[1].id, self.repo_installation_id)
 
+    def testFanOut(self):
+        auth = github.Auth.AppAuth(APP_ID, PRIVATE_KEY)
+        github_integration = github.GithubIntegration(auth=auth)
+
+        created = {}
+
+        def get_github_for_installation(installation):
+            created[installation.id] = get_github(installation)
+            return created[installation.id]
+
+        def func(installation, g):
+            if installation.id == self.repo_installation_id:
+                raise RuntimeError("failed")
+            # the Github object is authenticated as the installation
+            assert g is created[installation.id]
+            assert isinstance(installation._requester.auth, AppInstallationAuth)
+            return installation.id
+
+        get_github = Installation.get_github_for_installation
+        with mock.patch.object(
+            Installation, "get_github_for_installation", autospec=True, side_effect=get_github_for_installation
+        ):
+            results = github_integration.fan_out(func, max_workers=2)
+        self.assertEqual([r.installation.id for r in results], [self.org_installation_id, self.repo_installation_id])
+        self.assertEqual(results[0].result, self.org_installation_id)
+        self.assertIsNone(results[0].exception)
+        self.assertIsNone(results[1].result)
+        self.assertEqual(results[1].exception.args, ("failed",))
+
     def testGetGithubForInstallation(self):
         # with verify=False, urllib3.connectionpool rightly may issue an InsecureRequestWarning
         # we ignore InsecureRequestWarning from urllib3.connectionpool
@@ -136,6 +167,11 @@ class GithubIntegration(Framework.BasicTestCase):
                 pool_size=10,
                 seconds_between_requests=100,
                 seconds_between_writes=1000,
+                cache=github.Cache.MemoryCache(),
+                priority=github.RequestScheduler.BATCH,
+                lazy_attributes=True,
+                identity_map=True,
+                coalesce_requests=True,
             )
 
             # assert kwargs consists of ALL requester constructor arguments
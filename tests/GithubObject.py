@@ -125,3 +125,91 @@ class GithubObject(unittest.TestCase):
             self.assertEqual(value, e.exception.actual_value)
             self.assertEqual(int, e.exception.expected_type)
             self.assertIsNone(e.exception.transformation_exception)
+
+    def testLazyAttributes(self):
+        requester = Framework.github.Github(lazy_attributes=True)._Github__requester
+        repo = Framework.github.Repository.Repository(
+            requester,
+            {},
+            {
+                "url": "https://api.github.com/repos/PyGithub/PyGithub",
+                "full_name": "PyGithub/PyGithub",
+                "created_at": "2012-02-25T12:53:47Z",
+                "html_url": "https://github.com/PyGithub/PyGithub",
+                "owner": {"login": "PyGithub", "url": "https://api.github.com/users/PyGithub"},
+            },
+            completed=False,
+        )
+        self.assertNotIn("_full_name", repo.__dict__)
+
+        # only accessed attributes are decoded
+        self.assertEqual(repo.full_name, "PyGithub/PyGithub")
+        self.assertIn("_full_name", repo.__dict__)
+        self.assertNotIn("_owner", repo.__dict__)
+        self.assertNotIn("_created_at", repo.__dict__)
+
+        self.assertEqual(repo.owner.login, "PyGithub")
+        self.assertEqual(repo.created_at, datetime(2012, 2, 25, 12, 53, 47, tzinfo=timezone.utc))
+        self.assertIs(repo.owner, repo.owner)
+
+        # attributes not contained in the raw data decode all attributes
+        self.assertNotIn("_html_url", repo.__dict__)
+        self.assertIs(repo._name, gho.NotSet)
+        self.assertIn("_html_url", repo.__dict__)
+        with self.assertRaises(AttributeError):
+            repo._unknown
+
+    def testLazyAttributesDecodedFromOtherKeys(self):
+        requester = Framework.github.Github(lazy_attributes=True)._Github__requester
+        # _url is decoded from url, or from slug if url is missing
+        app = Framework.github.GithubApp.GithubApp(
+            requester, {}, {"slug": "github-actions", "url": "https://api.github.com/apps/actions"}, completed=True
+        )
+        self.assertEqual(app.slug, "github-actions")
+        self.assertEqual(app.url, "https://api.github.com/apps/actions")
+
+        app = Framework.github.GithubApp.GithubApp(requester, {}, {"slug": "github-actions"}, completed=True)
+        self.assertEqual(app.url, "/apps/github-actions")
+
+    def testLazyAttributesRetainUsedAttributes(self):
+        requester = Framework.github.Github(lazy_attributes=True)._Github__requester
+        repo = Framework.github.Repository.Repository(
+            requester, {}, {"name": "PyGithub", "description": "old"}, completed=True
+        )
+        # as done by Repository.edit
+        repo._useAttributes({"description": "new"})
+        self.assertEqual(repo.name, "PyGithub")
+        self.assertEqual(repo.description, "new")
+        self.assertIsNone(repo.homepage)
+        self.assertEqual(repo.description, "new")
+
+    def testUnsetAttributesAreNotStored(self):
+        requester = Framework.github.Github()._Github__requester
+        user = Framework.github.NamedUser.NamedUser(requester, {}, {"login": "jacquev6", "site_admin": False}, True)
+        self.assertEqual(set(user.__dict__) & {"_login", "_site_admin", "_name"}, {"_login", "_site_admin"})
+        self.assertIs(user._name, gho.NotSet)
+        self.assertIsNone(user.name)
+        self.assertFalse(user.site_admin)
+        with self.assertRaises(AttributeError):
+            user._unknown
+
+        # attributes are small and shared for frequent values
+        self.assertFalse(hasattr(user._login, "__dict__"))
+        self.assertIs(user._site_admin, gho.GithubObject._makeBoolAttribute(False))
+        self.assertIs(gho.GithubObject._makeStringAttribute(None), gho.GithubObject._makeDatetimeAttribute(None))
+
+    def testIdentityMap(self):
+        def issues(requester):
+            user = {"login": "jacquev6", "id": 327146, "url": "https://api.github.com/users/jacquev6"}
+            return [
+                Framework.github.Issue.Issue(requester, {}, {"number": number, "user": dict(user)}, completed=True)
+                for number in range(3)
+            ]
+
+        first, second, third = issues(Framework.github.Github(identity_map=True)._Github__requester)
+        self.assertIs(first.user, second.user)
+        self.assertIs(first.user, third.user)
+
+        first, second, third = issues(Framework.github.Github()._Github__requester)
+        self.assertIsNot(first.user, second.user)
+        self.assertEqual(first.user, second.user)
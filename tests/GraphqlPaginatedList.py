@@ -0,0 +1,112 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+from datetime import datetime, timezone
+from unittest import mock
+
+from github.GithubException import GithubException
+from github.Issue import Issue
+from github.PaginatedList import GraphqlPaginatedList as GraphqlPaginatedListImpl
+from github.PullRequest import PullRequest
+
+from . import Framework
+
+
+class GraphqlPaginatedList(Framework.TestCase):
+    def testConnectionQuery(self):
+        self.assertEqual(
+            GraphqlPaginatedListImpl.connection_query(["viewer", "repositories"], "name"),
+            "query($cursor: String) { viewer { repositories(first: 100, after: $cursor) "
+            "{ nodes { name } pageInfo { endCursor hasNextPage } } } }",
+        )
+        self.assertEqual(
+            GraphqlPaginatedListImpl.connection_query(
+                ["search(query: $q, type: ISSUE)"], "number", {"q": "is:open", "n": 1, "draft": True, "ids": ["a"]}
+            ),
+            "query($q: String!, $n: Int!, $draft: Boolean!, $ids: [String!]!, $cursor: String) "
+            "{ search(query: $q, type: ISSUE, first: 100, after: $cursor) "
+            "{ nodes { number } pageInfo { endCursor hasNextPage } } }",
+        )
+        self.assertEqual(
+            GraphqlPaginatedListImpl.connection_path(["repository(owner: $owner, name: $name)", "open: pullRequests"]),
+            ["repository", "open"],
+        )
+        with self.assertRaises(TypeError):
+            GraphqlPaginatedListImpl.connection_query(["viewer", "repositories"], "name", {"after": None})
+
+    def testIteration(self):
+        pulls = self.g.get_graphql_connection(
+            PullRequest,
+            ["repository(owner: $owner, name: $name)", "pullRequests(states: OPEN)"],
+            "number title created_at: createdAt labels(first: 10) { nodes { name } }",
+            {"owner": "PyGithub", "name": "PyGithub"},
+            page_size=2,
+        )
+        self.assertListEqual([pull.number for pull in pulls], [3007, 3011, 3012])
+        self.assertEqual(pulls[0].title, "Add IncrementalSync")
+        self.assertEqual(pulls[1].created_at, datetime(2024, 6, 3, 12, 30, tzinfo=timezone.utc))
+        self.assertEqual(pulls[2].raw_data["labels"], {"nodes": [{"name": "dependencies"}]})
+        # only the selected attributes are set
+        self.assertIsNone(pulls[0].body)
+
+    def mockRequester(self):
+        self.requests = []
+        requester = mock.Mock(graphql_url="https://api.github.com/graphql")
+        requester.requestJsonAndCheck.side_effect = self.requestJsonAndCheck
+        requester.createException.side_effect = lambda status, headers, data: GithubException(status, data, headers)
+        return requester
+
+    def requestJsonAndCheck(self, verb, url, parameters=None, headers=None, input=None):
+        cursor = input["variables"]["cursor"]
+        self.requests.append(cursor)
+        page = 0 if cursor is None else int(cursor)
+        if page == 9:
+            return {}, {"errors": [{"message": "Something went wrong"}]}
+        nodes = [{"number": 10 * page + i} for i in range(10)] + [None]
+        pageInfo = {"endCursor": str(page + 1), "hasNextPage": page < 2}
+        return {}, {"data": {"viewer": {"issues": {"nodes": nodes, "pageInfo": pageInfo}}}}
+
+    def issues(self):
+        return GraphqlPaginatedListImpl(
+            Issue,
+            self.mockRequester(),
+            "query",
+            {},
+            ["viewer", "issues"],
+            attributesTransformer=lambda node: {**node, "title": f"#{node['number']}"},
+        )
+
+    def testPrefetch(self):
+        issues = self.issues().prefetch()
+        iterator = iter(issues)
+        self.assertEqual(next(iterator).title, "#0")
+        # the second page has been requested while the first page is used
+        issues._GraphqlPaginatedList__prefetchedPage.result()
+        self.assertEqual(self.requests, [None, "1"])
+        self.assertListEqual([issue.number for issue in iterator], list(range(1, 30)))
+        self.assertEqual(self.requests, [None, "1", "2"])
+        self.assertIsNone(issues._GraphqlPaginatedList__prefetchExecutor)
+
+    def testErrors(self):
+        issues = self.issues()
+        issues._GraphqlPaginatedList__cursor = "9"
+        with self.assertRaises(GithubException):
+            list(issues)
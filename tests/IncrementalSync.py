@@ -0,0 +1,120 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import json
+
+import github
+from github.IncrementalSync import COMMITS, DELETE, ISSUE_COMMENTS, ISSUES, UPSERT
+
+from . import Framework
+
+
+class IncrementalSync(Framework.TestCase):
+    def deltas(self, sync, repo, full=False):
+        return [(delta.operation, delta.key) for delta in sync.sync(repo, full=full)]
+
+    def testSync(self):
+        repo = self.g.get_repo("PyGithub/PyGithub", lazy=True)
+        sync = github.IncrementalSync(resources=[ISSUES], track_deletes=True)
+
+        # the first sync lists all issues
+        self.assertEqual(self.deltas(sync, repo), [(UPSERT, 1), (UPSERT, 2)])
+        self.assertEqual(
+            sync.state,
+            {
+                "/repos/PyGithub/PyGithub": {
+                    ISSUES: {"since": "2024-01-02T00:00:00Z", "since_keys": [2], "etag": '"e1"', "keys": [1, 2]}
+                }
+            },
+        )
+
+        # issues updated since the last sync, without issue 2 that has been returned before
+        sync = github.IncrementalSync(json.loads(json.dumps(sync.state)), resources=[ISSUES], track_deletes=True)
+        deltas = list(sync.sync(repo))
+        self.assertEqual([(delta.operation, delta.key) for delta in deltas], [(UPSERT, 3)])
+        self.assertEqual(deltas[0].record.title, "Issue 3")
+        self.assertEqual(deltas[0].resource, ISSUES)
+
+        # nothing changed, the conditional request is answered with 304 Not Modified
+        self.assertEqual(self.deltas(sync, repo), [])
+        self.assertEqual(sync.state["/repos/PyGithub/PyGithub"][ISSUES]["since"], "2024-01-03T00:00:00Z")
+
+        # a full sync finds deleted issues
+        self.assertEqual(self.deltas(sync, repo, full=True), [(UPSERT, 1), (UPSERT, 3), (DELETE, 2)])
+        self.assertEqual(sync.state["/repos/PyGithub/PyGithub"][ISSUES]["keys"], [1, 3])
+
+    def testSyncCommits(self):
+        repo = self.g.get_repo("PyGithub/PyGithub", lazy=True)
+        sync = github.IncrementalSync(resources=[COMMITS])
+        a, b, c, d = ("a" * 40, "b" * 40, "c" * 40, "d" * 40)
+
+        # the first sync lists all commits, the cursor holds the latest commit date and the shas committed at that date
+        self.assertEqual(self.deltas(sync, repo), [(UPSERT, c), (UPSERT, b), (UPSERT, a)])
+        self.assertEqual(
+            sync.state,
+            {
+                "/repos/PyGithub/PyGithub": {
+                    COMMITS: {"since": "2024-01-02T00:00:00Z", "since_keys": [b, c], "etag": '"e1"'}
+                }
+            },
+        )
+
+        # commits since the last sync, without commits b and c that have been returned before
+        sync = github.IncrementalSync(json.loads(json.dumps(sync.state)), resources=[COMMITS])
+        deltas = list(sync.sync(repo))
+        self.assertEqual([(delta.operation, delta.key) for delta in deltas], [(UPSERT, d)])
+        self.assertEqual(deltas[0].record.commit.message, "Commit d")
+        self.assertEqual(
+            sync.state["/repos/PyGithub/PyGithub"][COMMITS],
+            {"since": "2024-01-03T00:00:00Z", "since_keys": [d], "etag": '"e2"'},
+        )
+
+        # nothing changed, the conditional request since the new cursor is answered with 304 Not Modified
+        self.assertEqual(self.deltas(sync, repo), [])
+
+    def testSyncIssueComments(self):
+        repo = self.g.get_repo("PyGithub/PyGithub", lazy=True)
+        sync = github.IncrementalSync(resources=[ISSUE_COMMENTS])
+
+        # the first sync lists all comments
+        self.assertEqual(self.deltas(sync, repo), [(UPSERT, 11), (UPSERT, 12)])
+        self.assertEqual(
+            sync.state,
+            {
+                "/repos/PyGithub/PyGithub": {
+                    ISSUE_COMMENTS: {"since": "2024-01-02T00:00:00Z", "since_keys": [12], "etag": '"e1"'}
+                }
+            },
+        )
+
+        # comments updated since the last sync, comment 11 has been edited, comment 12 has been returned before
+        sync = github.IncrementalSync(json.loads(json.dumps(sync.state)), resources=[ISSUE_COMMENTS])
+        deltas = list(sync.sync(repo))
+        self.assertEqual([(delta.operation, delta.key) for delta in deltas], [(UPSERT, 11)])
+        self.assertEqual(deltas[0].record.body, "Comment 11")
+        self.assertEqual(deltas[0].resource, ISSUE_COMMENTS)
+        self.assertEqual(
+            sync.state["/repos/PyGithub/PyGithub"][ISSUE_COMMENTS],
+            {"since": "2024-01-03T00:00:00Z", "since_keys": [11], "etag": '"e2"'},
+        )
+
+        # nothing changed, the conditional request since the new cursor is answered with 304 Not Modified
+        self.assertEqual(self.deltas(sync, repo), [])
@@ -33,6 +33,8 @@
 #                                                                              #
 ################################################################################
 
+from unittest import mock
+
 from urllib3.exceptions import InsecureRequestWarning
 
 import github
@@ -62,7 +64,10 @@ class Installation(Framework.BasicTestCase):
     def testGetGithubForInstallation(self):
         # with verify=False, urllib3.connectionpool rightly may issue an InsecureRequestWarning
         # we ignore InsecureRequestWarning from urllib3.connectionpool
-        with self.ignoreWarning(category=InsecureRequestWarning, module="urllib3.connectionpool"):
+        # requests of integration and installation auth share the same JWT and thus are throttled together
+        with self.ignoreWarning(category=InsecureRequestWarning, module="urllib3.connectionpool"), mock.patch(
+            "github.Requester.time.sleep"
+        ):
             kwargs = dict(
                 auth=AppAuth(319953, GithubIntegration.PRIVATE_KEY),
                 # http protocol used to deviate from default base url, recording data might require https
@@ -75,6 +80,11 @@ class Installation(Framework.BasicTestCase):
                 pool_size=10,
                 seconds_between_requests=100,
                 seconds_between_writes=1000,
+                cache=github.Cache.MemoryCache(),
+                priority=github.RequestScheduler.BATCH,
+                lazy_attributes=True,
+                identity_map=True,
+                coalesce_requests=True,
             )
 
             # assert kwargs consists of ALL requester constructor arguments
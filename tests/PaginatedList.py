@@ -37,6 +37,14 @@
 #                                                                              #
 ################################################################################
 
+import itertools
+import json
+import math
+import threading
+from datetime import datetime, timezone
+from unittest import mock
+
+from github.Issue import Issue
 from github.PaginatedList import PaginatedList as PaginatedListImpl
 
 from . import Framework
@@ -58,6 +66,53 @@ class PaginatedList(Framework.TestCase):
         self.assertEqual(len(list(users)), 102)
         self.assertEqual(len({user.github_com_login for user in users}), 102)
 
+    def testIterRaw(self):
+        # test data copied from testIteration
+        elements = list(self.list.iter_raw())
+        self.assertEqual(len(elements), 333)
+        self.assertIsInstance(elements[0], dict)
+        self.assertEqual(elements[0]["id"], 4772349)
+        self.assertEqual(elements[0]["user"]["login"], "danomatika")
+
+    def testIterRawReversed(self):
+        # test data copied from testReversedIterationWithMultiplePages
+        elements = itertools.islice(self.list.reversed.iter_raw(), 16)
+        self.assertEqual([element["id"] for element in elements][:2], [94898, 104702])
+
+    def testToColumns(self):
+        # test data copied from testIteration
+        columns = self.list.to_columns(["id", "created_at", "user.login", "milestone.number"], backend="array")
+        self.assertEqual(len(columns["id"]), 333)
+        self.assertEqual(columns["id"].typecode, "q")
+        self.assertEqual(columns["id"][0], 4772349)
+        self.assertEqual(columns["created_at"][0], datetime(2012, 5, 27, 18, 3, 23, tzinfo=timezone.utc))
+        self.assertEqual(columns["user.login"][0], "danomatika")
+        # milestones are missing for some issues
+        self.assertEqual(columns["milestone.number"].typecode, "d")
+        self.assertTrue(math.isnan(columns["milestone.number"][0]))
+        self.assertEqual(columns["milestone.number"][2], 5)
+
+    def testCheckpoint(self):
+        # test data copied from testIteration, pages hold 25 issues
+        ids = [issue.id for issue in self.list[:40]]
+        # the 41st issue is the 16th of the second page
+        cursor = json.loads(json.dumps(self.list.checkpoint(40)))
+        self.assertEqual(cursor["next_url"], "https://api.github.com/repos/openframeworks/openFrameworks/issues?page=2")
+        self.assertEqual(cursor["skip"], 15)
+
+        # the resumed list requests the second page again and starts with its 16th issue
+        resumed = self.g.resume_paginated_list(cursor)
+        self.assertEqual(resumed.checkpoint(), cursor)
+        self.assertEqual(resumed[0].id, self.list[40].id)
+        self.assertNotIn(resumed[0].id, ids)
+        # a checkpoint of the resumed list counts from the issue it starts with
+        self.assertEqual(resumed.checkpoint(1)["next_url"], cursor["next_url"])
+        self.assertEqual(resumed.checkpoint(1)["skip"], 16)
+
+        self.assertEqual(len(list(resumed)), 333 - 40)
+        self.assertEqual(resumed.checkpoint()["next_url"], None)
+        self.assertEqual(resumed.checkpoint()["skip"], 0)
+
     def testSeveralIterations(self):
         self.assertEqual(len(list(self.list)), 333)
         self.assertEqual(len(list(self.list)), 333)
@@ -329,6 +384,75 @@ class PaginatedList(Framework.TestCase):
     def testNoFirstPage(self):
         self.assertFalse(next(iter(self.list), None))
 
+    def testPrefetchIteration(self):
+        url = "https://api.github.com/repos/PyGithub/PyGithub/issues"
+        # pages 2 to 4 are only returned once all three are requested concurrently
+        barrier = threading.Barrier(3, timeout=10)
+
+        def requestJsonAndCheck(verb, url, parameters=None, headers=None):
+            page = int(url.split("page=")[1]) if "page=" in url else 1
+            if 2 <= page <= 4:
+                barrier.wait()
+            links = [f'<{url.split("?")[0]}?state=all&page={page + 1}>; rel="next"'] if page < 5 else []
+            links.append(f'<{url.split("?")[0]}?state=all&page=5>; rel="last"')
+            return {"link": ", ".join(links)}, [{"number": 2 * page - 1}, {"number": 2 * page}]
+
+        requester = mock.Mock(per_page=30)
+        requester.requestJsonAndCheck.side_effect = requestJsonAndCheck
+        issues = PaginatedListImpl(Issue, requester, url, {"state": "all"}).prefetch(max_workers=3)
+
+        self.assertEqual([issue.number for issue in issues], list(range(1, 11)))
+        self.assertEqual(
+            [call.args[1] for call in requester.requestJsonAndCheck.call_args_list[1:]],
+            [f"{url}?state=all&page={page}" for page in range(2, 6)],
+        )
+
+    def testPrefetchReversed(self):
+        url = "https://api.github.com/repos/PyGithub/PyGithub/issues"
+
+        def requestJsonAndCheck(verb, url, parameters=None, headers=None):
+            page = int(url.split("page=")[1]) if "page=" in url else 1
+            links = [f'<{url.split("?")[0]}?state=all&page={page - 1}>; rel="prev"'] if page > 1 else []
+            links.append(f'<{url.split("?")[0]}?state=all&page=3>; rel="last"')
+            return {"link": ", ".join(links)}, [{"number": 2 * page - 1}, {"number": 2 * page}]
+
+        requester = mock.Mock(per_page=30)
+        requester.requestJsonAndCheck.side_effect = requestJsonAndCheck
+        issues = PaginatedListImpl(Issue, requester, url, {"state": "all"}).reversed.prefetch()
+
+        self.assertEqual([issue.number for issue in issues], [6, 5, 4, 3, 2, 1])
+        self.assertEqual([issue["number"] for issue in issues.iter_raw()], [6, 5, 4, 3, 2, 1])
+
+    def testPrefetchStoppedEarly(self):
+        url = "https://api.github.com/repos/PyGithub/PyGithub/issues"
+        # page 3 is only returned once the iteration stopped
+        stopped = threading.Event()
+
+        def requestJsonAndCheck(verb, url, parameters=None, headers=None):
+            page = int(url.split("page=")[1]) if "page=" in url else 1
+            if page > 2:
+                stopped.wait(10)
+            links = [f'<{url.split("?")[0]}?state=all&page={page + 1}>; rel="next"'] if page < 10 else []
+            links.append(f'<{url.split("?")[0]}?state=all&page=10>; rel="last"')
+            return {"link": ", ".join(links)}, [{"number": 2 * page - 1}, {"number": 2 * page}]
+
+        requester = mock.Mock(per_page=30)
+        requester.requestJsonAndCheck.side_effect = requestJsonAndCheck
+        issues = PaginatedListImpl(Issue, requester, url, {"state": "all"}).prefetch(max_workers=2)
+
+        for issue in issues:
+            if issue.number == 3:
+                # pages 2 and 3 have been requested
+                executor = issues._PaginatedList__prefetchExecutor
+                break
+        self.assertIsNone(issues._PaginatedList__prefetchExecutor)
+        stopped.set()
+        executor.shutdown(wait=True)
+        # page 3 is cancelled unless its request had started, no further pages are requested
+        urls = [call.args[1] for call in requester.requestJsonAndCheck.call_args_list]
+        self.assertEqual(urls[:2], [url, f"{url}?state=all&page=2"])
+        self.assertIn(urls[2:], [[], [f"{url}?state=all&page=3"]])
+
     def testMergeDicts(self):
         self.assertDictEqual(
             PaginatedListImpl.merge_dicts(
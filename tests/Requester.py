@@ -24,9 +24,19 @@
 ################################################################################
 
 import contextlib
+import hashlib
+import io
+import json
+import os
+import tempfile
+import threading
+from concurrent.futures import Future
 from datetime import datetime, timedelta, timezone
 from unittest import mock
 
+import httpretty  # type: ignore
+import requests
+
 import github
 
 from . import Framework
@@ -53,6 +63,7 @@ class Requester(Framework.TestCase):
 
         # create a Requester with non-default arguments
         auth = TestAuth(123, "key")
+        cache = github.Cache.MemoryCache()
         requester = github.Requester.Requester(
             auth=auth,
             base_url="https://base.url",
@@ -64,6 +75,11 @@ class Requester(Framework.TestCase):
             pool_size=5,
             seconds_between_requests=1.2,
             seconds_between_writes=3.4,
+            cache=cache,
+            priority=github.RequestScheduler.BATCH,
+            lazy_attributes=True,
+            identity_map=True,
+            coalesce_requests=True,
         )
         kwargs = requester.kwargs
 
@@ -82,6 +98,11 @@ class Requester(Framework.TestCase):
                 pool_size=5,
                 seconds_between_requests=1.2,
                 seconds_between_writes=3.4,
+                cache=cache,
+                priority=github.RequestScheduler.BATCH,
+                lazy_attributes=True,
+                identity_map=True,
+                coalesce_requests=True,
             ),
         )
 
@@ -103,6 +124,7 @@ class Requester(Framework.TestCase):
 
         # create a Requester with non-default arguments
         auth = TestAuth(123, "key")
+        cache = github.Cache.MemoryCache()
         requester = github.Requester.Requester(
             auth=auth,
             base_url="https://base.url",
@@ -114,6 +136,11 @@ class Requester(Framework.TestCase):
             pool_size=5,
             seconds_between_requests=1.2,
             seconds_between_writes=3.4,
+            cache=cache,
+            priority=github.RequestScheduler.BATCH,
+            lazy_attributes=True,
+            identity_map=True,
+            coalesce_requests=True,
         )
 
         # create a copy with different auth
@@ -134,9 +161,25 @@ class Requester(Framework.TestCase):
                 pool_size=5,
                 seconds_between_requests=1.2,
                 seconds_between_writes=3.4,
+                cache=cache,
+                priority=github.RequestScheduler.BATCH,
+                lazy_attributes=True,
+                identity_map=True,
+                coalesce_requests=True,
             ),
         )
 
+    def testWithAuthSharesConnection(self):
+        with mock.patch.object(github.Requester.Requester, "_Requester__persist", True), mock.patch.object(
+            github.Requester.Requester,
+            "_Requester__httpsConnectionClass",
+            github.Requester.HTTPSRequestsConnectionClass,
+        ):
+            requester = github.Github()._Github__requester
+            copy = requester.withAuth(github.Auth.Token("token"))
+            self.assertIs(copy._Requester__createConnection(), requester._Requester__createConnection())
+        github.ConnectionPool.ConnectionPool.resetPools()
+
     def testCloseGithub(self):
         mocked_connection = mock.MagicMock()
         mocked_custom_connection = mock.MagicMock()
@@ -355,6 +398,221 @@ class Requester(Framework.TestCase):
                 exc = self.g._Github__requester.createException(status, {}, None)
                 self.assertException(exc, github.GithubException, status, None, {}, f"{status}")
 
+    def testJsonDecoder(self):
+        # orjson is opt-in, it fails differently than json
+        self.assertIs(github.Requester.Requester._Requester__jsonDecoder, json.loads)
+        decoder = mock.Mock(side_effect=json.loads)
+        github.Requester.Requester.setJsonDecoder(decoder)
+        try:
+            user = self.g.get_user("jacquev6")
+        finally:
+            github.Requester.Requester.resetJsonDecoder()
+        self.assertEqual(user.login, "jacquev6")
+        # the decoder is given the raw response bytes
+        (data,) = decoder.call_args.args
+        self.assertIsInstance(data, bytes)
+        self.assertEqual(json.loads(data)["login"], "jacquev6")
+
+    def testRequestsResponse(self):
+        r = requests.Response()
+        r.status_code = 200
+        r.encoding = "utf-8"
+        r._content = '{"login": "jacquev6 é"}'.encode("utf-8")
+        response = github.Requester.RequestsResponse(r)
+        # read() returns the body as str, like httplib responses, content provides the raw bytes
+        self.assertEqual(response.read(), '{"login": "jacquev6 é"}')
+        self.assertEqual(response.content, '{"login": "jacquev6 é"}'.encode("utf-8"))
+
+    def testStructuredFromJson(self):
+        requester = self.g._Github__requester
+        structuredFromJson = requester._Requester__structuredFromJson
+        self.assertIsNone(structuredFromJson(b""))
+        self.assertEqual(structuredFromJson(b'{"id": 1}'), {"id": 1})
+        self.assertEqual(structuredFromJson('{"id": 1}'), {"id": 1})
+        self.assertEqual(structuredFromJson(b"<p>Hello</p>"), {"data": "<p>Hello</p>"})
+        with self.assertRaises(ValueError):
+            structuredFromJson(b'{"id": ')
+
+    CONTENT = bytes(range(256)) * 16
+
+    def registerDownload(self):
+        # the API redirects to a storage host, which serves the content and honours ranges
+        requests = []
+        self.content = (self.CONTENT, '"v1"')
+        self.honour_if_range = True
+
+        def api(request, uri, response_headers):
+            requests.append(dict(request.headers))
+            response_headers.update(
+                {
+                    "location": "https://objects.example.com/asset",
+                    "x-ratelimit-remaining": "4999",
+                    "x-ratelimit-limit": "5000",
+                }
+            )
+            return 302, response_headers, ""
+
+        def storage(request, uri, response_headers):
+            requests.append(dict(request.headers))
+            content, etag = self.content
+            response_headers["etag"] = etag
+            if_range = request.headers.get("If-Range", etag) if self.honour_if_range else etag
+            if "Range" in request.headers and if_range == etag:
+                offset = int(request.headers["Range"][len("bytes=") : -1])
+                if offset >= len(content):
+                    response_headers["content-range"] = f"bytes */{len(content)}"
+                    return 416, response_headers, ""
+                return 206, response_headers, content[offset:]
+            return 200, response_headers, content
+
+        httpretty.register_uri("GET", "https://api.github.com/repos/PyGithub/PyGithub/releases/assets/1", body=api)
+        httpretty.register_uri("GET", "https://objects.example.com/asset", body=storage)
+        return requests
+
+    def testGetStream(self):
+        requests = self.registerDownload()
+        requester = github.Github(auth=github.Auth.Token("token"))._Github__requester
+
+        status, headers, chunks = requester.getStream(
+            "/repos/PyGithub/PyGithub/releases/assets/1", {"Accept": "application/octet-stream"}, chunk_size=1000
+        )
+        self.assertEqual(status, 200)
+        chunks = list(chunks)
+        self.assertEqual([len(chunk) for chunk in chunks], [1000, 1000, 1000, 1000, 96])
+        self.assertEqual(b"".join(chunks), self.CONTENT)
+        self.assertEqual(requester.rate_limiting[0], 4999)
+
+        api, storage = requests
+        self.assertEqual(api["Authorization"], "token token")
+        self.assertEqual(api["Accept"], "application/octet-stream")
+        # the token is not sent to the storage host
+        self.assertNotIn("Authorization", storage)
+
+    def testGetFile(self):
+        requests = self.registerDownload()
+        requester = github.Github(auth=github.Auth.Token("token"))._Github__requester
+        url = "https://api.github.com/repos/PyGithub/PyGithub/releases/assets/1"
+        sha256 = hashlib.sha256(self.CONTENT).hexdigest()
+
+        f = io.BytesIO()
+        self.assertEqual(requester.getFile(url, f, chunk_size=1000), sha256)
+        self.assertEqual(f.getvalue(), self.CONTENT)
+
+        with tempfile.TemporaryDirectory() as path:
+            file = os.path.join(path, "asset")
+            with open(file, "wb") as f:
+                f.write(self.CONTENT[:1500])
+            # a partial download without ETag is downloaded again
+            self.assertEqual(requester.getFile(url, file, chunk_size=1000, resume=True), sha256)
+            self.assertNotIn("Range", requests[-1])
+            self.assertFalse(os.path.exists(f"{file}.etag"))
+
+            # the partial download is completed, the digest covers the entire content
+            with open(file, "wb") as f:
+                f.write(self.CONTENT[:1500])
+            with open(f"{file}.etag", "w") as f:
+                f.write('"v1"')
+            self.assertEqual(requester.getFile(url, file, chunk_size=1000, resume=True), sha256)
+            self.assertEqual(requests[-1]["Range"], "bytes=1500-")
+            self.assertEqual(requests[-1]["If-Range"], '"v1"')
+            with open(file, "rb") as f:
+                self.assertEqual(f.read(), self.CONTENT)
+            self.assertFalse(os.path.exists(f"{file}.etag"))
+
+            # a complete download is not downloaded again
+            with open(f"{file}.etag", "w") as f:
+                f.write('"v1"')
+            self.assertEqual(requester.getFile(url, file, chunk_size=1000, resume=True), sha256)
+            self.assertFalse(os.path.exists(f"{file}.etag"))
+
+            # a partial download of content that changed since is replaced
+            changed = self.CONTENT[::-1]
+            self.content = (changed, '"v2"')
+            with open(file, "wb") as f:
+                f.write(self.CONTENT[:1500])
+            with open(f"{file}.etag", "w") as f:
+                f.write('"v1"')
+            self.assertEqual(requester.getFile(url, file, resume=True), hashlib.sha256(changed).hexdigest())
+            with open(file, "rb") as f:
+                self.assertEqual(f.read(), changed)
+
+            # a range of other content is not appended, if the server does not honour If-Range
+            self.content = (self.CONTENT, '"v1"')
+            with open(file, "wb") as f:
+                f.write(changed[:1500])
+            with open(f"{file}.etag", "w") as f:
+                f.write('"v2"')
+            self.honour_if_range = False
+            self.assertEqual(requester.getFile(url, file, resume=True), sha256)
+            self.assertEqual(requests[-3]["Range"], "bytes=1500-")
+            self.assertNotIn("Range", requests[-1])
+            self.honour_if_range = True
+
+            # without resume, the file is replaced
+            self.assertEqual(requester.getFile(url, file), sha256)
+            self.assertEqual(os.path.getsize(file), len(self.CONTENT))
+
+    def testGetFileInterruptedKeepsETag(self):
+        self.registerDownload()
+        requester = github.Github(auth=github.Auth.Token("token"))._Github__requester
+        url = "https://api.github.com/repos/PyGithub/PyGithub/releases/assets/1"
+
+        with tempfile.TemporaryDirectory() as path:
+            file = os.path.join(path, "asset")
+            # the connection breaks after the second chunk has been written
+            with mock.patch("github.Requester.hashlib.new") as new:
+                new.return_value.update.side_effect = [None, ConnectionError("interrupted")]
+                with self.assertRaises(ConnectionError):
+                    requester.getFile(url, file, chunk_size=1000, resume=True)
+            # the ETag of the partial download is kept to validate its completion
+            self.assertEqual(os.path.getsize(file), 2000)
+            with open(f"{file}.etag") as f:
+                self.assertEqual(f.read(), '"v1"')
+            self.assertEqual(
+                requester.getFile(url, file, chunk_size=1000, resume=True), hashlib.sha256(self.CONTENT).hexdigest()
+            )
+
+    def testGetStreamException(self):
+        httpretty.register_uri(
+            "GET",
+            "https://api.github.com/repos/PyGithub/PyGithub/releases/assets/1",
+            status=404,
+            body='{"message": "Not Found"}',
+        )
+        requester = github.Github(auth=github.Auth.Token("token"))._Github__requester
+        with self.assertRaises(github.UnknownObjectException) as exc:
+            requester.getStream("/repos/PyGithub/PyGithub/releases/assets/1")
+        self.assertEqual(exc.exception.status, 404)
+
+    def testCoalesceRequests(self):
+        # test data copied from NamedUser.setUp, which has only one response for the two requests
+        g = github.Github(auth=self.login, coalesce_requests=True)
+        requester = g._Github__requester
+        self.assertTrue(requester.coalesce_requests)
+
+        # the request of this thread is sent once the request of the other thread waits for its response
+        requestRaw = requester._Requester__requestRaw
+        waiting = threading.Event()
+        users = []
+        other = threading.Thread(target=lambda: users.append(g.get_user("jacquev6")))
+
+        def send(*args):
+            other.start()
+            waiting.wait(5)
+            return requestRaw(*args)
+
+        def wait(future, timeout=None):
+            waiting.set()
+            return futureResult(future, timeout)
+
+        futureResult = Future.result
+        with mock.patch.object(requester, "_Requester__requestRaw", send), mock.patch.object(Future, "result", wait):
+            users.append(g.get_user("jacquev6"))
+            other.join()
+
+        self.assertEqual([user.login for user in users], ["jacquev6", "jacquev6"])
+        self.assertIsNot(users[0], users[1])
+
 
 class RequesterThrottleTestCase(Framework.TestCase):
     per_page = 10
@@ -370,7 +628,7 @@ class RequesterThrottleTestCase(Framework.TestCase):
     @contextlib.contextmanager
     def mock_sleep(self):
         with mock.patch("github.Requester.time.sleep", side_effect=self.sleep) as sleep_mock, mock.patch(
-            "github.Requester.datetime"
+            "github.RequestScheduler.datetime"
         ) as datetime_mock:
             datetime_mock.now = self.now
             yield sleep_mock
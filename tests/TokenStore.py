@@ -0,0 +1,238 @@
+############################ Copyrights and license ############################
+#                                                                              #
+#                                                                              #
+# This file is part of PyGithub.                                               #
+# http://pygithub.readthedocs.io/                                              #
+#                                                                              #
+# PyGithub is free software: you can redistribute it and/or modify it under    #
+# the terms of the GNU Lesser General Public License as published by the Free  #
+# Software Foundation, either version 3 of the License, or (at your option)    #
+# any later version.                                                           #
+#                                                                              #
+# PyGithub is distributed in the hope that it will be useful, but WITHOUT ANY  #
+# WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS    #
+# FOR A PARTICULAR PURPOSE. See the GNU Lesser General Public License for more #
+# details.                                                                     #
+#                                                                              #
+# You should have received a copy of the GNU Lesser General Public License     #
+# along with PyGithub. If not, see <http://www.gnu.org/licenses/>.             #
+#                                                                              #
+################################################################################
+
+import gc
+import os
+import pickle
+import sqlite3
+import tempfile
+import threading
+import time
+from datetime import datetime, timezone
+from unittest import mock
+
+import github
+from github.Auth import AppAuth, AppInstallationAuth
+from github.InstallationAuthorization import InstallationAuthorization
+from github.TokenStore import MemoryTokenStore, SqliteTokenStore, StoredToken, TokenRefresher
+
+from . import Framework
+from .GithubIntegration import APP_ID, PRIVATE_KEY
+
+
+class TokenStore(Framework.TestCase):
+    def setUp(self):
+        super().setUp()
+        self.refreshes = 0
+
+    def refresh(self, expires_in=3600):
+        self.refreshes += 1
+        return StoredToken(f"token{self.refreshes}", time.time() + expires_in)
+
+    def assertStore(self, store):
+        self.assertEqual(store.get_or_refresh("1:2:", self.refresh, 20).token, "token1")
+        self.assertEqual(store.get_or_refresh("1:2:", self.refresh, 20).token, "token1")
+        self.assertEqual(store.get_or_refresh("1:3:", self.refresh, 20).token, "token2")
+        # the token expires within the minimal ttl
+        self.assertEqual(store.get_or_refresh("1:2:", self.refresh, 3600).token, "token3")
+        self.assertEqual(self.refreshes, 3)
+
+    def testMemoryTokenStore(self):
+        store = MemoryTokenStore()
+        self.assertStore(store)
+        self.assertEqual(pickle.loads(pickle.dumps(store)).get_or_refresh("1:3:", self.refresh, 20).token, "token2")
+
+    def testSqliteTokenStore(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tokens.db")
+            store = SqliteTokenStore(path)
+            self.assertStore(store)
+            store.close()
+
+            # another process finds the stored token
+            other = pickle.loads(pickle.dumps(store))
+            self.assertEqual(other.get_or_refresh("1:2:", self.refresh, 20).token, "token3")
+            other.close()
+            self.assertEqual(self.refreshes, 3)
+
+    def assertConcurrentCallersShareOneRefresh(self, stores):
+        def slow_refresh():
+            time.sleep(0.1)
+            return self.refresh()
+
+        tokens = []
+        threads = [
+            threading.Thread(
+                target=lambda store=store: tokens.append(store.get_or_refresh("1:2:", slow_refresh, 20).token)
+            )
+            for store in stores
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(tokens, ["token1"] * len(stores))
+        self.assertEqual(self.refreshes, 1)
+
+    def testConcurrentCallersShareOneRefresh(self):
+        self.assertConcurrentCallersShareOneRefresh([MemoryTokenStore()] * 4)
+
+    def testConcurrentProcessesShareOneRefresh(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            # stores of their own connection and locks act like stores of different processes
+            stores = [SqliteTokenStore(os.path.join(tmp, "tokens.db")) for _ in range(4)]
+            self.assertConcurrentCallersShareOneRefresh(stores + stores)
+            for store in stores:
+                store.close()
+
+    def testSqliteTokenStoreRefreshesKeysConcurrently(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "tokens.db")
+            store, other = SqliteTokenStore(path, timeout=1), SqliteTokenStore(path, timeout=1)
+            refreshing, release = threading.Event(), threading.Event()
+
+            def blocked_refresh():
+                refreshing.set()
+                self.assertTrue(release.wait(5))
+                return StoredToken("blocked", time.time() + 3600)
+
+            thread = threading.Thread(target=lambda: store.get_or_refresh("1:2:", blocked_refresh, 20))
+            thread.start()
+            try:
+                self.assertTrue(refreshing.wait(5))
+                # a refresh of another key neither waits for that refresh nor for a database lock
+                self.assertEqual(other.get_or_refresh("1:3:", self.refresh, 20).token, "token1")
+            finally:
+                release.set()
+                thread.join()
+            self.assertEqual(other.get_or_refresh("1:2:", self.refresh, 20).token, "blocked")
+            store.close()
+            other.close()
+
+    def testSqliteTokenStoreLeases(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SqliteTokenStore(os.path.join(tmp, "tokens.db"), timeout=0.2)
+
+            # a failed refresh releases its lease
+            def failing_refresh():
+                raise RuntimeError("failed")
+
+            with self.assertRaises(RuntimeError):
+                store.get_or_refresh("1:2:", failing_refresh, 20)
+            self.assertEqual(store.get_or_refresh("1:2:", self.refresh, 20).token, "token1")
+
+            # the lease of a process that died is taken over once expired
+            cnx = sqlite3.connect(store.path)
+            with cnx:
+                cnx.execute(
+                    "INSERT INTO leases (key, owner, expires_at) VALUES ('1:3:', 'dead', ?)", (time.time() + 0.2,)
+                )
+            cnx.close()
+            self.assertEqual(store.get_or_refresh("1:3:", self.refresh, 20).token, "token2")
+            store.close()
+
+    def testRefresher(self):
+        refresher = TokenRefresher(retry_interval=0.01)
+        calls = []
+        condition = threading.Condition()
+
+        class Refreshable:
+            def __init__(self, name, fail):
+                self.name = name
+                self.fail = fail
+
+            def refresh(self):
+                with condition:
+                    calls.append(self.name)
+                    condition.notify_all()
+                if self.fail and calls.count(self.name) == 1:
+                    raise RuntimeError("failed")
+                return time.time() + 0.01
+
+        def wait_for_calls(name, count, start=0):
+            with condition:
+                self.assertTrue(condition.wait_for(lambda: calls[start:].count(name) >= count, 5))
+
+        # a failed refresh is retried
+        failing = Refreshable("failing", fail=True)
+        refreshable = Refreshable("refreshable", fail=False)
+        refresher.schedule(failing.refresh, time.time())
+        refresher.schedule(refreshable.refresh, time.time())
+        wait_for_calls("failing", 2)
+        wait_for_calls("refreshable", 2)
+
+        # refresh methods of garbage collected objects are dropped,
+        # after the refresh that may have been running while the object was deleted
+        start = len(calls)
+        del refreshable
+        gc.collect()
+        wait_for_calls("failing", 5, start)
+        self.assertLessEqual(calls[start:].count("refreshable"), 1)
+
+    def installationAuth(self, store, background_refresh=False):
+        auth = AppInstallationAuth(
+            AppAuth(APP_ID, PRIVATE_KEY),
+            29782936,
+            {"issues": "write"},
+            token_store=store,
+            background_refresh=background_refresh,
+        )
+        github.Github(auth=auth)
+        integration = mock.Mock()
+        integration.get_access_token.side_effect = lambda installation_id, permissions: InstallationAuthorization(
+            mock.Mock(lazy_attributes=False),
+            {},
+            {"token": f"token{integration.get_access_token.call_count}", "expires_at": "2030-01-01T01:00:00Z"},
+            completed=True,
+        )
+        auth._AppInstallationAuth__integration = integration
+        return auth, integration
+
+    def testAppInstallationAuthSharesStoredToken(self):
+        store = MemoryTokenStore()
+        auth, integration = self.installationAuth(store)
+        other, other_integration = self.installationAuth(store)
+        self.assertEqual(auth.token, "token1")
+        self.assertEqual(other.token, "token1")
+        self.assertEqual(integration.get_access_token.call_count, 1)
+        other_integration.get_access_token.assert_not_called()
+        integration.get_access_token.assert_called_with(29782936, permissions={"issues": "write"})
+        self.assertEqual(
+            auth._AppInstallationAuth__installation_authorization.expires_at,
+            datetime(2030, 1, 1, 1, 0, 0, tzinfo=timezone.utc),
+        )
+
+    def testAppInstallationAuthBackgroundRefresh(self):
+        auth, integration = self.installationAuth(MemoryTokenStore(), background_refresh=True)
+        with mock.patch("github.Auth.DEFAULT_REFRESHER") as refresher:
+            self.assertEqual(auth.token, "token1")
+            self.assertEqual(auth.token, "token1")
+        refresher.schedule.assert_called_once_with(
+            auth._refresh_in_background, datetime(2030, 1, 1, 0, 55, tzinfo=timezone.utc).timestamp()
+        )
+
+        # the background refresh renews the token 5 minutes before it expires
+        with mock.patch(
+            "github.TokenStore.time.time", return_value=datetime(2030, 1, 1, 0, 55, tzinfo=timezone.utc).timestamp()
+        ):
+            auth._refresh_in_background()
+        self.assertEqual(auth.token, "token2")
+        self.assertEqual(integration.get_access_token.call_count, 2)